@@ -1,3 +1,13 @@
 from .units import *
 from .objects import *
-from .analysis import *
\ No newline at end of file
+from .analysis import *
+
+from . import objects as _objects
+
+def __getattr__(name:str):
+    if name in _objects._lazyImports:
+        return getattr(_objects, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return list(globals()) + list(_objects._lazyImports)
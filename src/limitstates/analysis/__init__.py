@@ -1 +1,5 @@
-from .data import *
\ No newline at end of file
+from .data import *
+from .beam import *
+from .influence import *
+
+from .spans import *
@@ -0,0 +1,427 @@
+"""
+A linear elastic solver for continuous beams, i.e. members with nodes along a
+line. The solver returns the shear force diagram (SFD) and bending moment
+diagram (BMD) of a member directly as DesignDiagrams.
+
+Each span between member nodes is a single Euler-Bernoulli beam element, and
+loads between nodes are applied as consistent nodal loads. This gives exact
+reactions with only two degrees of freedom per node, after which internal
+forces are found from equilibrium at each station.
+
+Sign conventions:
+    - Forces and distributed loads are positive upwards.
+    - Applied moments are positive counterclockwise.
+    - Sagging bending moments are positive.
+
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from ..objects.geometry import Member
+from .data import DesignDiagram
+
+__all__ = ["PointLoad", "DistLoad", "BeamModel", "solveMemberDiagrams"]
+
+# Gauss points and weights on [0, 1], exact for linear loads on cubic shapes.
+_GAUSSPOINTS  = (np.array([-np.sqrt(3/5), 0, np.sqrt(3/5)]) + 1) / 2
+_GAUSSWEIGHTS = np.array([5/18, 8/18, 5/18])
+
+
+@dataclass
+class PointLoad:
+    """
+    A point load or moment applied to a member.
+
+    Parameters
+    ----------
+    x : float
+        The position of the load, measured from the start of the member.
+    Py : float, optional
+        The vertical force, positive upwards. The default is 0.
+    Mz : float, optional
+        The applied moment, positive counterclockwise. The default is 0.
+    """
+    x:float
+    Py:float = 0
+    Mz:float = 0
+
+
+@dataclass
+class DistLoad:
+    """
+    A linearly varying distributed load applied to a member.
+
+    Parameters
+    ----------
+    x1 : float
+        The start of the load, measured from the start of the member.
+    x2 : float
+        The end of the load, measured from the start of the member.
+    q1 : float
+        The load intensity at x1, positive upwards.
+    q2 : float, optional
+        The load intensity at x2. The default is None, which uses q1.
+    """
+    x1:float
+    x2:float
+    q1:float
+    q2:float = None
+
+    def __post_init__(self):
+        if self.q2 is None:
+            self.q2 = self.q1
+
+
+def _getShapeFunctions(r:np.ndarray, L:np.ndarray) -> np.ndarray:
+    """
+    Returns the Hermite shape functions at the normalized positions r.
+    """
+    r2 = r**2
+    r3 = r**3
+    return np.stack([1 - 3*r2 + 2*r3, L*(r - 2*r2 + r3),
+                     3*r2 - 2*r3, L*(r3 - r2)], axis=-1)
+
+
+def _getShapeDerivatives(r:np.ndarray, L:np.ndarray) -> np.ndarray:
+    """
+    Returns the derivative of the Hermite shape functions with respect to x.
+    """
+    return np.stack([6*(r**2 - r) / L, 1 - 4*r + 3*r**2,
+                     6*(r - r**2) / L, 3*r**2 - 2*r], axis=-1)
+
+
+def _getLinearLoadIntegrals(x:np.ndarray, x1:float, x2:float,
+                            q1:float, q2:float):
+    """
+    Returns the shear and moment at x caused by a linearly varying load.
+    """
+    k = (q2 - q1) / (x2 - x1)
+    X = x - x1
+    u = np.clip(X, 0, x2 - x1)
+    V = q1*u + k*u**2/2
+    M = q1*(X*u - u**2/2) + k*(X*u**2/2 - u**3/3)
+    return V, M
+
+
+class BeamModel:
+    """
+    A stiffness model of a continuous beam, built from a member. The
+    stiffness matrix is only assembled and factored once, after which any
+    number of load cases can be solved.
+
+    The member nodes must lie along the x axis, in ascending order. The
+    vertical translation and rotation of each node are fixed according to
+    the node's support. Axial deformation is not considered.
+
+    Parameters
+    ----------
+    member : Member
+        The member to analyze.
+    EI : float | list[float], optional
+        The flexural stiffness of the member, or of each span. Only the
+        relative stiffness of spans matters for internal forces.
+        The default is 1.
+
+    Returns
+    -------
+    None.
+
+    """
+
+    def __init__(self, member:Member, EI:float|list[float] = 1.):
+        self.member = member
+        self.lUnit  = member.lUnit
+
+        x = np.array([node.p1[0] for node in member.nodes], dtype=float)
+        self.xNodes = x - x[0]
+        self.Lspans = np.diff(self.xNodes)
+        self.L      = self.xNodes[-1]
+
+        if np.any(self.Lspans <= 0):
+            raise Exception('Member nodes must be in ascending order along the x axis.')
+
+        self.Nnode = len(self.xNodes)
+        self.EI = np.broadcast_to(np.asarray(EI, dtype=float), self.Lspans.shape)
+
+        fixity = np.array([node.support.fixity[1:3] for node in member.nodes],
+                          dtype=bool).flatten()
+        self.fixedDofs = np.flatnonzero(fixity)
+        self.freeDofs  = np.flatnonzero(~fixity)
+
+        self.K = self._getStiffness()
+        Kff = self.K[np.ix_(self.freeDofs, self.freeDofs)]
+        try:
+            self._KffInv = np.linalg.inv(Kff)
+        except np.linalg.LinAlgError:
+            raise Exception('The member is unstable, check the node supports.')
+
+    def _getStiffness(self) -> np.ndarray:
+        """
+        Assembles the global stiffness matrix, with dofs [v, rz] for each
+        node. The matrix is banded, with each span coupling two nodes.
+        """
+        L = self.Lspans
+        c = self.EI / L**3
+        kBase = np.array([[12,  6, -12,  6],
+                          [ 6,  4,  -6,  2],
+                          [-12, -6, 12, -6],
+                          [ 6,  2,  -6,  4]], dtype=float)
+        isRotation = np.array([0, 1, 0, 1])
+
+        # Scale the rotational terms by L and L**2.
+        powers = isRotation[:, None] + isRotation[None, :]
+        kEle = c[:, None, None] * kBase * L[:, None, None]**powers
+
+        dofs = 2*np.arange(len(L))[:, None] + np.arange(4)
+        K = np.zeros((2*self.Nnode, 2*self.Nnode))
+        np.add.at(K, (dofs[:, :, None], dofs[:, None, :]), kEle)
+        return K
+
+    def _getElementInds(self, x:np.ndarray) -> np.ndarray:
+        return np.clip(np.searchsorted(self.xNodes, x, 'right') - 1, 0,
+                       len(self.Lspans) - 1)
+
+    def getLoadVector(self, pointLoads:list[PointLoad] = (),
+                      distLoads:list[DistLoad] = ()) -> np.ndarray:
+        """
+        Returns the consistent nodal load vector for a set of loads.
+
+        Parameters
+        ----------
+        pointLoads : list[PointLoad], optional
+            The point loads and moments on the member.
+        distLoads : list[DistLoad], optional
+            The distributed loads on the member.
+
+        Returns
+        -------
+        np.ndarray
+            The load at each degree of freedom.
+
+        """
+        F = np.zeros(2*self.Nnode)
+
+        if len(pointLoads):
+            x  = np.array([load.x for load in pointLoads], dtype=float)
+            Py = np.array([load.Py for load in pointLoads], dtype=float)
+            Mz = np.array([load.Mz for load in pointLoads], dtype=float)
+            if np.any((x < 0) | (self.L < x)):
+                raise Exception('Point loads must be applied within the length of the member.')
+            
+            inds = self._getElementInds(x)
+            L = self.Lspans[inds]
+            r = (x - self.xNodes[inds]) / L
+            Fele = (Py[:, None]*_getShapeFunctions(r, L)
+                    + Mz[:, None]*_getShapeDerivatives(r, L))
+            np.add.at(F, 2*inds[:, None] + np.arange(4), Fele)
+
+        xa = self.xNodes[:-1]
+        xb = self.xNodes[1:]
+        dofs = 2*np.arange(len(self.Lspans))[:, None] + np.arange(4)
+        for load in distLoads:
+            s1 = np.maximum(load.x1, xa)
+            s2 = np.minimum(load.x2, xb)
+            isLoaded = s2 > s1
+            if not np.any(isLoaded):
+                continue
+
+            s1, s2 = s1[isLoaded], s2[isLoaded]
+            L = self.Lspans[isLoaded]
+
+            # Integrate with gauss points over the loaded part of each span.
+            s = s1[:, None] + (s2 - s1)[:, None]*_GAUSSPOINTS
+            q = load.q1 + (load.q2 - load.q1)*(s - load.x1)/(load.x2 - load.x1)
+            r = (s - xa[isLoaded][:, None]) / L[:, None]
+            N = _getShapeFunctions(r, L[:, None])
+            w = (s2 - s1)[:, None]*_GAUSSWEIGHTS
+            Fele = np.einsum('eg,eg,egi->ei', w, q, N)
+            np.add.at(F, dofs[isLoaded], Fele)
+
+        return F
+
+    def solveDisplacements(self, F:np.ndarray) -> np.ndarray:
+        """
+        Solves the nodal displacements for one or more load vectors.
+
+        Parameters
+        ----------
+        F : np.ndarray
+            The load vector, or a 2D array with one column per load case.
+
+        Returns
+        -------
+        np.ndarray
+            The displacement of each degree of freedom.
+
+        """
+        u = np.zeros(np.shape(F))
+        u[self.freeDofs] = self._KffInv @ F[self.freeDofs]
+        return u
+
+    def getReactions(self, F:np.ndarray) -> np.ndarray:
+        """
+        Returns the support reactions at each node for one or more load
+        vectors, as a [Fy, Mz] pair for each node.
+
+        Parameters
+        ----------
+        F : np.ndarray
+            The load vector, or a 2D array with one column per load case.
+
+        Returns
+        -------
+        np.ndarray
+            The reactions, with shape (Nnode, 2) or (Nnode, 2, Ncase).
+
+        """
+        u = self.solveDisplacements(F)
+        R = np.zeros(np.shape(F))
+        R[self.fixedDofs] = self.K[self.fixedDofs] @ u - F[self.fixedDofs]
+        return R.reshape((self.Nnode, 2) + np.shape(F)[1:])
+
+    def getStations(self, Nstations:int = 101,
+                    pointLoads:list[PointLoad] = ()) -> (np.ndarray, np.ndarray):
+        """
+        Returns the x points used for diagrams. Nodes and point loads are
+        included twice, so that jumps in the diagrams are captured.
+
+        Returns
+        -------
+        x : np.ndarray
+            The station locations.
+        isRight : np.ndarray
+            True for stations that are on the right side of a jump.
+
+        """
+        xJumps = np.concatenate((self.xNodes, [load.x for load in pointLoads]))
+        xBase = np.linspace(0, self.L, Nstations)
+        x = np.unique(np.concatenate((xBase, xJumps)))
+        isJump = np.isin(x, xJumps)
+
+        xOut = np.repeat(x, 1 + isJump)
+        isRight = np.ones(len(xOut), dtype=bool)
+        isRight[np.cumsum(1 + isJump)[isJump] - 2] = False
+        return xOut, isRight
+
+    def getInternalForces(self, x:np.ndarray, isRight:np.ndarray,
+                          reactions:np.ndarray,
+                          pointLoads:list[PointLoad] = (),
+                          distLoads:list[DistLoad] = ()):
+        """
+        Finds the shear force and bending moment at each station using
+        equilibrium of the beam to the left of the station.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The station locations.
+        isRight : np.ndarray
+            If true, concentrated loads at the station are included.
+        reactions : np.ndarray
+            The (Nnode, 2) array of support reactions.
+        pointLoads : list[PointLoad], optional
+            The point loads and moments on the member.
+        distLoads : list[DistLoad], optional
+            The distributed loads on the member.
+
+        Returns
+        -------
+        V : np.ndarray
+            The shear force at each station.
+        M : np.ndarray
+            The bending moment at each station.
+
+        """
+        xF = np.concatenate((self.xNodes, [load.x for load in pointLoads]))
+        Py = np.concatenate((reactions[:, 0], [load.Py for load in pointLoads]))
+        Mz = np.concatenate((reactions[:, 1], [load.Mz for load in pointLoads]))
+
+        isLeft = ((xF[None, :] < x[:, None])
+                  | ((xF[None, :] == x[:, None]) & isRight[:, None]))
+        dx = x[:, None] - xF[None, :]
+
+        V = (isLeft * Py).sum(axis=1)
+        M = (isLeft * (Py*dx - Mz)).sum(axis=1)
+
+        for load in distLoads:
+            if load.x2 <= load.x1:
+                continue
+            Vq, Mq = _getLinearLoadIntegrals(x, load.x1, load.x2, load.q1,
+                                             load.q2)
+            V += Vq
+            M += Mq
+
+        return V, M
+
+    def solve(self, pointLoads:list[PointLoad] = (),
+              distLoads:list[DistLoad] = (),
+              Nstations:int = 101) -> (DesignDiagram, DesignDiagram):
+        """
+        Solves the member for a set of loads, and returns the SFD and BMD.
+
+        Parameters
+        ----------
+        pointLoads : list[PointLoad], optional
+            The point loads and moments on the member.
+        distLoads : list[DistLoad], optional
+            The distributed loads on the member.
+        Nstations : int, optional
+            The number of evenly spaced stations used for the diagrams, in
+            addition to the nodes and point loads. The default is 101.
+
+        Returns
+        -------
+        sfd : DesignDiagram
+            The shear force diagram.
+        bmd : DesignDiagram
+            The bending moment diagram.
+
+        """
+        F = self.getLoadVector(pointLoads, distLoads)
+        reactions = self.getReactions(F)
+        x, isRight = self.getStations(Nstations, pointLoads)
+        V, M = self.getInternalForces(x, isRight, reactions, pointLoads, distLoads)
+
+        sfd = DesignDiagram(np.column_stack((x, V)), self.lUnit)
+        bmd = DesignDiagram(np.column_stack((x, M)), self.lUnit)
+        return sfd, bmd
+
+
+def solveMemberDiagrams(member:Member,
+                        pointLoads:list[PointLoad] = (),
+                        distLoads:list[DistLoad] = (),
+                        EI:float|list[float] = 1.,
+                        Nstations:int = 101) -> (DesignDiagram, DesignDiagram):
+    """
+    Solves a continuous beam and returns its SFD and BMD. To solve many
+    load cases on the same member, use a BeamModel directly.
+
+    Loads are in the length unit of the member, and x is measured from the
+    member's first node.
+
+    Parameters
+    ----------
+    member : Member
+        The member to analyze.
+    pointLoads : list[PointLoad], optional
+        The point loads and moments on the member.
+    distLoads : list[DistLoad], optional
+        The distributed loads on the member.
+    EI : float | list[float], optional
+        The flexural stiffness of the member, or of each span.
+        The default is 1.
+    Nstations : int, optional
+        The number of evenly spaced stations used for the diagrams, in
+        addition to the nodes and point loads. The default is 101.
+
+    Returns
+    -------
+    sfd : DesignDiagram
+        The shear force diagram.
+    bmd : DesignDiagram
+        The bending moment diagram.
+
+    """
+    return BeamModel(member, EI).solve(pointLoads, distLoads, Nstations)
@@ -5,10 +5,95 @@ diagram (SFD), bending moment diagram (BMD), or
 """
 
 
-import hysteresis as hys
 import numpy as np
-from limitstates import ConverterLength
-# ConverterLength
+from limitstates import lengthConverter
+
+
+def getZeroCrossings(x:np.ndarray, y:np.ndarray, tol:float = 1e-6) -> np.ndarray:
+    """
+    Finds the x coordinates where a piecewise linear curve has a value of zero.
+    
+    Where the curve changes sign between two points, the location of zero is 
+    found using linear interpolation. Points that have a value of zero are 
+    also included, for example the ends of a simply supported BMD. For a 
+    continous region with a y value of zero, only the start and end of 
+    the region are returned.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        The x coordinates of the curve, in ascending order.
+    y : np.ndarray
+        The y coordinates of the curve.
+    tol : float, optional
+        Values of y with a magnitude less than the tolerance are considered 
+        to be zero. The default is 1e-6.
+
+    Returns
+    -------
+    np.ndarray
+        The sorted x coordinates where y is zero.
+
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    y = np.where(np.abs(y) < tol, 0., y)
+    signs = np.sign(y)
+    
+    # Interpolate sign changes that occur between two points.
+    inds = np.flatnonzero(signs[:-1]*signs[1:] < 0)
+    x1, x2 = x[inds], x[inds + 1]
+    y1, y2 = y[inds], y[inds + 1]
+    xCross = x1 - y1*(x2 - x1) / (y2 - y1)
+    
+    # Include points that are zero, except those inside of a region of zeros.
+    isZero = signs == 0
+    isBoundary = np.ones(len(y), dtype=bool)
+    isBoundary[1:-1] = ~(isZero[:-2] & isZero[2:])
+    xZero = x[isZero & isBoundary]
+    
+    return np.unique(np.concatenate((xCross, xZero)))
+
+
+def _getSparseMaxTable(values:np.ndarray) -> np.ndarray:
+    """
+    Builds a sparse table for range maximum queries. Row k of the table 
+    stores the maximum of each window of 2**k values, starting at each 
+    index. Rows are padded with zeros, and are intended to be used with 
+    non-negative values.
+    
+    Windows are taken along the first axis, so a 2D array of values with one
+    column per load case builds a table for each case at once.
+    """
+    N = len(values)
+    Nrow = max(N.bit_length(), 1)
+    table = np.zeros((Nrow,) + np.shape(values))
+    table[0] = values
+    for k in range(1, Nrow):
+        half = 2**(k-1)
+        Nwindow = N - 2*half + 1
+        table[k, :Nwindow] = np.maximum(table[k-1, :Nwindow], 
+                                        table[k-1, half:half + Nwindow])
+    return table
+
+
+def _queryMaxTable(table:np.ndarray, x:np.ndarray, x1:float|list, 
+                   x2:float|list) -> np.ndarray:
+    """
+    Finds the maximum value of a sparse table between x1 and x2, including 
+    the first point greater than or equal to x1, and stopping before the 
+    first point greater than or equal to x2.
+    """
+    ind1 = np.searchsorted(x, x1, 'left')
+    ind2 = np.searchsorted(x, x2, 'left')
+    Npoint = ind2 - ind1
+    
+    if np.any(Npoint <= 0):
+        raise ValueError('No points in the diagram fall within the range'\
+                         f' {x1} -> {x2}.')
+    
+    k = np.floor(np.log2(Npoint)).astype(int)
+    return np.maximum(table[k, ind1], table[k, ind2 - 2**k])
 
 
 class DesignDiagram:
@@ -30,23 +115,31 @@ class DesignDiagram:
     
     def __init__(self, xyIn, lUnit= 'm'):
         
-        self.xy = np.array(xyIn)
+        self.xy = np.array(xyIn, dtype=float)
        
-        # self.curve.
         self.segments = None
         
         self._initUnits(lUnit)
-        self._setCurve(xyIn)
+        self._setCurve(self.xy)
     
-    def _setCurve(self, xyIn):
-        self.curve = hys.SimpleCurve(xyIn)
-        self.curve.setIntersectionInds()
-        self.xInflections = self.curve.getXIntersections()[:,0]
-        
+    def _setCurve(self, xy):
+        self.xInflections = getZeroCrossings(xy[:,0], xy[:,1])
+        self._maxTable = None
+    
+    def _getMaxTable(self):
+        """
+        Returns the sparse table of absolute y values used for range queries.
+        The table is only built the first time it's needed.
+        """
+        if self._maxTable is None:
+            self._maxTable = _getSparseMaxTable(np.abs(self.xy[:,1]))
+        return self._maxTable
         
     def getIntersectionCoords(self):
         """
-        Returns the x points where y intersections occur in the bmd
+        Returns the x points where y intersections occur in the bmd. 
+        Intersections between points in the diagram are found using linear
+        interpolation.
 
         Returns
         -------
@@ -78,28 +171,34 @@ class DesignDiagram:
         return np.interp(x, self.xy[:,0], self.xy[:,1])
     
         
-    def getMaxForceInRange(self, x1, x2):
+    def getMaxForceInRange(self, x1:float|list, x2:float|list):
         """
-        Determines the absolute maximum y value within a range x1 -> x2
+        Determines the absolute maximum y value within a range x1 -> x2. The
+        range starts at the first point greater than or equal to x1, and stops
+        before the first point greater than or equal to x2.
+        
+        A sparse table of maximum values is built on the first call, after 
+        which each query takes constant time. Arrays of x1 and x2 can be used
+        to check several ranges at once.
 
         Parameters
         ----------
-        x1 : float
+        x1 : float|list
             The start of the range.
-        x2 : float
+        x2 : float|list
             The end of the range. Must be greater than x1.
 
         Returns
         -------
-        float
+        float|np.ndarray
             The maximum value within the range.
 
         """
-        x = self.xy[:,0]
-        y = self.xy[:,1]
-        ind1 = np.where(x1 <= x)[0][0]
-        ind2 = np.where(x2 <= x)[0][0]
-        return max(abs(y[ind1:ind2]))
+        yMax = _queryMaxTable(self._getMaxTable(), self.xy[:,0], x1, x2)
+        
+        if np.ndim(yMax) == 0:
+            return float(yMax)
+        return yMax
     
     
     def _initUnits(self, lUnit:str='m'):
@@ -107,7 +206,7 @@ class DesignDiagram:
         Inititiates the unit of the section.
         """
         self.lUnit      = lUnit
-        self.lConverter = ConverterLength()
+        self.lConverter = lengthConverter
     
     def lConvert(self, outputUnit:str):
         """
@@ -143,6 +242,293 @@ class DesignDiagram:
 
         """
         lfactor = self.lConvert(outputUnit)
-        self.xyIn[:,0] = self.xyIn[:,0]*lfactor
-        self._setCurve(self.xyIn)
-        
\ No newline at end of file
+        self.xy[:,0] = self.xy[:,0]*lfactor
+        self.lUnit = outputUnit
+        self._setCurve(self.xy)
+                
+
+def _interpWeights(x:np.ndarray, xGrid:np.ndarray):
+    """
+    Finds the index of the point left of each x value, and the weight applied
+    to the point on the right for linear interpolation. Points outside the 
+    grid are clamped to the end values, as in np.interp.
+    """
+    N = len(xGrid)
+    if N == 1:
+        ind = np.zeros(np.shape(x), dtype=int)
+        return ind, np.zeros(np.shape(x))
+    
+    ind = np.clip(np.searchsorted(xGrid, x, 'right') - 1, 0, N - 2)
+    dx = xGrid[ind + 1] - xGrid[ind]
+    t = np.divide(x - xGrid[ind], dx, out=np.ones(np.shape(dx)), 
+                  where = dx != 0)
+    return ind, np.clip(t, 0, 1)
+
+
+class DesignDiagramEnvelope:
+    """
+    Represents a set of bending moment or shear force diagrams for several
+    load cases, which all share the same x points. The y values of each case 
+    are stored in a 2D array, with one row per load case.
+    
+    Envelopes, governing cases, and range queries are calculated for all 
+    load cases at once. Individual cases can be retrieved as a DesignDiagram
+    by indexing the envelope.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        The x points shared by each load case, in ascending order.
+    y : np.ndarray
+        A 2D array of y values, with shape (Ncase, Npoint).
+    lUnit : str, optional
+        The input units used for length. The default is 'm'.
+    labels : list[str], optional
+        A name for each load case. The default is None, which numbers each
+        case.
+
+    Returns
+    -------
+    None.
+
+    """
+    
+    def __init__(self, x, y, lUnit = 'm', labels:list[str] = None):
+        
+        self.x = np.array(x, dtype=float)
+        self.y = np.atleast_2d(np.array(y, dtype=float))
+        
+        if self.y.shape[1] != len(self.x):
+            raise ValueError(f'Expected {len(self.x)} y values per load case,'\
+                             f' recieved {self.y.shape[1]}.')
+        
+        if labels is None:
+            labels = [str(ii) for ii in range(len(self.y))]
+        self.labels = list(labels)
+        
+        self._initUnits(lUnit)
+        self._maxTable = None
+        
+    def __len__(self):
+        return len(self.y)
+    
+    def __getitem__(self, ind:int) -> DesignDiagram:
+        xy = np.column_stack((self.x, self.y[ind]))
+        return DesignDiagram(xy, self.lUnit)
+    
+    def __iter__(self):
+        for ii in range(len(self)):
+            yield self[ii]
+    
+    def _getMaxTable(self):
+        """
+        Returns the sparse table of absolute y values used for range queries.
+        The table is only built the first time it's needed, and has one 
+        column per load case.
+        """
+        if self._maxTable is None:
+            self._maxTable = _getSparseMaxTable(np.abs(self.y.T))
+        return self._maxTable
+    
+    def getMaxEnvelope(self) -> DesignDiagram:
+        """
+        Returns the maximum y value over all load cases at each x point.
+
+        Returns
+        -------
+        DesignDiagram
+            The maximum envelope.
+
+        """
+        return DesignDiagram(np.column_stack((self.x, self.y.max(axis=0))), 
+                             self.lUnit)
+    
+    def getMinEnvelope(self) -> DesignDiagram:
+        """
+        Returns the minimum y value over all load cases at each x point.
+
+        Returns
+        -------
+        DesignDiagram
+            The minimum envelope.
+
+        """
+        return DesignDiagram(np.column_stack((self.x, self.y.min(axis=0))), 
+                             self.lUnit)
+    
+    def getGoverningCase(self, useAbs:bool = True) -> np.ndarray:
+        """
+        Returns the index of the load case that governs at each x point.
+
+        Parameters
+        ----------
+        useAbs : bool, optional
+            If true, the case with the largest absolute y value governs. If 
+            false the case with the largest positive y value governs.
+            The default is True.
+
+        Returns
+        -------
+        np.ndarray
+            The index of the governing load case at each x point.
+
+        """
+        if useAbs:
+            return np.argmax(np.abs(self.y), axis=0)
+        return np.argmax(self.y, axis=0)
+    
+    def getForceAtx(self, x:float|list) -> np.ndarray:
+        """
+        Calculates the y values of every load case at a set of input x points.
+        Linear interpolation is used between points in the diagram.
+
+        Parameters
+        ----------
+        x : float|list
+            The points to calcualte y values at.
+
+        Returns
+        -------
+        np.ndarray
+            The y values with shape (Ncase, *np.shape(x)).
+
+        """
+        ind, t = _interpWeights(np.asarray(x, dtype=float), self.x)
+        if len(self.x) == 1:
+            return self.y[:, ind]
+        return self.y[:, ind]*(1 - t) + self.y[:, ind + 1]*t
+    
+    def getMaxForceInRange(self, x1:float|list, x2:float|list) -> np.ndarray:
+        """
+        Determines the absolute maximum y value of each load case within a 
+        range x1 -> x2. The range starts at the first point greater than or 
+        equal to x1, and stops before the first point greater than or equal 
+        to x2.
+
+        Parameters
+        ----------
+        x1 : float|list
+            The start of the range.
+        x2 : float|list
+            The end of the range. Must be greater than x1.
+
+        Returns
+        -------
+        np.ndarray
+            The maximum values, with shape (Ncase, *np.shape(x1)).
+
+        """
+        yMax = _queryMaxTable(self._getMaxTable(), self.x, x1, x2)
+        return np.moveaxis(yMax, -1, 0)
+    
+    def getSpanExtrema(self, Lspans:list[float]) -> (np.ndarray, np.ndarray):
+        """
+        Determines the maximum and minimum y value of each load case in each 
+        span. Points on a support are included in both adjacent spans.
+
+        Parameters
+        ----------
+        Lspans : list[float]
+            The length of each span, starting from the first x point of the 
+            diagram.
+
+        Returns
+        -------
+        yMax : np.ndarray
+            The maximum y value, with shape (Ncase, Nspan).
+        yMin : np.ndarray
+            The minimum y value, with shape (Ncase, Nspan).
+
+        """
+        x2 = self.x[0] + np.cumsum(Lspans)
+        x1 = np.concatenate(([self.x[0]], x2[:-1]))
+        ind1 = np.searchsorted(self.x, x1, 'left')
+        ind2 = np.searchsorted(self.x, x2, 'right')
+        
+        Nspan = len(x2)
+        yMax = np.zeros((len(self), Nspan))
+        yMin = np.zeros((len(self), Nspan))
+        for ii in range(Nspan):
+            ySpan = self.y[:, ind1[ii]:ind2[ii]]
+            if ySpan.shape[1] == 0:
+                raise ValueError(f'No points in the diagram fall within span {ii}.')
+            yMax[:, ii] = ySpan.max(axis=1)
+            yMin[:, ii] = ySpan.min(axis=1)
+        return yMax, yMin
+    
+    def _initUnits(self, lUnit:str='m'):
+        """
+        Inititiates the unit of the envelope.
+        """
+        self.lUnit      = lUnit
+        self.lConverter = lengthConverter
+    
+    def lConvert(self, outputUnit:str):
+        """
+        Get the conversion factor from the current unit to the output unit
+        for length units.    
+
+        Parameters
+        ----------
+        outputUnit : str
+            The unit to convert the current units to.
+
+        Returns
+        -------
+        float
+            The output unit.
+
+        """
+        return self.lConverter.getConversionFactor(self.lUnit, outputUnit)
+    
+    def convertDiagramTo(self, outputUnit:str):
+        """
+        Converst the envelope to use the input unit for it's x values.
+
+        Parameters
+        ----------
+        outputUnit : str
+            The unit to change the x value of the envelope to.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.x = self.x*self.lConvert(outputUnit)
+        self.lUnit = outputUnit
+        self._maxTable = None
+
+
+def getDesignDiagramEnvelope(diagrams:list[DesignDiagram], 
+                             labels:list[str] = None) -> DesignDiagramEnvelope:
+    """
+    Combines several design diagrams into a single envelope. If every diagram
+    has the same x points they are used directly, otherwise each diagram is 
+    interpolated onto the union of all x points.
+    
+    All diagrams should use the same length unit.
+
+    Parameters
+    ----------
+    diagrams : list[DesignDiagram]
+        The diagram for each load case.
+    labels : list[str], optional
+        A name for each load case. The default is None.
+
+    Returns
+    -------
+    DesignDiagramEnvelope
+        The envelope of all diagrams.
+
+    """
+    xs = [diagram.xy[:,0] for diagram in diagrams]
+    
+    if all(np.array_equal(xs[0], x) for x in xs[1:]):
+        x = xs[0]
+        y = np.array([diagram.xy[:,1] for diagram in diagrams])
+    else:
+        x = np.unique(np.concatenate(xs))
+        y = np.array([diagram.getForceAtx(x) for diagram in diagrams])
+    
+    return DesignDiagramEnvelope(x, y, diagrams[0].lUnit, labels)
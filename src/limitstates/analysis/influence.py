@@ -0,0 +1,292 @@
+"""
+Influence based pattern loading for continuous beams.
+
+The response of a member to a unit distributed load on each span is solved
+once. Because the beam is linear, the diagrams for any pattern of span loads
+are a weighted sum of these unit responses. The envelope of all skip loading
+patterns is found directly by only adding the live load on spans where it
+increases the response, so the patterns never need to be enumerated.
+
+Loads follow the conventions of the beam solver, i.e. distributed loads are
+positive upwards, and sagging bending moments are positive.
+
+"""
+
+from itertools import product
+
+import numpy as np
+
+from ..objects.geometry import Member
+from .beam import BeamModel, DistLoad, PointLoad
+from .data import DesignDiagramEnvelope
+
+__all__ = ["InfluenceModel", "getSkipPatterns", "getPatternEnvelope"]
+
+
+def getSkipPatterns(Nspan:int, includeUnloaded:bool = False) -> np.ndarray:
+    """
+    Returns every combination of loaded and unloaded spans for a member.
+    There are 2^Nspan patterns, so this is only practical for members with
+    a few spans.
+
+    Parameters
+    ----------
+    Nspan : int
+        The number of spans in the member.
+    includeUnloaded : bool, optional
+        If true, the pattern with no spans loaded is included.
+        The default is False.
+
+    Returns
+    -------
+    np.ndarray
+        A boolean array with shape (Npattern, Nspan), that is true for
+        loaded spans. The first pattern has all spans loaded.
+
+    """
+    patterns = np.array(list(product([True, False], repeat = Nspan)), dtype=bool)
+    if not includeUnloaded:
+        patterns = patterns[:-1]
+    return patterns
+
+
+def _getPatternLabel(pattern:np.ndarray) -> str:
+    return ''.join('1' if isLoaded else '0' for isLoaded in pattern)
+
+
+class InfluenceModel:
+    """
+    Stores the response of a member to a unit distributed load on each of
+    its spans. Diagrams for any combination of span loads can then be found
+    through superposition, without re-solving the beam.
+
+    Parameters
+    ----------
+    member : Member
+        The member to analyze.
+    EI : float | list[float], optional
+        The flexural stiffness of the member, or of each span.
+        The default is 1.
+    Nstations : int, optional
+        The number of evenly spaced stations used for the diagrams, in
+        addition to the nodes. The default is 101.
+
+    Returns
+    -------
+    None.
+
+    """
+
+    def __init__(self, member:Member, EI:float|list[float] = 1.,
+                 Nstations:int = 101):
+        self.model = BeamModel(member, EI)
+        self.lUnit = self.model.lUnit
+        self.Nspan = len(self.model.Lspans)
+        self.x, self.isRight = self.model.getStations(Nstations)
+        self.Vunit, self.Munit = self._getSpanResponses()
+
+    def _getSpanResponses(self):
+        """
+        Solves all unit span loads at once, and returns the shear and moment
+        at each station with shape (Nstation, Nspan).
+        """
+        xNodes = self.model.xNodes
+        spanLoads = [DistLoad(x1, x2, 1.) for x1, x2 in zip(xNodes[:-1], xNodes[1:])]
+        F = np.column_stack([self.model.getLoadVector(distLoads = [load])
+                             for load in spanLoads])
+        reactions = self.model.getReactions(F)
+
+        Vunit = np.empty((len(self.x), self.Nspan))
+        Munit = np.empty((len(self.x), self.Nspan))
+        for ii, load in enumerate(spanLoads):
+            Vunit[:, ii], Munit[:, ii] = self.model.getInternalForces(
+                self.x, self.isRight, reactions[..., ii], distLoads = [load])
+        return Vunit, Munit
+
+    def getInfluenceLines(self, xLoads:np.ndarray) -> (np.ndarray, np.ndarray):
+        """
+        Returns the shear and moment at each station caused by a unit upward
+        point load at each of the locations xLoads. Column j of the output is
+        the diagram for a load at xLoads[j], while row i is the influence
+        line for station i.
+
+        Parameters
+        ----------
+        xLoads : np.ndarray
+            The locations of the unit loads.
+
+        Returns
+        -------
+        V : np.ndarray
+            The shear at each station, with shape (Nstation, Nload).
+        M : np.ndarray
+            The moment at each station, with shape (Nstation, Nload).
+
+        """
+        xLoads = np.atleast_1d(np.asarray(xLoads, dtype=float))
+        loads = [PointLoad(x, 1.) for x in xLoads]
+        F = np.column_stack([self.model.getLoadVector([load]) for load in loads])
+        reactions = self.model.getReactions(F)
+
+        V = np.empty((len(self.x), len(loads)))
+        M = np.empty((len(self.x), len(loads)))
+        for ii, load in enumerate(loads):
+            V[:, ii], M[:, ii] = self.model.getInternalForces(
+                self.x, self.isRight, reactions[..., ii], [load])
+        return V, M
+
+    def getSpanLoadDiagrams(self, spanLoads:np.ndarray) -> (DesignDiagramEnvelope,
+                                                             DesignDiagramEnvelope):
+        """
+        Returns the SFD and BMD for several combinations of uniform span
+        loads.
+
+        Parameters
+        ----------
+        spanLoads : np.ndarray
+            The uniform load on each span, with shape (Ncase, Nspan).
+
+        Returns
+        -------
+        sfd : DesignDiagramEnvelope
+            The shear force diagram of each case.
+        bmd : DesignDiagramEnvelope
+            The bending moment diagram of each case.
+
+        """
+        spanLoads = np.atleast_2d(spanLoads)
+        sfd = DesignDiagramEnvelope(self.x, spanLoads @ self.Vunit.T, self.lUnit)
+        bmd = DesignDiagramEnvelope(self.x, spanLoads @ self.Munit.T, self.lUnit)
+        return sfd, bmd
+
+    def _getSpanLoads(self, w:float|np.ndarray) -> np.ndarray:
+        """
+        Returns a load, or the load on each span, as an array with shape
+        (Nspan,).
+        """
+        return np.broadcast_to(np.asarray(w, dtype=float), (self.Nspan,))
+
+    def getPatternEnvelope(self, wLive:float|np.ndarray,
+                           wDead:float|np.ndarray = 0.) -> (DesignDiagramEnvelope,
+                                                            DesignDiagramEnvelope):
+        """
+        Returns the maximum and minimum SFD and BMD of all skip loading
+        patterns. The dead load is applied to all spans, while the live load
+        on each span is only included where it increases the maximum, or
+        decreases the minimum, i.e.
+
+            Mmax = Mdead + sum(max(0, wLive[j]*Munit[:, j]))
+
+        The envelope is found directly from the unit span responses, so the
+        cost is linear in the number of spans. The two cases are labeled
+        'max' and 'min'. Use getPatternDiagrams to find the diagrams of
+        each pattern.
+
+        Parameters
+        ----------
+        wLive : float | np.ndarray
+            The live load, or the live load on each span.
+        wDead : float | np.ndarray, optional
+            The dead load, or the dead load on each span. The default is 0.
+
+        Returns
+        -------
+        sfd : DesignDiagramEnvelope
+            The maximum and minimum shear force at each station.
+        bmd : DesignDiagramEnvelope
+            The maximum and minimum bending moment at each station.
+
+        """
+        wLive = self._getSpanLoads(wLive)
+        wDead = self._getSpanLoads(wDead)
+
+        labels = ['max', 'min']
+        diagrams = []
+        for unit in (self.Vunit, self.Munit):
+            dead = unit @ wDead
+            live = unit * wLive
+            y = [dead + np.maximum(live, 0).sum(1),
+                 dead + np.minimum(live, 0).sum(1)]
+            diagrams.append(DesignDiagramEnvelope(self.x, y, self.lUnit, labels))
+        return tuple(diagrams)
+
+    def getPatternDiagrams(self, wLive:float|np.ndarray,
+                           wDead:float|np.ndarray = 0.,
+                           patterns:np.ndarray = None) -> (DesignDiagramEnvelope,
+                                                           DesignDiagramEnvelope):
+        """
+        Returns the SFD and BMD of each skip loading pattern. The dead load
+        is applied to all spans, while the live load is only applied to the
+        loaded spans of each pattern. The label of each case shows which
+        spans are loaded, i.e. '101' has live load on the first and third
+        span.
+
+        The number of patterns from getSkipPatterns grows exponentially with
+        the number of spans. If only the envelope of all patterns is needed,
+        use getPatternEnvelope.
+
+        Parameters
+        ----------
+        wLive : float | np.ndarray
+            The live load, or the live load on each span.
+        wDead : float | np.ndarray, optional
+            The dead load, or the dead load on each span. The default is 0.
+        patterns : np.ndarray, optional
+            A boolean array with shape (Npattern, Nspan) that is true for
+            loaded spans. The default is None, which uses every pattern
+            from getSkipPatterns.
+
+        Returns
+        -------
+        sfd : DesignDiagramEnvelope
+            The shear force diagram of each pattern.
+        bmd : DesignDiagramEnvelope
+            The bending moment diagram of each pattern.
+
+        """
+        if patterns is None:
+            patterns = getSkipPatterns(self.Nspan)
+        patterns = np.atleast_2d(np.asarray(patterns, dtype=bool))
+        spanLoads = patterns * self._getSpanLoads(wLive) + self._getSpanLoads(wDead)
+
+        sfd, bmd = self.getSpanLoadDiagrams(spanLoads)
+        labels = [_getPatternLabel(pattern) for pattern in patterns]
+        sfd.labels = labels
+        bmd.labels = labels
+        return sfd, bmd
+
+
+def getPatternEnvelope(member:Member, wLive:float|np.ndarray,
+                       wDead:float|np.ndarray = 0., EI:float|list[float] = 1.,
+                       Nstations:int = 101) -> (DesignDiagramEnvelope,
+                                                DesignDiagramEnvelope):
+    """
+    Returns the maximum and minimum SFD and BMD of a member for all skip
+    loading patterns of the live load. The envelopes can be passed directly
+    to multi-span design checks. To reuse the unit span responses, or to
+    find the diagrams of each pattern, use an InfluenceModel directly.
+
+    Parameters
+    ----------
+    member : Member
+        The member to analyze.
+    wLive : float | np.ndarray
+        The live load, or the live load on each span.
+    wDead : float | np.ndarray, optional
+        The dead load, or the dead load on each span. The default is 0.
+    EI : float | list[float], optional
+        The flexural stiffness of the member, or of each span.
+        The default is 1.
+    Nstations : int, optional
+        The number of evenly spaced stations used for the diagrams, in
+        addition to the nodes. The default is 101.
+
+    Returns
+    -------
+    sfd : DesignDiagramEnvelope
+        The maximum and minimum shear force at each station.
+    bmd : DesignDiagramEnvelope
+        The maximum and minimum bending moment at each station.
+
+    """
+    return InfluenceModel(member, EI, Nstations).getPatternEnvelope(wLive, wDead)
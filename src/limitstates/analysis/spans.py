@@ -0,0 +1,241 @@
+"""
+Deflections of continuous beams with equal spans, used to find the maximum
+span of many sections at once.
+
+All spans are equal, pinned at each support, and carry the same uniform
+load. The deflection includes both bending and shear deformation, i.e.
+Timoshenko beam theory. The support moments are found with the three moment
+equation including shear deformation,
+
+    (1 - phi)M[i-1] + (4 + 2phi)M[i] + (1 - phi)M[i+1] = -wL^2 / 2
+
+where phi = 6EI / (GA L^2). With these support moments, shear adds
+wx(L - x) / 2GA to the deflection of each span. The deflection at each
+station is then:
+
+    delta = f(x/L, phi) wL^4 / EI + g(x/L) wL^2 / GA
+
+Units are consistent, i.e. w in N/m, L in m, EI in Nm2 and GA in N gives a
+deflection in m.
+
+"""
+
+import numpy as np
+
+__all__ = ["getSupportMoments", "getDeflectionShapes", "getMaxDeflection",
+           "getMaxDeflectionSpan"]
+
+
+def _getPhi(EI, GA, L) -> np.ndarray:
+    """
+    Returns the ratio of bending to shear flexibility used in the three
+    moment equation.
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return 6*EI / (GA*L**2)
+
+
+def getSupportMoments(Nspan:int, phi:float|np.ndarray = 0.) -> np.ndarray:
+    """
+    Returns the moment at each support of a beam with Nspan equal spans and
+    a uniform load on all spans, found with the three moment equation
+    including shear deformation. Moments are normalized by wL^2, and hogging
+    moments are negative.
+
+    Parameters
+    ----------
+    Nspan : int
+        The number of spans.
+    phi : float|np.ndarray, optional
+        The ratio 6EI / (GA L^2) of each beam. The default is 0, which
+        ignores shear deformation.
+
+    Returns
+    -------
+    np.ndarray
+        The normalized moment at each support, with shape
+        phi.shape + (Nspan + 1,).
+
+    """
+    if Nspan < 1:
+        raise Exception('Nspan must be at least 1.')
+    phi = np.asarray(phi, dtype=float)
+    m = np.zeros(phi.shape + (Nspan + 1,))
+    if Nspan == 1:
+        return m
+
+    N = Nspan - 1
+    phi = phi[..., None, None]
+    A = (4 + 2*phi)*np.eye(N) + (1 - phi)*(np.eye(N, k = 1) + np.eye(N, k = -1))
+    b = np.broadcast_to(-np.ones(N) / 2, A.shape[:-1])
+    m[..., 1:-1] = np.linalg.solve(A, b[..., None])[..., 0]
+    return m
+
+
+def getDeflectionShapes(Nspan:int, Nstations:int = 101,
+                        phi:float|np.ndarray = 0.) -> (np.ndarray, np.ndarray):
+    """
+    Returns the normalized bending and shear deflection at stations in each
+    span, i.e. f and g where delta = f wL^4 / EI + g wL^2 / GA. Deflections
+    are positive in the direction of the load. The stations at supports are
+    not included.
+
+    Parameters
+    ----------
+    Nspan : int
+        The number of spans.
+    Nstations : int, optional
+        The number of evenly spaced stations in each span, including the
+        supports. The default is 101.
+    phi : float|np.ndarray, optional
+        The ratio 6EI / (GA L^2) of each beam, which changes the support
+        moments. The default is 0, which ignores shear deformation.
+
+    Returns
+    -------
+    f : np.ndarray
+        The bending deflection at each station, with shape
+        phi.shape + (Nspan*(Nstations - 2),).
+    g : np.ndarray
+        The shear deflection at each station, with the same shape as f.
+
+    """
+    xi = np.linspace(0, 1, Nstations)[1:-1]
+    m = getSupportMoments(Nspan, phi)
+    ma = m[..., :-1, None]
+    mb = m[..., 1:, None]
+
+    # A simply supported span with end moments, solved with superposition.
+    f = (xi*(1 - 2*xi**2 + xi**3) / 24
+         + ma*xi*(1 - xi)*(2 - xi) / 6
+         + mb*xi*(1 - xi)*(1 + xi) / 6)
+    f = f.reshape(f.shape[:-2] + (-1,))
+    g = np.broadcast_to(np.tile(xi*(1 - xi) / 2, Nspan), f.shape)
+    return f, g
+
+
+def getMaxDeflection(EI:float|np.ndarray, GA:float|np.ndarray,
+                     w:float|np.ndarray, L:float|np.ndarray,
+                     Nspan:int = 1, Nstations:int = 101) -> np.ndarray:
+    """
+    Returns the maximum deflection of a beam with Nspan equal spans and a
+    uniform load on all spans. All inputs are broadcast against each other.
+
+    Parameters
+    ----------
+    EI : float|np.ndarray
+        The bending stiffness.
+    GA : float|np.ndarray
+        The shear stiffness. Use np.inf to ignore shear deformation.
+    w : float|np.ndarray
+        The magnitude of the uniform load.
+    L : float|np.ndarray
+        The length of each span.
+    Nspan : int, optional
+        The number of spans. The default is 1.
+    Nstations : int, optional
+        The number of stations checked in each span. The default is 101.
+
+    Returns
+    -------
+    np.ndarray
+        The maximum deflection.
+
+    """
+    EI, GA, w, L = np.broadcast_arrays(*[np.asarray(x, dtype=float)
+                                         for x in (EI, GA, w, L)])
+    phi = 0.
+    if Nspan > 1:
+        phi = _getPhi(EI, GA, L)
+    f, g = getDeflectionShapes(Nspan, Nstations, phi)
+    EI, GA, w, L = [x[..., None] for x in (EI, GA, w, L)]
+    delta = w*L**4*f / EI + w*L**2*g / GA
+    return delta.max(-1)
+
+
+def _getCubicSpan(f:np.ndarray, g:np.ndarray, EI:np.ndarray, GA:np.ndarray,
+                  w:np.ndarray, limit:np.ndarray) -> np.ndarray:
+    """
+    Returns the maximum span for deflection shapes that don't depend on the
+    span. The deflection limit at each station is a cubic in L,
+
+        f w L^3 / EI + g w L / GA = 1 / limit
+
+    which has a single positive root that is found in closed form. The
+    maximum span is the smallest root of all stations.
+    """
+    EI, GA, w, limit = [np.asarray(x, dtype=float)[..., None]
+                        for x in (EI, GA, w, limit)]
+    a = w*f / EI
+    b = w*g / GA
+    c = 1 / limit
+
+    # Solve L^3 + pL - q = 0 with Cardano's method. For p >= 0 there is a
+    # single real root L = u + v, where v = -p / 3u. Using u^3 + v^3 = q, the
+    # root is written without subtraction to avoid cancellation when shear
+    # deformation governs.
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p = b / a
+        q = c / a
+        u2 = np.cbrt(q / 2 + np.sqrt(q**2 / 4 + p**3 / 27))**2
+        L = np.where(a > 0, q / (u2 + p / 3 + p**2 / (9*u2)), c / b)
+    return L.min(-1)
+
+
+def getMaxDeflectionSpan(EI:float|np.ndarray, GA:float|np.ndarray,
+                         w:float|np.ndarray, limit:float|np.ndarray,
+                         Nspan:int = 1, Nstations:int = 101,
+                         Niter:int = 40) -> np.ndarray:
+    """
+    Returns the maximum span where the deflection of a beam is at most
+    L / limit, for a beam with Nspan equal spans and a uniform load on all
+    spans. All inputs are broadcast against each other, i.e. EI and GA with
+    shape (Nsection, 1, 1), w with shape (Nload, 1) and limit with shape
+    (Nlimit,) gives the span of each section, load and limit.
+
+    For single spans the deflection limit at each station is a cubic in L,
+    which is solved in closed form. For multiple spans the support moments
+    also depend on the span through shear deformation, and the span is found
+    with a bisection for all items at once. The span is bracketed by the
+    span of a simple beam and the span of a continuous beam without shear
+    deformation.
+
+    Parameters
+    ----------
+    EI : float|np.ndarray
+        The bending stiffness.
+    GA : float|np.ndarray
+        The shear stiffness. Use np.inf to ignore shear deformation.
+    w : float|np.ndarray
+        The magnitude of the uniform load.
+    limit : float|np.ndarray
+        The deflection limit, i.e. 360 for L/360.
+    Nspan : int, optional
+        The number of spans. The default is 1.
+    Nstations : int, optional
+        The number of stations checked in each span. The default is 101.
+    Niter : int, optional
+        The number of bisection steps used for multiple spans. Each step
+        halves the bracket. The default is 40.
+
+    Returns
+    -------
+    np.ndarray
+        The maximum span length.
+
+    """
+    EI, GA, w, limit = np.broadcast_arrays(*[np.asarray(x, dtype=float)
+                                             for x in (EI, GA, w, limit)])
+    f, g = getDeflectionShapes(1, Nstations)
+    lower = _getCubicSpan(f, g, EI, GA, w, limit)
+    if Nspan == 1:
+        return lower
+
+    f, g = getDeflectionShapes(Nspan, Nstations)
+    upper = _getCubicSpan(f, np.zeros_like(g), EI, GA, w, limit)
+    for ii in range(Niter):
+        L = (lower + upper) / 2
+        isValid = getMaxDeflection(EI, GA, w, L, Nspan, Nstations)*limit <= L
+        lower = np.where(isValid, L, lower)
+        upper = np.where(isValid, upper, L)
+    return lower
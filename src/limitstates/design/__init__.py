@@ -0,0 +1 @@
+from .results import *
@@ -5,4 +5,5 @@ from .annexB import *
 from .fireportection import *
 
 from .glulam import *
-from .clt import *
\ No newline at end of file
+from .clt import *
+from .spanTables import *
@@ -2,7 +2,11 @@
 Contains code design clauses for working with CLT.
 """
 
+import numpy as np
+
 from .element import BeamColumnCltCsa19, _getSection, _getphi
+from .fireportection import GypusmFlatCSA19
+from .annexB import getNetBurnTime, getBurnDimensions
 from .....objects import SectionCLT
 
 
@@ -93,7 +97,7 @@ def checkMrCltBeam(element:BeamColumnCltCsa19, knet:float = 1,
         # Smm = (section.getEIs(lUnit='mm') / E / (layers.getYmax() * slfactor)) /10e6
     else:
         # Smm = (section.getEIw() / E / layers.getYmax() * slfactor)      
-        Smm = (section.getEIw(sUnit='MPa', lUnit='mm') / E / layers.getYmax())
+        Smm = (section.getEIw(sUnit='MPa', lUnit='mm') / E / layers.getYmax(False))
         
     return checkMrClt(Smm, fb*knet, useStrongAxis, phi) / 1000
 
@@ -124,7 +128,6 @@ def checkCltShear(Ag:float, Fs:float, phi = 0.9):
 
     """
     
-    phi = 0.9
     return phi*Fs*Ag*(2/3)
   
 def checkCltBeamShear(element:BeamColumnCltCsa19, knet:float = 1, 
@@ -162,7 +165,7 @@ def checkCltBeamShear(element:BeamColumnCltCsa19, knet:float = 1,
     section = _getSection(element, useFire)   
     phi = _getphi(useFire)
     
-    layers = _getLayerGroup(element.section, useStrongAxis)
+    layers = _getLayerGroup(section, useStrongAxis)
     sfactor = layers[0].mat.sConvert('MPa')
     fv = layers[0].mat.fs*sfactor
     Anet = layers.d * section.w
@@ -172,4 +175,193 @@ def checkCltBeamShear(element:BeamColumnCltCsa19, knet:float = 1,
     return checkCltShear(Anet, fv*knet, phi)
 
 
+# =============================================================================
+# Batched checks
+# =============================================================================
+
+def _getLayerTable(sections:list[SectionCLT], useStrongAxis:bool = True) -> dict:
+    """
+    Stacks the layers of each section into arrays with shape 
+    (Nsection, Nlayer). Sections with fewer layers are padded with empty 
+    layers at the bottom. Lengths are in mm and stresses are in MPa.
+    """
+    Nsection = len(sections)
+    Nlayer = max(len(section.layers) for section in sections)
+    table = {name:np.zeros((Nsection, Nlayer)) for name in ['t', 'E', 'fb', 'fs']}
+    table['isParallel'] = np.zeros((Nsection, Nlayer), dtype=bool)
+    table['w'] = np.zeros(Nsection)
+    
+    for ii, section in enumerate(sections):
+        table['w'][ii] = section.w * section.lConvert('mm')
+        for jj, layer in enumerate(section.layers):
+            sfactor = layer.mat.sConvert('MPa')
+            table['t'][ii, jj]  = layer.t * layer.lConvert('mm')
+            table['E'][ii, jj]  = layer.getLayerE(useStrongAxis) * sfactor
+            table['fb'][ii, jj] = getattr(layer.mat, 'fb', np.nan) * sfactor
+            table['fs'][ii, jj] = getattr(layer.mat, 'fs', np.nan) * sfactor
+            table['isParallel'][ii, jj] = layer._layerMatchesDirection(useStrongAxis)
+    return table
+
+
+def _getBurnAmounts(FRR:np.ndarray, portection:GypusmFlatCSA19, Bn:float) -> np.ndarray:
+    """
+    Returns the depth burnt from the bottom of a panel for each fire 
+    duration, in mm.
+    """
+    if portection is None:
+        portection = GypusmFlatCSA19('exposed')
+    portectionTime = portection.getPortectionTime()[0]
+    netBurnTime = getNetBurnTime(np.array(FRR, dtype=float), portectionTime)
+    return getBurnDimensions(netBurnTime, Bn)
+
+
+def _getActiveLayerProps(table:dict, burnAmount:np.ndarray) -> dict:
+    """
+    Finds the propreties of the active layers of each section for each burn
+    amount. Layers are burnt from the bottom of the section, then empty 
+    layers and outer layers perpendicular to the direction checked are 
+    removed, the same as getActiveLayers.
+    
+    Outputs have the shape (Nsection, Nburn).
+    """
+    t = table['t'][:, None, :]
+    Nlayer = t.shape[-1]
+    
+    # The depth below the bottom of each layer.
+    depthBelow = t.sum(-1, keepdims=True) - np.cumsum(t, -1)
+    tBurnt = np.clip(burnAmount[None, :, None] - depthBelow, 0, None)
+    t = np.clip(t - tBurnt, 0, None)
+    
+    isParallel = (t > 0) & table['isParallel'][:, None, :]
+    hasLayers = isParallel.any(-1)
+    first = np.argmax(isParallel, -1)
+    last = Nlayer - 1 - np.argmax(isParallel[..., ::-1], -1)
+    inds = np.arange(Nlayer)
+    isActive = (t > 0) & (first[..., None] <= inds) & (inds <= last[..., None])
+    t = np.where(isActive, t, 0)
+    
+    # Layer midpoints, measured from the top of the first active layer.
+    d = t.sum(-1)
+    yMid = np.cumsum(t, -1) - t / 2
+    E = table['E'][:, None, :]
+    EA = (E*t).sum(-1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ybar = np.where(hasLayers, (E*t*yMid).sum(-1) / EA, 0)
+    EI = (E*t**3 / 12 + E*t*(ybar[..., None] - yMid)**2).sum(-1)
+    
+    sectionInds = np.arange(t.shape[0])[:, None]
+    return {'d':d, 'EI':EI, 'ymax':np.maximum(ybar, d - ybar), 
+            'hasLayers':hasLayers,
+            'E':table['E'][sectionInds, first],
+            'fb':table['fb'][sectionInds, first],
+            'fs':table['fs'][sectionInds, first]}
 
+
+def _getFireInputs(FRR:np.ndarray, portection:GypusmFlatCSA19, Bn:float):
+    """
+    Returns the burn amount and phi for each column of the batched checks.
+    """
+    if FRR is None:
+        return np.zeros(1), _getphi(False)
+    FRR = np.atleast_1d(FRR)
+    return _getBurnAmounts(FRR, portection, Bn), _getphi(True)
+
+
+def checkMrCltSections(sections:list[SectionCLT], knet:float|np.ndarray = 1, 
+                       FRR:np.ndarray = None, 
+                       portection:GypusmFlatCSA19 = None, Bn:float = 0.8,
+                       useStrongAxis:bool = True) -> np.ndarray:
+    """
+    Checks the Mr of many CLT panels for many fire durations at once, 
+    returning units in Nm. Each result is the same as checkMrCltBeam for a
+    panel with the matching fire section.
+    
+    Fire sections are found with clauses B.4 and B.5 for fire on the bottom
+    face of each panel, as in setFireSectionCltCSA. The Mr of CLT panels 
+    does not depend on the span, so the output can be broadcast against
+    any number of spans.
+
+    Parameters
+    ----------
+    sections : list[SectionCLT]
+        The CLT sections to check, i.e. the output of loadCltSections.
+    knet : float|np.ndarray, optional
+        The product of all standard k factors, including kd, kse, etc. 
+        Arrays are broadcast against the output, i.e. an array with shape 
+        (NFRR,) has a different factor for each fire duration. 
+        The default is 1.
+    FRR : np.ndarray, optional
+        The fire durations to check in minutes. The default is None, which
+        checks the panels without fire.
+    portection : GypusmFlatCSA19, optional
+        The fire portection on the bottom of the panels. The default is 
+        None, which uses exposed panels.
+    Bn : float, optional
+        The char rate for the sections. The default is 0.8.
+    useStrongAxis : bool, optional
+        A toggle that sets the diretion moment will be checked in.
+        The default is True.
+
+    Returns
+    -------
+    np.ndarray
+        Mr in Nm, with shape (Nsection, NFRR). Without fire, NFRR is 1.
+
+    """
+    burnAmount, phi = _getFireInputs(FRR, portection, Bn)
+    table = _getLayerTable(sections, useStrongAxis)
+    props = _getActiveLayerProps(table, burnAmount)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        Smm = props['EI'] * table['w'][:, None] / props['E'] / props['ymax']
+    Smm = np.where(props['hasLayers'], Smm, 0)
+    return checkMrClt(Smm, props['fb']*knet, useStrongAxis, phi) / 1000
+
+
+def checkCltSectionsShear(sections:list[SectionCLT], knet:float|np.ndarray = 1, 
+                          FRR:np.ndarray = None, 
+                          portection:GypusmFlatCSA19 = None, Bn:float = 0.8,
+                          useStrongAxis:bool = True) -> np.ndarray:
+    """
+    Checks the Vr of many CLT panels for many fire durations at once, 
+    returning units in N. Each result is the same as checkCltBeamShear for 
+    a panel with the matching fire section.
+    
+    Fire sections are found with clauses B.4 and B.5 for fire on the bottom
+    face of each panel, as in setFireSectionCltCSA. The Vr of CLT panels 
+    does not depend on the span, so the output can be broadcast against
+    any number of spans.
+
+    Parameters
+    ----------
+    sections : list[SectionCLT]
+        The CLT sections to check, i.e. the output of loadCltSections.
+    knet : float|np.ndarray, optional
+        The product of all standard k factors, including kd, kse, etc. 
+        Arrays are broadcast against the output, i.e. an array with shape 
+        (NFRR,) has a different factor for each fire duration. 
+        The default is 1.
+    FRR : np.ndarray, optional
+        The fire durations to check in minutes. The default is None, which
+        checks the panels without fire.
+    portection : GypusmFlatCSA19, optional
+        The fire portection on the bottom of the panels. The default is 
+        None, which uses exposed panels.
+    Bn : float, optional
+        The char rate for the sections. The default is 0.8.
+    useStrongAxis : bool, optional
+        A toggle that sets the diretion shear will be checked in.
+        The default is True.
+
+    Returns
+    -------
+    np.ndarray
+        Vr in N, with shape (Nsection, NFRR). Without fire, NFRR is 1.
+
+    """
+    burnAmount, phi = _getFireInputs(FRR, portection, Bn)
+    table = _getLayerTable(sections, useStrongAxis)
+    props = _getActiveLayerProps(table, burnAmount)
+    
+    Anet = props['d'] * table['w'][:, None]
+    return checkCltShear(Anet, props['fs']*knet, phi)
@@ -5,8 +5,12 @@ These are largely set up to ease development and provide type hints.
 
 from dataclasses import dataclass
 
+import numpy as np
+
 from limitstates.objects import (Member, SectionRectangle, initSimplySupportedMember, 
-                          SectionCLT)
+                          SectionCLT, initMembers)
+from limitstates.objects.element.element import (_getSectionInds, 
+                                                 _copyElementTemplates)
 from limitstates.objects.display import MATCOLOURS, PlotConfigCanvas,  PlotConfigObject
 from limitstates import BeamColumn, EleDisplayProps, PlotOriginPosition
 
@@ -16,6 +20,7 @@ from limitstates import BeamColumn, EleDisplayProps, PlotOriginPosition
 from .fireportection import GypusmRectangleCSA19, GypusmFlatCSA19
 
 __all__ = ["BeamColumnGlulamCsa19", "getBeamColumnGlulamCsa19", 
+           "getBeamColumnsGlulamCsa19", 
            "BeamColumnCltCsa19", "DesignPropsClt19", "DesignPropsGlulam19",
            "EleDisplayPropsGlulam19"]
 
@@ -237,8 +242,19 @@ def getBeamColumnGlulamCsa19(L:float, section:SectionRectangle, lUnit:str='m',
 
     """
     member = initSimplySupportedMember(L, lUnit)
-    designProps = DesignPropsGlulam19()
+    designProps = _getDesignPropsGlulam19(L, firePortection, Lx, Ly, kexB, 
+                                          kexC, keyC)
+    return BeamColumnGlulamCsa19(member, section, designProps)
 
+
+def _getDesignPropsGlulam19(L:float, firePortection:GypusmRectangleCSA19, 
+                            Lx:float, Ly:float, kexB:float, kexC:float, 
+                            keyC:float) -> DesignPropsGlulam19:
+    """
+    Returns the design propreties of a single span glulam beamcolumn. Design
+    lengths that aren't set use the length of the beamcolumn.
+    """
+    designProps = DesignPropsGlulam19()
     
     if firePortection:
         designProps.firePortection = firePortection
@@ -255,8 +271,82 @@ def getBeamColumnGlulamCsa19(L:float, section:SectionRectangle, lUnit:str='m',
     else:
         designProps.Ly = L
     designProps.keyC = keyC
+    return designProps
+
+
+def getBeamColumnsGlulamCsa19(L:np.ndarray, sections:list[SectionRectangle], 
+                              sectionInds:np.ndarray = None, lUnit:str='m', 
+                              supportCodes:np.ndarray = None, 
+                              supportTypes:list = None,
+                              firePortection:GypusmRectangleCSA19 = None,
+                              kexB:float = 1,
+                              kexC:float = 1,
+                              keyC:float = 1) -> list[BeamColumnGlulamCsa19]:
+    """
+    A function used to return many glulam beamcolumns at once, based on 
+    arrays of lengths and section indexes. Each element is the same as the 
+    output of getBeamColumnGlulamCsa19. This is much faster than making each
+    element with getBeamColumnGlulamCsa19, which helps in parametric studies
+    with a large number of elements.
     
-    return BeamColumnGlulamCsa19(member, section, designProps)
+    One template element is made for each section with the constructors. 
+    The members, design props and elements are then made without calling 
+    the constructor of each object, and elements with the same section 
+    share the plot configurations of their display props.
+    
+    The design lengths Lx and Ly of each element are its length.
+    Supports are chosen with support codes, see initMembers. Elements that 
+    use the same section share the same section object, and all elements
+    share the same fire portection object.
+
+    Parameters
+    ----------
+    L : np.ndarray
+        The length of each beamcolumn.
+    sections : list[SectionRectangle]
+        The sections the beamcolumns use.
+    sectionInds : np.ndarray, optional
+        The index of the section in sections for each beamcolumn. 
+        The default is None, which uses the first section for all elements.
+    lUnit : str, optional
+        The units for the input lengths. The default is 'm'.
+    supportCodes : np.ndarray, optional
+        The index of the supports to use in supportTypes for each member. 
+        The default is None, which uses the first supports for all members.
+    supportTypes : list[tuple[Support, Support]], optional
+        The possible start and end supports. The default is None, which 
+        makes simply supported members.
+    firePortection : GypusmRectangleCSA19, optional
+        The fire portection used for all elements. The default is None.
+    kexB : float, optional
+        The effective length factor for bending. The default is 1.
+    kexC : float, optional
+        The effective length factor for compression in the x direction. 
+        The default is 1.
+    keyC : float, optional
+        The effective length factor for compression in the y direction. 
+        The default is 1.
+
+    Returns
+    -------
+    list[BeamColumnGlulamCsa19]
+        The output beamcolumn objects.
+
+    """
+    members = initMembers(L, lUnit, supportCodes, supportTypes)
+    Nelement = len(members)
+    sectionInds = _getSectionInds(sections, sectionInds, Nelement)
+    
+    # Matches _getDesignPropsGlulam19, without a function call per element.
+    designProps = [DesignPropsGlulam19(firePortection, Lx = member.L, 
+                                       Ly = member.L, kexB = kexB, kexC = kexC, 
+                                       keyC = keyC) 
+                   for member in members]
+    
+    templates = [getBeamColumnGlulamCsa19(1., section, lUnit, firePortection, 
+                                          kexB = kexB, kexC = kexC, keyC = keyC) 
+                 for section in sections]
+    return _copyElementTemplates(templates, sectionInds, members, designProps)
 
 @dataclass
 class DesignPropsClt19:
@@ -4,8 +4,10 @@ Contains the code designc clauses
 from numpy import pi, diff, cumsum
 from enum import IntEnum
 
+import numpy as np
+
 from .element import BeamColumnGlulamCsa19,  _getSection, _getphi, _getphiCr, _isGlulam
-from limitstates import DesignDiagram
+from limitstates import DesignDiagram, DesignDiagramEnvelope
 
 
 def checkCb(Leb, d, b):
@@ -92,20 +94,22 @@ def checkKL(Cb:float, E:float, Fb:float, kse:float=1, kt:float=1, kx:float=1):
     kx : float, optional
         The curvature factor to for the beam. The default is 1.
 
+    
+    Inputs can be arrays, in which case kL is found for each item. Values of 
+    -1 are returned where none of the cases apply.
+
     """
     
-    # Case a
-    if Cb < 10:
-        return 1
+    Cb = np.asarray(Cb, dtype=float)
     Ck = (0.97*E*kse*kt / Fb)**0.5
-    # Case b
-    if 10 < Cb and Cb < Ck:
-        return 1 - (1/3)*(Cb/Ck)**4
-    # Case c        
-    elif Ck < Cb and Cb < 50:
-        return 0.65*E*kse*kt / (Cb**2*Fb*kx)
-    else:
-        return -1
+    
+    # Case a, b, and c
+    conditions = [Cb < 10, (10 < Cb) & (Cb < Ck), (Ck < Cb) & (Cb < 50)]
+    values = [1, 1 - (1/3)*(Cb/Ck)**4, 0.65*E*kse*kt / (Cb**2*Fb*kx)]
+    kL = np.select(conditions, values, -1)
+    if kL.ndim == 0:
+        return float(kL)
+    return kL
 
 def checkKzbg(b:float, d:float, LM0:float):
     """
@@ -129,7 +133,7 @@ def checkKzbg(b:float, d:float, LM0:float):
     """
     
     kzbg = ((130/b)*(610/d)*( 9100 / LM0)) **0.1
-    return min(1.3, kzbg)
+    return np.minimum(1.3, kzbg)
 
 
 def _getMr0(S:float, Fb:float, phi = 0.9):
@@ -163,7 +167,7 @@ def checkGlulamMr(S:float, Fb:float, kzbg:float, kL:float = 1, kx:float=1,
     Mr0 = _getMr0(S, Fb, phi)
     Mr1 = Mr0*kzbg*kx
     Mr2 = Mr0*kL*kx
-    return min(Mr1, Mr2) / 1000
+    return np.minimum(Mr1, Mr2) / 1000
     
 
 # def _CheckSectionMr():
@@ -396,7 +400,7 @@ class SegmentSupportTypes(IntEnum):
 
 
 def checkMrGlulamBeamMultiSpan(element: BeamColumnGlulamCsa19, 
-                              bmd: DesignDiagram, 
+                              bmd: DesignDiagram | DesignDiagramEnvelope, 
                               lateralSupportType: SegmentSupportTypes | int = 2,
                               knet:float = 1, 
                               useFire:bool = False,
@@ -426,8 +430,9 @@ def checkMrGlulamBeamMultiSpan(element: BeamColumnGlulamCsa19,
     ----------
     element : BeamColumnGlulamCsa19
         The multi-span element to check.
-    bmd : DesignDiagram
-        The bending moment diagram for the load case to be checked.
+    bmd : DesignDiagram | DesignDiagramEnvelope
+        The bending moment diagram for the load case to be checked. If an 
+        envelope is used, every load case in the envelope is checked at once.
     lateralSupportType : SegmentSupportTypes | int, optional
         The type of lateral support condition for bending. The default is 2.
         
@@ -460,6 +465,9 @@ def checkMrGlulamBeamMultiSpan(element: BeamColumnGlulamCsa19,
         The kxbgout for each segment.
     kLout : list[float]
         The kL out for each segment..
+        
+    If an envelope is checked, each output contains a list for each load 
+    case in the envelope. kL is only calculated once for all cases.
 
     """
         
@@ -471,10 +479,6 @@ def checkMrGlulamBeamMultiSpan(element: BeamColumnGlulamCsa19,
     E  = element.section.mat.E
     Fb = element.section.mat.fb* knet
         
-    # Get the regions for xkbg
-    coordsmm = bmd.getIntersectionCoords() * mlfactor
-    Lkzbg, kzbg = checkBMDkzbg(coordsmm, b, d)
-        
     section = _getSection(element, useFire)    
     bkL = section.b * slFactor # kL is based on the fire section!
     dkL = section.d * slFactor # kL is based on the fire section!
@@ -500,13 +504,28 @@ def checkMrGlulamBeamMultiSpan(element: BeamColumnGlulamCsa19,
         kL = getMemberkL(Lseg, kexBSeg, isContinouslyBraced,
                          bkL, dkL, E, Fb, kse, kt, kx)
     
+    phi  = _getphi(useFire)
+    Mr0  = _getMr0(Sx, Fb, phi) / 1000
+    
+    if not isinstance(bmd, DesignDiagramEnvelope):
+        return _getMultispanMr(bmd, Mr0, Lseg, kL, b, d, mlfactor)
+    
+    outputs = [_getMultispanMr(diagram, Mr0, Lseg, kL, b, d, mlfactor) 
+               for diagram in bmd]
+    return tuple(list(output) for output in zip(*outputs))
+
+def _getMultispanMr(bmd, Mr0, Lseg, kL, b, d, mlfactor):
+    """
+    Returns the Mr for each region of a multispan beam for a single BMD.
+    """
+    
+    # Get the regions for xkbg
+    coordsmm = bmd.getIntersectionCoords() * mlfactor
+    Lkzbg, kzbg = checkBMDkzbg(coordsmm, b, d)
+    
     xOut, kzbgout, kLout = getMultispanRegions(Lkzbg, kzbg, Lseg, kL)
     xOut = [L / mlfactor for L in xOut]
     kmin = [min(kl, kz) for kl, kz  in zip(kzbgout, kLout)]
-    
-
-    phi  = _getphi(useFire)
-    Mr0  = _getMr0(Sx, Fb, phi) / 1000
     MrOut = [Mr0* k  for k in kmin]
     
     return MrOut, xOut, kzbgout, kLout
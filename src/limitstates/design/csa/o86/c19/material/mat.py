@@ -2,8 +2,12 @@
 The material library contains material models
 """
 
-from limitstates import MaterialElastic
-from limitstates.objects.read import _loadMaterialDBDict, _loadMaterialDB, DBConfig, _sortCLTMatDict
+from functools import lru_cache
+from types import MappingProxyType
+
+from limitstates import MaterialElastic, internMaterial
+from limitstates.objects.read import (_loadMaterialDBDict, _loadMaterialRegistry, 
+                                      DBConfig, _sortCLTMatDict)
 
 __all__ = ["MaterialGlulamCSA19", "MaterialCLTLayerCSA19", 
            "loadGlulamMaterialDB", "loadGlulamMaterial", "loadCltMatDB"]
@@ -106,16 +110,25 @@ def loadGlulamMaterialDB() -> list[MaterialGlulamCSA19]:
     
     Note, for HF, the density of outer laminations are DF in glulam, so a 
     higher density can typically be used for connectors.
+    
+    The database is only read once per process, and the materials returned
+    are shared between calls.
 
     Returns
     -------
-    None.
+    list[MaterialGlulamCSA19]
+        The glulam materials.
+
+    """
+    return list(_getGlulamRegistry().values())
 
+def _getGlulamRegistry() -> MappingProxyType:
+    """
+    Returns the read only dictionary of glulam materials, keyed by 
+    (species, grade).
     """
-    sUnit = 'MPa'
-    rhoUnit = 'kg/m3'
-    mats = _loadMaterialDB(_glulamConfig, MaterialGlulamCSA19, sUnit, rhoUnit)
-    return mats
+    return _loadMaterialRegistry(_glulamConfig, MaterialGlulamCSA19, 
+                                 ('species', 'grade'), 'MPa', 'kg/m3')
 
 def loadGlulamMaterial(species:str, grade:str) -> MaterialGlulamCSA19:
 
@@ -138,16 +151,18 @@ def loadGlulamMaterial(species:str, grade:str) -> MaterialGlulamCSA19:
     grade : str
         The grade of glulam, as defined in table 7-2
     
+    Returns
+    -------
+    MaterialGlulamCSA19
+        The glulam material. The same read only material is returned by 
+        every call, so it must be copied before being modified.
+    
     """
-    mats = loadGlulamMaterialDB()
-    matOut = None
-    for mat in mats:
-        if species == mat.species and grade == mat.grade:
-            matOut = mat
-    if not matOut:
+    registry = _getGlulamRegistry()
+    if (species, grade) not in registry:
         raise Exception(f"No material with species {species} and grade {grade} found in database.")
     
-    return matOut
+    return registry[(species, grade)]
 
 def loadCltMatDB(cltDBname:str = "prg320_2019") -> list[[MaterialCLTLayerCSA19, MaterialCLTLayerCSA19]]:
     """
@@ -158,7 +173,9 @@ def loadCltMatDB(cltDBname:str = "prg320_2019") -> list[[MaterialCLTLayerCSA19,
     Loads materials for each layer of CLT from a supplier database in 
     the form [strong, weak].
     
-    Materials propreties will be loaded in 'MPa' and 'kg/m3'
+    Materials propreties will be loaded in 'MPa' and 'kg/m3'. Each database
+    is only read once per process, and the materials returned are shared 
+    between calls.
 
     Parameters
     ----------
@@ -172,7 +189,14 @@ def loadCltMatDB(cltDBname:str = "prg320_2019") -> list[[MaterialCLTLayerCSA19,
         [strongAxisMat, weakAxisMat] sections.
 
     """
-    
+    return [list(mats) for mats in _getCltRegistry(cltDBname).values()]
+
+@lru_cache(maxsize=None)
+def _getCltRegistry(cltDBname:str) -> MappingProxyType:
+    """
+    Returns the read only dictionary of [strong, weak] CLT materials for a 
+    database, keyed by grade. Materials are interned, and are read only.
+    """
     _cltConfig = DBConfig('csa', 'clt', cltDBname)
     
     # Load the material dictionary.
@@ -180,9 +204,10 @@ def loadCltMatDB(cltDBname:str = "prg320_2019") -> list[[MaterialCLTLayerCSA19,
     rawMatDict = rawDB.to_dict(orient='index')
     sortedMatDict   = _sortCLTMatDict(rawMatDict)
     
-    mats = []
+    registry = {}
     for cltGrade in sortedMatDict.keys():
         tempMatDict = sortedMatDict[cltGrade]
-        mats.append([MaterialCLTLayerCSA19(tempMatDict[0], 'MPa', 'kg/m3'), 
-                     MaterialCLTLayerCSA19(tempMatDict[1], 'MPa', 'kg/m3')])
-    return mats
\ No newline at end of file
+        strongMat = MaterialCLTLayerCSA19(tempMatDict[0], 'MPa', 'kg/m3')
+        weakMat   = MaterialCLTLayerCSA19(tempMatDict[1], 'MPa', 'kg/m3')
+        registry[cltGrade] = (internMaterial(strongMat), internMaterial(weakMat))
+    return MappingProxyType(registry)
\ No newline at end of file
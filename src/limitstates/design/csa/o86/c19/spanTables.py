@@ -0,0 +1,491 @@
+"""
+Span tables for CLT floor panels, based on deflection and vibration, and
+for simply supported glulam beams, based on strength and deflection.
+
+Spans are found for many sections, loads, and deflection limits at once. The
+maximum span for each deflection limit is solved in closed form for single
+spans, and with a vectorized bisection for multiple spans, see
+limitstates.analysis.spans.
+"""
+
+import numpy as np
+
+from .....objects import SectionCLT, SectionRectangle
+from .....analysis.spans import getMaxDeflection, getMaxDeflectionSpan
+from .element import _getphi
+from .glulam import (checkCb, checkKL, checkKzbg, checkGlulamMr, 
+                     checkGlulamShearSimple, checkGlulamWr)
+
+__all__ = ["getCltLinearMass", "getCltVibrationSpans",
+           "getCltDeflectionSpans", "getCltSpanTable",
+           "getGlulamFactoredLoads", "getGlulamLoadTable", 
+           "getGlulamSpanTable"]
+
+
+def _getWidth(section:SectionCLT, useStrongAxis:bool) -> float:
+    """
+    Returns the width of a section in m.
+    """
+    if useStrongAxis:
+        return section.w * section.lConvert('m')
+    return section.wWeak * section.lConvert('m')
+
+
+def _getCltStiffness(sections:list[SectionCLT], useStrongAxis:bool = True):
+    """
+    Returns the EI and GA of each section for a 1 m wide panel, in Nm2 and N.
+    """
+    EI = np.zeros(len(sections))
+    GA = np.zeros(len(sections))
+    for ii, section in enumerate(sections):
+        w = _getWidth(section, useStrongAxis)
+        if useStrongAxis:
+            EI[ii] = section.getEIs() / w
+            GA[ii] = section.getGAs() / w
+        else:
+            EI[ii] = section.getEIw() / w
+            GA[ii] = section.getGAw() / w
+    return EI, GA
+
+
+def getCltLinearMass(sections:list[SectionCLT]) -> np.ndarray:
+    """
+    Returns the mass of a 1 m wide strip of each CLT panel, in kg/m. All
+    layers of the panel are included.
+
+    Parameters
+    ----------
+    sections : list[SectionCLT]
+        The CLT sections to use, i.e. the output of loadCltSections.
+
+    Returns
+    -------
+    np.ndarray
+        The mass of each panel in kg/m, with shape (Nsection,).
+
+    """
+    m = np.zeros(len(sections))
+    for ii, section in enumerate(sections):
+        for layer in section.layers:
+            t = layer.t * layer.lConvert('m')
+            m[ii] += t * layer.mat.rho * layer.mat.rhoConvert('kg/m3')
+    return m
+
+
+def getCltVibrationSpans(sections:list[SectionCLT],
+                         useStrongAxis:bool = True) -> np.ndarray:
+    """
+    Returns the vibration controlled span of CLT floor panels, from
+    CSA O86-19 Annex A:
+
+        L <= 0.11 (EI)^0.29 / m^0.12
+
+    where EI is the effective bending stiffness of a 1 m wide panel in Nm2,
+    and m is the mass of a 1 m wide panel in kg/m.
+
+    Parameters
+    ----------
+    sections : list[SectionCLT]
+        The CLT sections to use, i.e. the output of loadCltSections.
+    useStrongAxis : bool, optional
+        A toggle that sets the direction the panels span in.
+        The default is True.
+
+    Returns
+    -------
+    np.ndarray
+        The vibration controlled span of each panel in m, with shape
+        (Nsection,).
+
+    """
+    EI, _ = _getCltStiffness(sections, useStrongAxis)
+    m = getCltLinearMass(sections)
+    return 0.11 * EI**0.29 / m**0.12
+
+
+def getCltDeflectionSpans(sections:list[SectionCLT], loads:np.ndarray,
+                          limits:np.ndarray, Nspan:int = 1,
+                          useStrongAxis:bool = True) -> np.ndarray:
+    """
+    Returns the maximum span of CLT panels for each combination of uniform
+    load and deflection limit. Panels have Nspan equal spans and the load
+    is applied to all spans. Deflections include shear deformation, using
+    the EI and GA of the panel.
+
+    Parameters
+    ----------
+    sections : list[SectionCLT]
+        The CLT sections to use, i.e. the output of loadCltSections.
+    loads : np.ndarray
+        The uniform area loads to check in kPa, i.e. the specified live
+        load.
+    limits : np.ndarray
+        The deflection limits to check, i.e. 360 for L/360.
+    Nspan : int, optional
+        The number of spans. The default is 1.
+    useStrongAxis : bool, optional
+        A toggle that sets the direction the panels span in.
+        The default is True.
+
+    Returns
+    -------
+    np.ndarray
+        The maximum span in m, with shape (Nsection, Nload, Nlimit).
+
+    """
+    EI, GA = _getCltStiffness(sections, useStrongAxis)
+    w = np.atleast_1d(np.asarray(loads, dtype=float)) * 1000
+    limits = np.atleast_1d(np.asarray(limits, dtype=float))
+    return getMaxDeflectionSpan(EI[:, None, None], GA[:, None, None],
+                                w[None, :, None], limits, Nspan)
+
+
+def getCltSpanTable(sections:list[SectionCLT], loads:np.ndarray,
+                    limits:np.ndarray, Nspans:list[int] = [1, 2, 3],
+                    checkVibration:bool = True, multiSpanFactor:float = 1.,
+                    useStrongAxis:bool = True) -> (np.ndarray, np.ndarray,
+                                                   np.ndarray):
+    """
+    Makes a span table for CLT floor panels. The span of each panel is the
+    lesser of the deflection controlled span and vibration controlled span,
+    for each number of spans, load, and deflection limit.
+
+    The whole table is found without loops over spans or loads. For
+    example, all PRG320 layups with three span conditions, ten loads, and
+    four deflection limits are found in a single call.
+
+    Parameters
+    ----------
+    sections : list[SectionCLT]
+        The CLT sections to use, i.e. the output of loadCltSections.
+    loads : np.ndarray
+        The uniform area loads to check in kPa.
+    limits : np.ndarray
+        The deflection limits to check, i.e. 360 for L/360.
+    Nspans : list[int], optional
+        The number of equal spans to check. The default is [1, 2, 3].
+    checkVibration : bool, optional
+        If true, spans are limited to the vibration controlled span
+        from getCltVibrationSpans. The default is True.
+    multiSpanFactor : float, optional
+        A factor applied to the vibration controlled span of panels with
+        more than one span. The default is 1, which uses the single span
+        value.
+    useStrongAxis : bool, optional
+        A toggle that sets the direction the panels span in.
+        The default is True.
+
+    Returns
+    -------
+    spans : np.ndarray
+        The governing span in m, with shape (Nsection, NNspan, Nload,
+        Nlimit).
+    deflectionSpans : np.ndarray
+        The deflection controlled span in m, with the same shape as spans.
+    vibrationSpans : np.ndarray
+        The vibration controlled span in m, with shape (Nsection, NNspan).
+        If vibration isn't checked, all values are inf.
+
+    """
+    deflectionSpans = np.stack([getCltDeflectionSpans(sections, loads, limits,
+                                                      Nspan, useStrongAxis)
+                                for Nspan in Nspans], axis = 1)
+
+    Nspans = np.asarray(Nspans)
+    if checkVibration:
+        vibrationSpans = getCltVibrationSpans(sections, useStrongAxis)
+        factor = np.where(Nspans > 1, multiSpanFactor, 1.)
+        vibrationSpans = vibrationSpans[:, None] * factor
+    else:
+        vibrationSpans = np.full((len(sections), len(Nspans)), np.inf)
+
+    spans = np.minimum(deflectionSpans, vibrationSpans[..., None, None])
+    return spans, deflectionSpans, vibrationSpans
+
+
+# =============================================================================
+# Glulam
+# =============================================================================
+
+def _getGlulamTable(sections:list[SectionRectangle]) -> dict:
+    """
+    Returns the propreties of each section as arrays with shape 
+    (Nsection, 1), so they broadcast against an axis of spans or loads. 
+    Lengths are in mm and stresses are in MPa.
+    """
+    names = ['b', 'd', 'A', 'Sx', 'Ix', 'E', 'fb', 'fv']
+    table = {name:np.zeros(len(sections)) for name in names}
+    for ii, section in enumerate(sections):
+        lfactor = section.lConvert('mm')
+        sfactor = section.mat.sConvert('MPa')
+        table['b'][ii]  = section.b * lfactor
+        table['d'][ii]  = section.d * lfactor
+        table['A'][ii]  = section.A * lfactor**2
+        table['Sx'][ii] = section.Sx * lfactor**3
+        table['Ix'][ii] = section.Ix * lfactor**4
+        table['E'][ii]  = section.mat.E * sfactor
+        table['fb'][ii] = section.mat.fb * sfactor
+        table['fv'][ii] = section.mat.fv * sfactor
+    return {name:values[:, None] for name, values in table.items()}
+
+
+def _getGlulamFactoredLoads(table:dict, L:np.ndarray, knet:float|np.ndarray,
+                            lateralSupport:bool, kexB:float, Cv:float):
+    """
+    Returns the factored uniform load resistance in N/m for moment and 
+    shear, for spans L in m.
+    """
+    phi = _getphi(False)
+    Lmm = L*1000
+    Fb = table['fb']*knet
+    Fv = table['fv']*knet
+    
+    kzbg = checkKzbg(table['b'], table['d'], Lmm)
+    if lateralSupport:
+        kL = 1
+    else:
+        Cb = checkCb(Lmm*kexB, table['d'], table['b'])
+        kL = checkKL(Cb, table['E'], Fb)
+        kL = np.where(table['d'] / table['b'] < 2.5, 1, kL)
+        
+        # Beams with Cb over 50 are not permitted, and have no resistance.
+        kL = np.where(kL < 0, np.nan, kL)
+    Mr = checkGlulamMr(table['Sx'], Fb, kzbg, kL, 1, phi)
+    wMr = 8*Mr / L**2
+    
+    # Vr only applies to beams with a volume less than 2.0 m^3.
+    Vr = checkGlulamShearSimple(table['A'], Fv, phi)
+    Wr = checkGlulamWr(table['A'], Fv, Lmm, Cv, phi)
+    wVr = np.where(table['A']*Lmm < 2.0*1e9, 2*Vr / L, 0)
+    return wMr, np.maximum(wVr, Wr / L)
+
+
+def getGlulamFactoredLoads(sections:list[SectionRectangle], 
+                           spans:np.ndarray, knet:float|np.ndarray = 1,
+                           lateralSupport:bool = True, kexB:float = 1.92,
+                           Cv:float = 3.69) -> (np.ndarray, np.ndarray):
+    """
+    Returns the factored uniform load resistance of simply supported glulam
+    beams for many spans at once, in kN/m. The shear resistance is the 
+    larger of checkVrGlulamBeamSimple and checkWrGlulamBeamSimple, where Vr
+    is only used for beams with a volume less than 2.0 m^3.
+    
+    For laterally supported beams, the moment resistance is the same as 
+    checkMrGlulamBeamSimple. For unsupported beams, the effective length 
+    used for Cb is the span times kexB, while checkMrGlulamBeamSimple uses 
+    the element length Lx directly, so the element check will give a larger
+    resistance unless Lx is set to the effective length. Loads are NaN where
+    Cb is greater than 50, as these beams are not permitted.
+    
+    Only strong axis bending is considered.
+
+    Parameters
+    ----------
+    sections : list[SectionRectangle]
+        The glulam sections to check, i.e. the output of loadGlulamSections.
+    spans : np.ndarray
+        The span lengths in m.
+    knet : float|np.ndarray, optional
+        The product of all standard k factors, including kd, kse, etc. 
+        Arrays are broadcast against the spans. The default is 1.
+    lateralSupport : bool, optional
+        A flag that is set equal to true if the compression edge of the 
+        beams has continuous lateral support. The default is True.
+    kexB : float, optional
+        The factor that converts the span into the effective length for 
+        laterally unsupported beams, see table 7.4. The default is 1.92.
+    Cv : float, optional
+        The shear-load coefficient used for Wr. The default is 3.69.
+
+    Returns
+    -------
+    wMr : np.ndarray
+        The factored load resistance for moment, in kN/m, with shape 
+        (Nsection, Nspan).
+    wVr : np.ndarray
+        The factored load resistance for shear, in kN/m, with shape 
+        (Nsection, Nspan).
+
+    """
+    table = _getGlulamTable(sections)
+    L = np.atleast_1d(np.asarray(spans, dtype=float))
+    wMr, wVr = _getGlulamFactoredLoads(table, L, knet, lateralSupport, kexB, Cv)
+    return wMr / 1000, wVr / 1000
+
+
+def getGlulamLoadTable(sections:list[SectionRectangle], spans:np.ndarray,
+                       knet:float|np.ndarray = 1, limits:np.ndarray = None,
+                       lateralSupport:bool = True, kexB:float = 1.92,
+                       Cv:float = 3.69) -> (np.ndarray, np.ndarray):
+    """
+    Makes a load table for simply supported glulam beams, i.e. the largest 
+    uniform load each beam can carry at each span. The factored load 
+    resistance is the lesser of the moment and shear resistance from 
+    getGlulamFactoredLoads. Deflection does not include shear deformation.
+
+    Parameters
+    ----------
+    sections : list[SectionRectangle]
+        The glulam sections to check, i.e. the output of loadGlulamSections.
+    spans : np.ndarray
+        The span lengths in m.
+    knet : float|np.ndarray, optional
+        The product of all standard k factors, including kd, kse, etc. 
+        Arrays are broadcast against the spans. The default is 1.
+    limits : np.ndarray, optional
+        The deflection limits to check, i.e. 360 for L/360. The default is 
+        None, which doesn't check deflection.
+    lateralSupport : bool, optional
+        A flag that is set equal to true if the compression edge of the 
+        beams has continuous lateral support. The default is True.
+    kexB : float, optional
+        The factor that converts the span into the effective length for 
+        laterally unsupported beams, see table 7.4. The default is 1.92.
+    Cv : float, optional
+        The shear-load coefficient used for Wr. The default is 3.69.
+
+    Returns
+    -------
+    wr : np.ndarray
+        The factored load resistance in kN/m, with shape (Nsection, Nspan).
+    wDelta : np.ndarray
+        The specified load that causes a deflection of L / limit in kN/m,
+        with shape (Nsection, Nspan, Nlimit). If limits is None, this is 
+        None.
+
+    """
+    wMr, wVr = getGlulamFactoredLoads(sections, spans, knet, lateralSupport,
+                                      kexB, Cv)
+    wr = np.minimum(wMr, wVr)
+    if limits is None:
+        return wr, None
+    
+    table = _getGlulamTable(sections)
+    EI = table['E']*table['Ix'] / 1e6
+    L = np.atleast_1d(np.asarray(spans, dtype=float))
+    limits = np.atleast_1d(np.asarray(limits, dtype=float))
+    
+    # Deflection is linear in the load, so the load for each limit is found
+    # by scaling the deflection from a unit load.
+    deltaUnit = getMaxDeflection(EI, np.inf, 1, L)
+    wDelta = (L / deltaUnit)[..., None] / limits / 1000
+    return wr, wDelta
+
+
+def _getStrengthSpans(table:dict, w:np.ndarray, knet:float|np.ndarray, 
+                      Cv:float) -> np.ndarray:
+    """
+    Returns the maximum span of laterally supported beams for factored 
+    loads w in N/m, found in closed form. Each resistance is a power of the 
+    span, so each limit can be solved directly.
+    """
+    phi = _getphi(False)
+    A = table['A']
+    Mr0 = phi*table['fb']*knet*table['Sx'] / 1000
+    
+    # Mr uses the lesser of kzbg = c*Lmm^-0.1 and kL = 1, and the span is
+    # the lesser of both cases.
+    c = ((130/table['b'])*(610/table['d'])*9100)**0.1
+    LMr1 = (8*Mr0 / w)**0.5
+    LMr2 = (8*c*Mr0*1000**-0.1 / w)**(1/2.1)
+    LMr = np.minimum(LMr1, LMr2)
+    
+    # Wr = K*L^-0.18, and Vr only applies below a volume of 2.0 m^3.
+    Fv = table['fv']*knet
+    K = checkGlulamWr(A, Fv, 1000, Cv, phi)
+    LWr = (K / w)**(1/1.18)
+    LVr = 2*checkGlulamShearSimple(A, Fv, phi) / w
+    LVr = np.minimum(LVr, 2.0*1e9 / A / 1000)
+    return np.minimum(LMr, np.maximum(LWr, LVr))
+
+
+def _bisectSpans(func, w:np.ndarray, upper:np.ndarray, 
+                 Niter:int = 50) -> np.ndarray:
+    """
+    Finds the largest span where func(L) >= w for all items at once, where
+    func decreases with the span. The span is bracketed between 0 and upper.
+    """
+    lower = np.zeros_like(upper)
+    for ii in range(Niter):
+        L = (lower + upper) / 2
+        isValid = func(L) >= w
+        lower = np.where(isValid, L, lower)
+        upper = np.where(isValid, upper, L)
+    return lower
+
+
+def getGlulamSpanTable(sections:list[SectionRectangle], loads:np.ndarray, 
+                       serviceLoads:np.ndarray = None, limits:np.ndarray = 360,
+                       knet:float|np.ndarray = 1, lateralSupport:bool = True, 
+                       kexB:float = 1.92, 
+                       Cv:float = 3.69) -> (np.ndarray, np.ndarray, np.ndarray):
+    """
+    Makes a span table for simply supported glulam beams, i.e. the largest 
+    span of each beam for each uniform load. The span is the lesser of the 
+    strength controlled span, using the resistances from 
+    getGlulamFactoredLoads, and the deflection controlled span.
+    
+    For laterally supported beams, each strength limit is solved in closed 
+    form. Otherwise kL also depends on the span, and spans are found with a
+    vectorized bisection for all sections and loads at once.
+
+    Parameters
+    ----------
+    sections : list[SectionRectangle]
+        The glulam sections to check, i.e. the output of loadGlulamSections.
+    loads : np.ndarray
+        The factored uniform loads in kN/m.
+    serviceLoads : np.ndarray, optional
+        The specified uniform loads used for deflection in kN/m, with the 
+        same shape as loads. The default is None, which doesn't check 
+        deflection.
+    limits : np.ndarray, optional
+        The deflection limits to check, i.e. 360 for L/360. 
+        The default is 360.
+    knet : float|np.ndarray, optional
+        The product of all standard k factors, including kd, kse, etc. 
+        Arrays are broadcast against the loads, i.e. a different kd can be 
+        used for each load. The default is 1.
+    lateralSupport : bool, optional
+        A flag that is set equal to true if the compression edge of the 
+        beams has continuous lateral support. The default is True.
+    kexB : float, optional
+        The factor that converts the span into the effective length for 
+        laterally unsupported beams, see table 7.4. The default is 1.92.
+    Cv : float, optional
+        The shear-load coefficient used for Wr. The default is 3.69.
+
+    Returns
+    -------
+    spans : np.ndarray
+        The governing span in m, with shape (Nsection, Nload, Nlimit).
+    strengthSpans : np.ndarray
+        The strength controlled span in m, with shape (Nsection, Nload).
+    deflectionSpans : np.ndarray
+        The deflection controlled span in m, with shape 
+        (Nsection, Nload, Nlimit). If deflection isn't checked, all values
+        are inf.
+
+    """
+    table = _getGlulamTable(sections)
+    w = np.atleast_1d(np.asarray(loads, dtype=float))*1000
+    limits = np.atleast_1d(np.asarray(limits, dtype=float))
+    
+    strengthSpans = _getStrengthSpans(table, w, knet, Cv)
+    if not lateralSupport:
+        def func(L):
+            wMr, wVr = _getGlulamFactoredLoads(table, L, knet, lateralSupport,
+                                               kexB, Cv)
+            return np.minimum(wMr, wVr)
+        strengthSpans = _bisectSpans(func, w, strengthSpans)
+    
+    if serviceLoads is None:
+        deflectionSpans = np.full(strengthSpans.shape + limits.shape, np.inf)
+    else:
+        ws = np.atleast_1d(np.asarray(serviceLoads, dtype=float))*1000
+        EI = table['E']*table['Ix'] / 1e6
+        deflectionSpans = getMaxDeflectionSpan(EI[..., None], np.inf, 
+                                               ws[:, None], limits)
+    
+    spans = np.minimum(strengthSpans[..., None], deflectionSpans)
+    return spans, strengthSpans, deflectionSpans
@@ -2,4 +2,5 @@ from .section import *
 from .element import *
 from .material import *
 
-from .beamColumn import *
\ No newline at end of file
+from .beamColumn import *
+from .loadTables import *
@@ -5,9 +5,10 @@ Note, right now all limits are calculated at once BEFORE the
 """
 
 from .element import BeamColumnSteelCsa24
-from limitstates import SectionSteel, SteelSectionTypes, DesignDiagram
+from limitstates import (SectionSteel, SteelSectionTypes, DesignDiagram, 
+                         DesignDiagramEnvelope, memoizeSection)
 from typing import Callable
-from numpy import pi, cumsum
+from numpy import pi, cumsum, array, minimum, where
 from enum import IntEnum
 
 """
@@ -168,6 +169,7 @@ def checkTgElement(beam:BeamColumnSteelCsa24):
 # Bending
 # =============================================================================
 
+@memoizeSection
 def classifySection(section:SectionSteel, useX=True, Cf = 0):
     """
     Used to classify a section, returning the worst case section class for 
@@ -610,11 +612,29 @@ def checkBeamMrUnsupportedW(beam:BeamColumnSteelCsa24, omega:float=1,
     Mu = checkSectionMu(beam.section, Lu, omega)*phi
     Mx = checkBeamMrSupported(beam, True, Cf)
     
-    if 0.67*Mx < Mu:
-        return min(1.15*Mx*(1 - 0.28*Mx / Mu), Mx)
+    return getMrUnsupported(Mx, Mu)
 
-    else:
-        return Mu 
+def getMrUnsupported(Mx:float, Mu:float):
+    """
+    Calculates Mr for an unsupported W section according to c.l.13.6.1.a, 
+    from the supported moment resistance and the factored buckling moment.
+    Inputs can be arrays, i.e. Mu for many unbraced lengths.
+
+    Parameters
+    ----------
+    Mx : float
+        The laterally supported moment resistance.
+    Mu : float
+        The critical buckling moment, multiplied by phi.
+
+    Returns
+    -------
+    float
+        The moment resistance, in the same units as the input.
+
+    """
+    Mr = minimum(1.15*Mx*(1 - 0.28*Mx / Mu), Mx)
+    return where(0.67*Mx < Mu, Mr, Mu)[()]
 
     
 def checkBeamMrUnsupported(beam:BeamColumnSteelCsa24, omega2:float=1, 
@@ -739,8 +759,11 @@ def checkMu(E:float, Iy:float, G:float, J:float, Cw:float, Lu:float,
 
 
 def checkOmega(Mmax, Ma, Mb, Mc):
-    
-    return min(4 * Mmax / (Mmax**2 + 4*Ma**2 + 7*Mb**2 + 4*Mc**2)**0.5, 2.5)
+    """
+    Calculates omega2 per c.l. 13.6.1. Arrays of moments can be used to 
+    check several segments at once.
+    """
+    return minimum(4 * Mmax / (Mmax**2 + 4*Ma**2 + 7*Mb**2 + 4*Mc**2)**0.5, 2.5)
     
 
 # =============================================================================
@@ -769,24 +792,26 @@ class SegmentSupportTypes(IntEnum):
     supportsAndTopFlange = 3
     manual = 4
 
-def _getOmegas(bmd, Nspan, Lsegs):
+def _getOmegas(bmd:DesignDiagram|DesignDiagramEnvelope, Nspan, Lsegs):
+    """
+    Returns omega for each span. If an envelope is used, a list of omegas is
+    returned for each load case.
+    """
     
-    omegas = [None]*Nspan
-
-    x1 = x2 = 0
-    for ii in range(Nspan):
-        dx  = Lsegs[ii]
-        x2 = x1 + dx
-        xa = 0.25*dx + x1
-        xb = 0.5*dx + x1
-        xc = 0.75*dx + x1
-        
-        ya, yb, yc = bmd.getForceAtx([xa, xb, xc])
-        ymax = bmd.getMaxForceInRange(x1, x2)
-        omegas[ii] = checkOmega(ymax, ya, yb, yc)
-        x1 = x2
-        
-    return omegas
+    # Query the quarter points and maximum of every span at once.
+    dx = array(Lsegs[:Nspan], dtype=float)
+    x2 = cumsum(dx)
+    x1 = x2 - dx
+    xq = array([0.25*dx + x1, 0.5*dx + x1, 0.75*dx + x1])
+    
+    # For envelopes the load case is the first axis, make it the last.
+    yq = bmd.getForceAtx(xq)
+    if isinstance(bmd, DesignDiagramEnvelope):
+        yq = yq.transpose(1, 0, 2)
+    ya, yb, yc = yq
+    ymax = bmd.getMaxForceInRange(x1, x2)
+    
+    return checkOmega(ymax, ya, yb, yc).tolist()
 
 def getOmega1FromDesignDiagram(bmd:DesignDiagram):
     """
@@ -822,7 +847,7 @@ def getOmega1FromDesignDiagram(bmd:DesignDiagram):
 
 
 def checkMrBeamMultiSpan(element: BeamColumnSteelCsa24, 
-                         bmd: DesignDiagram = None, 
+                         bmd: DesignDiagram | DesignDiagramEnvelope = None, 
                          lateralSupportType: SegmentSupportTypes | int = 3):
     """
     Returns the Mr value for each region of a multiSpanBeam.
@@ -857,8 +882,9 @@ def checkMrBeamMultiSpan(element: BeamColumnSteelCsa24,
     ----------
     element : BeamColumnGlulamCsa19
         The multi-span element to check.
-    bmd : DesignDiagram
-        The bending moment diagram for the load case to be checked.
+    bmd : DesignDiagram | DesignDiagramEnvelope
+        The bending moment diagram for the load case to be checked. If an 
+        envelope is used, every load case in the envelope is checked at once.
     lateralSupportType : SegmentSupportTypes | int, optional
         The type of lateral support condition for bending. The default is 3:
             
@@ -882,6 +908,9 @@ def checkMrBeamMultiSpan(element: BeamColumnSteelCsa24,
         Mr = MrOut[1] from   xOut[0] to xOut[1]
     omega : list[float]
         The omega factor for each span.
+        
+    If an envelope is checked, MrOut and omega contain a list for each load 
+    case in the envelope.
 
     """
         
@@ -928,6 +957,22 @@ def checkMrBeamMultiSpan(element: BeamColumnSteelCsa24,
         
         omegas = _getOmegas(bmd,Nspan,Lsegs)
 
+    if isinstance(bmd, DesignDiagramEnvelope):
+        if lateralSupportType in (1, 3):
+            omegas = [omegas]*len(bmd)
+        MrOut = [_getSpanMr(element, isContinouslyBraced, Ldesign, caseOmegas)
+                 for caseOmegas in omegas]
+    else:
+        MrOut = _getSpanMr(element, isContinouslyBraced, Ldesign, omegas)
+    
+    xOut = cumsum(Lsegs)
+    return MrOut, xOut, omegas
+
+def _getSpanMr(element, isContinouslyBraced, Ldesign, omegas):
+    """
+    Returns Mr for each span of a beam for one set of omega values.
+    """
+    Nspan = len(omegas)
     MrOut = [None]* Nspan
     for ii in range(Nspan):
         spanSupport = isContinouslyBraced[ii]
@@ -938,9 +983,7 @@ def checkMrBeamMultiSpan(element: BeamColumnSteelCsa24,
             omega = omegas[ii]
             Mr = checkBeamMrUnsupported(element, omega, L)
         MrOut[ii] = Mr
-    
-    xOut = cumsum(Lsegs)
-    return MrOut, xOut, omegas
+    return MrOut
 
 
 
@@ -984,8 +1027,8 @@ def getFsWUnstiffened(h:float, tw:float, Fy:float):
         Fs = 0.66*Fy
     elif (r1 < ratio) and (ratio <= 1435/sqrtFy):
         Fs = 670*sqrtFy / ratio
-    elif ratio <= 1014/sqrtFy:
-        Fs = 961200 / (ratio)
+    else:
+        Fs = 961200 / ratio**2
         
     return Fs
 
@@ -1065,6 +1108,7 @@ def _getFsW(section, lfactor, isWebStiffened = False):
 # Compression
 # =============================================================================
 
+@memoizeSection
 def checkCompressionLimits(section:SectionSteel):
     """
     Checks the column agains table 1 compression limits.
@@ -5,13 +5,19 @@ These are largely set up to ease development and provide type hints.
 
 from dataclasses import dataclass
 from typing import Optional
-from limitstates import (Member, initSimplySupportedMember, SectionSteel)
+
+import numpy as np
+
+from limitstates import (Member, initSimplySupportedMember, SectionSteel, 
+                         initMembers)
+from limitstates.objects.element.element import (_getSectionInds, 
+                                                 _copyElementTemplates)
 
 #need to input GypusmRectangleCSA19 directly to avoid circular import errors
 from limitstates import BeamColumn, EleDisplayProps
 
 __all__ = ["DesignPropsSteel24", "BeamColumnSteelCsa24", 
-           "getBeamColumnSteelCsa24"]
+           "getBeamColumnSteelCsa24", "getBeamColumnsSteelCsa24"]
 
 @dataclass
 class DesignPropsSteel24:
@@ -189,6 +195,18 @@ def getBeamColumnSteelCsa24(L:float, section:SectionSteel, lUnit:str='m',
 
     """
     member = initSimplySupportedMember(L, lUnit)
+    designProps = _getDesignPropsSteel24(L, Lx, Ly, Lz, kx, ky, kz, 
+                                         lateralSupport)
+    return BeamColumnSteelCsa24(member, section, designProps)
+
+
+def _getDesignPropsSteel24(L:float, Lx:float, Ly:float, Lz:float, kx:float, 
+                           ky:float, kz:float, 
+                           lateralSupport:bool) -> DesignPropsSteel24:
+    """
+    Returns the design propreties of a single span steel beamcolumn. Design
+    lengths that aren't set use the length of the beamcolumn.
+    """
     designProps = DesignPropsSteel24(lateralSupport=lateralSupport)
     
     if not Lx:
@@ -205,6 +223,88 @@ def getBeamColumnSteelCsa24(L:float, section:SectionSteel, lUnit:str='m',
         Lz = L
     designProps.Lz = Lz
     designProps.setkz(kz)
+    return designProps
 
 
-    return BeamColumnSteelCsa24(member, section, designProps)
+def getBeamColumnsSteelCsa24(L:np.ndarray, sections:list[SectionSteel], 
+                             sectionInds:np.ndarray = None, lUnit:str='m', 
+                             supportCodes:np.ndarray = None, 
+                             supportTypes:list = None,
+                             kx:float = 1, 
+                             ky:float = 1,
+                             kz:float = 1,
+                             lateralSupport:bool = True) -> list[BeamColumnSteelCsa24]:
+    """
+    A function used to return many steel beamcolumns at once, based on 
+    arrays of lengths and section indexes. Each element is the same as the 
+    output of getBeamColumnSteelCsa24. This is much faster than making each
+    element with getBeamColumnSteelCsa24, which helps in parametric studies
+    with a large number of elements.
+    
+    One template element is made for each section with the constructors. 
+    The members, design props and elements are then made without calling 
+    the constructor of each object, and elements with the same section 
+    share the plot configurations of their display props.
+    
+    Making 100,000 elements is about twice as fast as a loop, but takes 
+    more than a second. Most of that time is spent by Python's garbage 
+    collector, which scans the new objects while they are made. The 
+    collector is left enabled, and can be disabled by the user while the 
+    elements are made if more speed is needed.
+    
+    The design lengths Lx, Ly, and Lz of each element are its length.
+    Supports are chosen with support codes, see initMembers. Elements that 
+    use the same section share the same section object.
+
+    Parameters
+    ----------
+    L : np.ndarray
+        The length of each beamcolumn.
+    sections : list[SectionSteel]
+        The sections the beamcolumns use.
+    sectionInds : np.ndarray, optional
+        The index of the section in sections for each beamcolumn. 
+        The default is None, which uses the first section for all elements.
+    lUnit : str, optional
+        The units for the input lengths. The default is 'm'.
+    supportCodes : np.ndarray, optional
+        The index of the supports to use in supportTypes for each member. 
+        The default is None, which uses the first supports for all members.
+    supportTypes : list[tuple[Support, Support]], optional
+        The possible start and end supports. The default is None, which 
+        makes simply supported members.
+    kx : float, optional
+        The k factor in the x direction of the section. The default is 1.
+    ky : float, optional
+        The k factor in the y direction of the section. The default is 1.
+    kz : float, optional
+        The k factor in the z direction of the section. The default is 1.
+    lateralSupport : bool, optional
+        A flag that specifies if the beams are laterally supported. 
+        By default is set to true.
+
+    Returns
+    -------
+    list[BeamColumnSteelCsa24]
+        The output beamcolumn objects.
+
+    """
+    members = initMembers(L, lUnit, supportCodes, supportTypes)
+    Nelement = len(members)
+    sectionInds = _getSectionInds(sections, sectionInds, Nelement)
+    
+    # Matches _getDesignPropsSteel24, without a function call per element.
+    designProps = []
+    for member in members:
+        Lmember = member.L
+        props = DesignPropsSteel24(lateralSupport, kx, ky, kz, 
+                                   Lmember, Lmember, Lmember)
+        props.Lex = Lmember * kx
+        props.Ley = Lmember * ky
+        props.Lez = Lmember * kz
+        designProps.append(props)
+    
+    templates = [getBeamColumnSteelCsa24(1., section, lUnit, kx, ky, kz, 
+                                         lateralSupport = lateralSupport) 
+                 for section in sections]
+    return _copyElementTemplates(templates, sectionInds, members, designProps)
@@ -0,0 +1,285 @@
+"""
+Beam load tables for simply supported steel beams, i.e. the factored
+uniformly distributed load each shape can carry at each span.
+
+Moment and shear resistance that do not depend on the span are found once
+per section with the element checks. Only the lateral torsional buckling
+moment depends on the span, and it's found for all sections and spans at
+once.
+"""
+
+import numpy as np
+
+from .....objects import SectionSteel, SteelSectionTypes
+from .....analysis.spans import getMaxDeflection
+from .element import getBeamColumnsSteelCsa24
+from .beamColumn import (checkBeamMrSupported, checkFsBeam, checkMu,
+                         checkOmega, getMrUnsupported, 
+                         _getSectionClassIfNotSet)
+
+__all__ = ["BeamLoadTable", "getSteelBeamFactoredLoads",
+           "getSteelBeamLoadTable"]
+
+
+class BeamLoadTable:
+    """
+    Stores the factored uniformly distributed load resistance of many beams
+    at many spans, and optionally the specified load that causes a
+    deflection limit. Tables can be written to and read from npz files, so
+    they only need to be made once.
+
+    Loads are in kN/m and spans are in m. Loads are NaN for sections that
+    can't be designed, i.e. class 4 sections.
+
+    Parameters
+    ----------
+    names : list[str]
+        The name of each section.
+    spans : np.ndarray
+        The span of the beams in m, with shape (Nspan,).
+    wMr : np.ndarray
+        The factored load resistance for moment in kN/m, with shape
+        (Nsection, Nspan).
+    wVr : np.ndarray
+        The factored load resistance for shear in kN/m, with shape
+        (Nsection, Nspan).
+    limits : np.ndarray, optional
+        The deflection limits, i.e. 360 for L/360. The default is None.
+    wDelta : np.ndarray, optional
+        The specified load that causes a deflection of L / limit in kN/m,
+        with shape (Nsection, Nspan, Nlimit). The default is None.
+
+    Returns
+    -------
+    None.
+
+    """
+
+    def __init__(self, names:list[str], spans:np.ndarray, wMr:np.ndarray,
+                 wVr:np.ndarray, limits:np.ndarray = None,
+                 wDelta:np.ndarray = None):
+        self.names  = [str(name) for name in names]
+        self.spans  = np.asarray(spans, dtype=float)
+        self.wMr    = np.asarray(wMr, dtype=float)
+        self.wVr    = np.asarray(wVr, dtype=float)
+        self.limits = None
+        self.wDelta = None
+        if limits is not None:
+            self.limits = np.atleast_1d(np.asarray(limits, dtype=float))
+            self.wDelta = np.asarray(wDelta, dtype=float)
+
+    def __repr__(self):
+        return f"<limitstates BeamLoadTable with {len(self.names)} sections and {len(self.spans)} spans>"
+
+    @property
+    def wr(self) -> np.ndarray:
+        """
+        The factored load resistance in kN/m, i.e. the lesser of the moment
+        and shear resistance.
+        """
+        return np.minimum(self.wMr, self.wVr)
+
+    def getSectionIndex(self, name:str) -> int:
+        """
+        Returns the row of a section in the table.
+
+        Parameters
+        ----------
+        name : str
+            The name of the section, i.e. 'W310x39'.
+
+        Returns
+        -------
+        int
+            The index of the section.
+
+        """
+        if name not in self.names:
+            raise Exception(f'Section {name} is not in the load table.')
+        return self.names.index(name)
+
+    def toNPZ(self, fileName:str):
+        """
+        Writes the table to a numpy npz file.
+
+        Parameters
+        ----------
+        fileName : str
+            The name of the output file.
+
+        """
+        data = {'names':np.array(self.names, dtype=str), 'spans':self.spans,
+                'wMr':self.wMr, 'wVr':self.wVr}
+        if self.limits is not None:
+            data['limits'] = self.limits
+            data['wDelta'] = self.wDelta
+        np.savez(fileName, **data)
+
+    @classmethod
+    def fromNPZ(cls, fileName:str):
+        """
+        Reads a table from a numpy npz file written by toNPZ.
+
+        Parameters
+        ----------
+        fileName : str
+            The name of the file to read.
+
+        Returns
+        -------
+        BeamLoadTable
+            The table stored in the file.
+
+        """
+        with np.load(fileName) as data:
+            limits = data['limits'] if 'limits' in data else None
+            wDelta = data['wDelta'] if 'wDelta' in data else None
+            return cls(data['names'], data['spans'], data['wMr'], data['wVr'],
+                       limits, wDelta)
+
+
+def _getSteelTable(sections:list[SectionSteel]) -> dict:
+    """
+    Returns the span independent propreties of each section as arrays with
+    shape (Nsection, 1). Mx and Vr are in Nm and N, other values are in mm
+    and MPa.
+    """
+    N = len(sections)
+    elements = getBeamColumnsSteelCsa24(np.ones(N), sections, np.arange(N))
+
+    names = ['Mx', 'Vr', 'E', 'G', 'Ix', 'Iy', 'J', 'Cw']
+    table = {name:np.zeros(N) for name in names}
+    table['isW'] = np.zeros(N, dtype=bool)
+    for ii, (section, element) in enumerate(zip(sections, elements)):
+        lfactor = section.lConvert('mm')
+        sfactor = section.mat.sConvert('MPa')
+        
+        # Class 4 sections can't be designed for moment.
+        if _getSectionClassIfNotSet(section, True) < 4:
+            table['Mx'][ii] = checkBeamMrSupported(element)
+        else:
+            table['Mx'][ii] = np.nan
+        table['Vr'][ii] = checkFsBeam(element)
+        table['E'][ii]  = section.mat.E * sfactor
+        table['G'][ii]  = section.mat.G * sfactor
+        table['Ix'][ii] = section.Ix * lfactor**4
+        table['Iy'][ii] = section.Iy * lfactor**4
+        table['J'][ii]  = section.J * lfactor**4
+        table['Cw'][ii] = getattr(section, 'Cw', 0) * lfactor**6
+        table['isW'][ii] = section.typeEnum == SteelSectionTypes.w
+    return {name:values[:, None] for name, values in table.items()}
+
+
+def _getOmega2(omega2:float) -> float:
+    """
+    Returns omega2 for a simply supported beam with a uniform load if it
+    isn't set, using the moments at the quarter points of the span.
+    """
+    if omega2 is None:
+        return checkOmega(1, 0.75, 1, 0.75)
+    return omega2
+
+
+def getSteelBeamFactoredLoads(sections:list[SectionSteel], spans:np.ndarray,
+                              lateralSupport:bool = True,
+                              omega2:float = None) -> (np.ndarray, np.ndarray):
+    """
+    Returns the factored uniformly distributed load resistance of simply
+    supported steel beams for many spans at once, in kN/m.
+
+    The moment resistance is the same as checkBeamMrSupported for laterally
+    supported beams, and checkBeamMrUnsupported for unsupported beams, with
+    an unbraced length equal to the span. The shear resistance is the same
+    as checkFsBeam. Only strong axis bending is considered, and the self
+    weight of each beam is not removed.
+
+    Parameters
+    ----------
+    sections : list[SectionSteel]
+        The W or HSS sections to check, i.e. the output of getSteelSections.
+    spans : np.ndarray
+        The span lengths in m.
+    lateralSupport : bool, optional
+        A flag that is set equal to true if the compression flange of the
+        beams has continuous lateral support. The default is True.
+    omega2 : float, optional
+        The moment distribution factor for unsupported beams. The default is
+        None, which uses omega2 for a uniform load on a simple span.
+
+    Returns
+    -------
+    wMr : np.ndarray
+        The factored load resistance for moment, in kN/m, with shape
+        (Nsection, Nspan).
+    wVr : np.ndarray
+        The factored load resistance for shear, in kN/m, with shape
+        (Nsection, Nspan).
+
+    """
+    table = _getSteelTable(sections)
+    L = np.atleast_1d(np.asarray(spans, dtype=float))
+
+    Mr = np.broadcast_to(table['Mx'], (len(sections), len(L)))
+    if not lateralSupport:
+        phi = 0.9
+        with np.errstate(divide='ignore', invalid='ignore'):
+            Mu = checkMu(table['E'], table['Iy'], table['G'], table['J'],
+                         table['Cw'], L*1000, _getOmega2(omega2))*phi / 1000
+            Mr = np.where(table['isW'], getMrUnsupported(table['Mx'], Mu), Mr)
+
+    wMr = 8*Mr / L**2
+    wVr = 2*table['Vr'] / L
+    return wMr / 1000, wVr / 1000
+
+
+def getSteelBeamLoadTable(sections:list[SectionSteel], spans:np.ndarray,
+                          lateralSupport:bool = True, omega2:float = None,
+                          limits:np.ndarray = None) -> BeamLoadTable:
+    """
+    Makes a beam load table for simply supported steel beams, similar to
+    the CISC beam load tables. The factored load resistance is the lesser
+    of the moment and shear resistance from getSteelBeamFactoredLoads.
+    If deflection limits are given, the table also has the specified load
+    that causes each deflection limit.
+
+    The table is found for all sections and spans at once. For example, all
+    W sections in the CISC database with 100 spans can be found in a single
+    call. The output can be saved with BeamLoadTable.toNPZ.
+
+    Parameters
+    ----------
+    sections : list[SectionSteel]
+        The W or HSS sections to check, i.e. the output of getSteelSections.
+    spans : np.ndarray
+        The span lengths in m.
+    lateralSupport : bool, optional
+        A flag that is set equal to true if the compression flange of the
+        beams has continuous lateral support. The default is True.
+    omega2 : float, optional
+        The moment distribution factor for unsupported beams. The default is
+        None, which uses omega2 for a uniform load on a simple span.
+    limits : np.ndarray, optional
+        The deflection limits to check, i.e. 360 for L/360. The default is
+        None, which doesn't check deflection.
+
+    Returns
+    -------
+    BeamLoadTable
+        The load table.
+
+    """
+    L = np.atleast_1d(np.asarray(spans, dtype=float))
+    wMr, wVr = getSteelBeamFactoredLoads(sections, L, lateralSupport, omega2)
+    names = [section.name for section in sections]
+    if limits is None:
+        return BeamLoadTable(names, L, wMr, wVr)
+
+    E = np.array([section.mat.E * section.mat.sConvert('Pa') for section in sections])
+    Ix = np.array([section.Ix * section.lConvert('m')**4 for section in sections])
+    limits = np.atleast_1d(np.asarray(limits, dtype=float))
+
+    # Deflection is linear in the load, so the load for each limit is found
+    # by scaling the deflection from a unit load.
+    deltaUnit = getMaxDeflection((E*Ix)[:, None], np.inf, 1, L)
+    wDelta = (L / deltaUnit)[..., None] / limits / 1000
+    return BeamLoadTable(names, L, wMr, wVr, limits, wDelta)
@@ -0,0 +1,353 @@
+"""
+A column oriented store for the results of design checks.
+
+Each result is a row with an element id, check name, clause, load
+combination, demand, resistance, and utilization. Rows are stored in numpy
+columns that grow as needed, and text fields are stored as integer codes
+into a table of names, so that no python objects are made for each row.
+"""
+
+import numpy as np
+
+__all__ = ["DesignResults"]
+
+_NUMERIC_COLUMNS = ['elementId', 'demand', 'resistance', 'utilization']
+_TEXT_COLUMNS = ['check', 'clause', 'combination']
+
+def _quoteCSV(name:str) -> str:
+    """
+    Quotes a text field for a csv file if it contains a delimiter, quote, or
+    line break. Quotes in the field are doubled.
+    """
+    if any(char in name for char in ',"\n\r'):
+        return '"' + name.replace('"', '""') + '"'
+    return name
+
+class DesignResults:
+    """
+    Stores the results of many design checks in numpy columns. Results can
+    be added one at a time or in bulk, and the columns can be queried for
+    the governing result of each element, or exported to csv or npz files.
+
+    The utilization of each result is abs(demand) / resistance.
+
+    Parameters
+    ----------
+    capacity : int, optional
+        The number of rows to preallocate. The columns double in size each
+        time they are full. The default is 1024.
+
+    Returns
+    -------
+    None.
+
+    """
+
+    def __init__(self, capacity:int = 1024):
+        self.capacity = max(int(capacity), 1)
+        self.N = 0
+
+        self.elementId   = np.zeros(self.capacity, dtype=np.int64)
+        self.demand      = np.zeros(self.capacity)
+        self.resistance  = np.zeros(self.capacity)
+        self.utilization = np.zeros(self.capacity)
+
+        self.codes = {column:np.zeros(self.capacity, dtype=np.int32)
+                      for column in _TEXT_COLUMNS}
+        self.names = {column:[] for column in _TEXT_COLUMNS}
+        self._nameCodes = {column:{} for column in _TEXT_COLUMNS}
+
+    def __len__(self):
+        return self.N
+
+    def __repr__(self):
+        return f"<limitstates DesignResults with {self.N} results>"
+
+    def _grow(self, Nrequired:int):
+        """
+        Resizes the columns so they can hold at least Nrequired rows.
+        """
+        if Nrequired <= self.capacity:
+            return
+        capacity = self.capacity
+        while capacity < Nrequired:
+            capacity *= 2
+
+        for column in _NUMERIC_COLUMNS:
+            values = getattr(self, column)
+            newValues = np.zeros(capacity, dtype=values.dtype)
+            newValues[:self.N] = values[:self.N]
+            setattr(self, column, newValues)
+
+        for column in _TEXT_COLUMNS:
+            newCodes = np.zeros(capacity, dtype=np.int32)
+            newCodes[:self.N] = self.codes[column][:self.N]
+            self.codes[column] = newCodes
+        self.capacity = capacity
+
+    def _getCode(self, column:str, name:str) -> int:
+        """
+        Returns the integer code of a name, adding it to the table of names
+        if it's new.
+        """
+        name = str(name)
+        nameCodes = self._nameCodes[column]
+        if name not in nameCodes:
+            nameCodes[name] = len(self.names[column])
+            self.names[column].append(name)
+        return nameCodes[name]
+
+    def _getCodes(self, column:str, names) -> np.ndarray:
+        if isinstance(names, str) or np.ndim(names) == 0:
+            return self._getCode(column, names)
+        return np.array([self._getCode(column, name) for name in names], dtype=np.int32)
+
+    def add(self, elementId:int|np.ndarray, check:str|list[str],
+            clause:str|list[str], combination:str|list[str],
+            demand:float|np.ndarray, resistance:float|np.ndarray):
+        """
+        Adds one or more results. Any input can be an array, in which case
+        all inputs are broadcast to the same length and a row is added for
+        each item. For example, the output of a multi-span check can be
+        added in one call.
+
+        Parameters
+        ----------
+        elementId : int | np.ndarray
+            The id of the element checked.
+        check : str | list[str]
+            The name of the check, i.e. 'Mr'.
+        clause : str | list[str]
+            The code clause used for the check.
+        combination : str | list[str]
+            The name of the load combination.
+        demand : float | np.ndarray
+            The factored demand.
+        resistance : float | np.ndarray
+            The factored resistance.
+
+        """
+        check       = self._getCodes('check', check)
+        clause      = self._getCodes('clause', clause)
+        combination = self._getCodes('combination', combination)
+
+        arrays = np.broadcast_arrays(np.asarray(elementId, dtype=np.int64),
+                                     check, clause, combination,
+                                     np.asarray(demand, dtype=float),
+                                     np.asarray(resistance, dtype=float))
+        arrays = [np.ravel(array) for array in arrays]
+        elementId, check, clause, combination, demand, resistance = arrays
+
+        Nnew = len(demand)
+        self._grow(self.N + Nnew)
+        rows = slice(self.N, self.N + Nnew)
+
+        self.elementId[rows]  = elementId
+        self.demand[rows]     = demand
+        self.resistance[rows] = resistance
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.utilization[rows] = np.abs(demand) / resistance
+        self.codes['check'][rows]       = check
+        self.codes['clause'][rows]      = clause
+        self.codes['combination'][rows] = combination
+        self.N += Nnew
+
+    def getColumn(self, column:str) -> np.ndarray:
+        """
+        Returns a column of results. Numeric columns are returned as a view,
+        while text columns are returned as an array of strings.
+
+        Parameters
+        ----------
+        column : str
+            The column name. One of 'elementId', 'check', 'clause',
+            'combination', 'demand', 'resistance', or 'utilization'.
+
+        Returns
+        -------
+        np.ndarray
+            The value of each result.
+
+        """
+        if column in _TEXT_COLUMNS:
+            names = np.array(self.names[column] or [''], dtype=str)
+            return names[self.codes[column][:self.N]]
+        if column in _NUMERIC_COLUMNS:
+            return getattr(self, column)[:self.N]
+        raise Exception(f'{column} is not a valid column.')
+
+    def getMask(self, elementId:int = None, check:str = None,
+                clause:str = None, combination:str = None) -> np.ndarray:
+        """
+        Returns a boolean mask of the results that match all given inputs.
+        Inputs that are None are not used to filter results.
+
+        Returns
+        -------
+        np.ndarray
+            True for each matching result.
+
+        """
+        mask = np.ones(self.N, dtype=bool)
+        if elementId is not None:
+            mask &= self.elementId[:self.N] == elementId
+        for column, name in zip(_TEXT_COLUMNS, [check, clause, combination]):
+            if name is None:
+                continue
+            code = self._nameCodes[column].get(str(name), -1)
+            mask &= self.codes[column][:self.N] == code
+        return mask
+
+    def getGoverningIndex(self, mask:np.ndarray = None) -> int:
+        """
+        Returns the row index of the result with the highest utilization.
+        An exception is raised if there are no results, or no results match
+        the mask.
+
+        Parameters
+        ----------
+        mask : np.ndarray, optional
+            A boolean mask of the results to consider. The default is None,
+            which uses all results.
+
+        Returns
+        -------
+        int
+            The index of the governing result.
+
+        """
+        utilization = self.utilization[:self.N]
+        if mask is None:
+            inds = np.arange(self.N)
+        else:
+            inds = np.flatnonzero(mask)
+        if len(inds) == 0:
+            raise Exception('No results match the mask, there is no governing result.')
+        return int(inds[np.argmax(utilization[inds])])
+
+    def getGoverningByElement(self, check:str = None) -> (np.ndarray, np.ndarray):
+        """
+        Returns the governing result for each element, i.e. the result with
+        the highest utilization.
+
+        Parameters
+        ----------
+        check : str, optional
+            If given, only results for this check are considered.
+            The default is None.
+
+        Returns
+        -------
+        elementIds : np.ndarray
+            The id of each element, in ascending order.
+        inds : np.ndarray
+            The row index of the governing result for each element.
+
+        """
+        inds = np.arange(self.N)
+        if check is not None:
+            inds = inds[self.getMask(check = check)]
+
+        elementIds = self.elementId[inds]
+        order = np.lexsort((-self.utilization[inds], elementIds))
+        sortedIds = elementIds[order]
+        isFirst = np.ones(len(order), dtype=bool)
+        isFirst[1:] = sortedIds[1:] != sortedIds[:-1]
+        return sortedIds[isFirst], inds[order[isFirst]]
+
+    def getFailures(self, limit:float = 1.) -> np.ndarray:
+        """
+        Returns the row index of each result with a utilization above the
+        limit.
+
+        Parameters
+        ----------
+        limit : float, optional
+            The limiting utilization. The default is 1.
+
+        Returns
+        -------
+        np.ndarray
+            The index of each failing result.
+
+        """
+        return np.flatnonzero(self.utilization[:self.N] > limit)
+
+    def toCSV(self, fileName:str, fmt:str = '%.6g'):
+        """
+        Writes all results to a csv file, with one row per result. Text 
+        fields that contain commas, quotes or line breaks are quoted.
+
+        Parameters
+        ----------
+        fileName : str
+            The name of the output file.
+        fmt : str, optional
+            The format used for demand, resistance and utilization.
+            The default is '%.6g'.
+
+        """
+        # Only the table of names is quoted, not each row.
+        textValues = []
+        for column in _TEXT_COLUMNS:
+            names = np.array([_quoteCSV(name) for name in self.names[column]] or [''], 
+                             dtype=str)
+            textValues.append(names[self.codes[column][:self.N]])
+        
+        columns = ['elementId'] + _TEXT_COLUMNS + _NUMERIC_COLUMNS[1:]
+        values = ([self.getColumn('elementId')] + textValues 
+                  + [self.getColumn(column) for column in _NUMERIC_COLUMNS[1:]])
+        dtype = [(column, value.dtype) for column, value in zip(columns, values)]
+        table = np.empty(self.N, dtype=dtype)
+        for column, value in zip(columns, values):
+            table[column] = value
+
+        fmts = ['%d'] + ['%s']*len(_TEXT_COLUMNS) + [fmt]*(len(_NUMERIC_COLUMNS) - 1)
+        np.savetxt(fileName, table, fmt=fmts, delimiter=',',
+                   header=','.join(columns), comments='')
+
+    def toNPZ(self, fileName:str):
+        """
+        Writes all results to a numpy npz file. Text columns are stored as
+        integer codes, along with the table of names for each code.
+
+        Parameters
+        ----------
+        fileName : str
+            The name of the output file.
+
+        """
+        data = {column:self.getColumn(column) for column in _NUMERIC_COLUMNS}
+        for column in _TEXT_COLUMNS:
+            data[column + 'Codes'] = self.codes[column][:self.N]
+            data[column + 'Names'] = np.array(self.names[column], dtype=str)
+        np.savez(fileName, **data)
+
+    @classmethod
+    def fromNPZ(cls, fileName:str):
+        """
+        Reads results from a numpy npz file written by toNPZ.
+
+        Parameters
+        ----------
+        fileName : str
+            The name of the file to read.
+
+        Returns
+        -------
+        DesignResults
+            The results stored in the file.
+
+        """
+        with np.load(fileName) as data:
+            N = len(data['demand'])
+            results = cls(N)
+            for column in _NUMERIC_COLUMNS:
+                getattr(results, column)[:N] = data[column]
+            for column in _TEXT_COLUMNS:
+                results.codes[column][:N] = data[column + 'Codes']
+                names = [str(name) for name in data[column + 'Names']]
+                results.names[column] = names
+                results._nameCodes[column] = {name:ii for ii, name in enumerate(names)}
+        results.N = N
+        return results
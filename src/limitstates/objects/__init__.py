@@ -4,7 +4,33 @@ from .element import *
 from .section import *
 from .material import *
 from .parse import *
-
-from .read import *
 from .display import *
-from .output import *
+from .loads import *
+
+import importlib as _importlib
+
+# Reading databases requires pandas, and outputs require matplotlib and 
+# planesections. These are only imported the first time they are used.
+_lazyImports = {"getSteelSections":'.read', 
+                "getRectangularSections":'.read', 
+                "convertSectionTable":'.read',
+                "plotSection":'.output', 
+                "plotElementSection":'.output', 
+                "SectionRenderer":'.output', 
+                "renderSections":'.output', 
+                "convertBeamColumnToPlanesections":'.output',
+                "convertBeamColumnsToPlanesections":'.output',
+                "analyzeBeamColumns":'.output',
+                "GeomBuffer":'.output',
+                "getGeomBuffer":'.output',
+                "exportGeometry":'.output',
+                "readGeomBuffer":'.output'}
+
+def __getattr__(name:str):
+    if name in _lazyImports:
+        module = _importlib.import_module(_lazyImports[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return list(globals()) + list(_lazyImports)
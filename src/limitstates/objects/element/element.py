@@ -1,12 +1,15 @@
 
-from dataclasses import dataclass
+from copy import copy
+from dataclasses import dataclass, fields
 from typing import Optional
 
-from .. geometry import Member, initSimplySupportedMember
+import numpy as np
+
+from .. geometry import Member, initSimplySupportedMember, initMembers
 from .. section import SectionAbstract
 from .. display import EleDisplayProps
 
-__all__ = ["BeamColumn", "getBeamColumn"]
+__all__ = ["BeamColumn", "getBeamColumn", "getBeamColumns", "getElementStiffness"]
 
 
 class UserProps(dict):
@@ -56,6 +59,10 @@ class Element1D:
         This includes information necessary for makign plots or rendering 
         geometry. The default is None.
 
+    Stiffness values are cached for each set of output units, and the cache
+    is cleared when a new section is assigned to the element. If the section
+    is modified in place, clearStiffnessCache should be called.
+
     Returns
     -------
     None.
@@ -70,6 +77,33 @@ class Element1D:
     @property
     def mat(self):
         return self.section.mat
+
+    @property
+    def section(self) -> SectionAbstract:
+        return self._section
+
+    @section.setter
+    def section(self, section:SectionAbstract):
+        self._section = section
+        self._stiffnessCache = {}
+
+    def clearStiffnessCache(self):
+        """
+        Clears the cached stiffness values of the element. This only needs 
+        to be called if the section of the element is modified in place.
+        """
+        self._stiffnessCache = {}
+
+    def _getStiffness(self, stiffnessType:str, lUnit:str, sUnit:str):
+        """
+        Returns a cached stiffness value of the section, i.e. 'EIx'.
+        """
+        key = (stiffnessType, lUnit, sUnit)
+        cache = self._stiffnessCache
+        if key not in cache:
+            getter = getattr(self.section, 'get' + stiffnessType)
+            cache[key] = getter(lUnit = lUnit, sUnit = sUnit)
+        return cache[key]
      
     def getEIx(self, lUnit:str='m', sUnit:str='Pa'):
         """
@@ -89,7 +123,7 @@ class Element1D:
             The EIx for the section.
 
         """        
-        return self.section.getEIx(sUnit, lUnit)  
+        return self._getStiffness('EIx', lUnit, sUnit)  
 
     def getEIy(self, lUnit:str='m', sUnit:str='Pa'):
         """
@@ -109,7 +143,7 @@ class Element1D:
             The EIy for the section.
 
         """        
-        return self.section.getEIy(sUnit, lUnit)
+        return self._getStiffness('EIy', lUnit, sUnit)
 
     def getGAx(self, lUnit:str='m', sUnit:str='Pa'):
         """
@@ -130,7 +164,7 @@ class Element1D:
 
         """
         
-        return self.section.getGAx(sUnit, lUnit)
+        return self._getStiffness('GAx', lUnit, sUnit)
 
     def getGAy(self, lUnit:str='m', sUnit:str='Pa'):
         """
@@ -150,7 +184,7 @@ class Element1D:
             The GAy for the section.
 
         """
-        return self.section.getGAy(sUnit, lUnit)    
+        return self._getStiffness('GAy', lUnit, sUnit)    
     
     def getLength(self):
         """
@@ -168,8 +202,8 @@ class Element1D:
             The length units to output Ay in. The default is 'm'.
         
         """
-        slconvert = self.section.lConvert.convert(lUnit)
-        blconvert = self.member.lConvert.convert(lUnit)        
+        slconvert = self.section.lConvert(lUnit)
+        blconvert = self.member.lConvert(lUnit)
         return self.member.L * self.section.A* slconvert**2 * blconvert
 
     def _initProps(self, designProps, userProps, eleDisplayProps):
@@ -271,3 +305,168 @@ def getBeamColumn(L:float, section:SectionAbstract, lUnit:str='m',
     return BeamColumn(member, section, designProps, **kwargs)
 
 
+def _getSectionInds(sections:list[SectionAbstract], sectionInds:np.ndarray, 
+                    Nelement:int) -> np.ndarray:
+    """
+    Returns the index of each element's section, and checks that the indexes
+    are valid.
+    """
+    if sectionInds is None:
+        sectionInds = 0
+    sectionInds = np.broadcast_to(np.asarray(sectionInds, dtype=int), (Nelement,))
+    if Nelement and (sectionInds.min() < 0 or len(sections) <= sectionInds.max()):
+        raise Exception('Section indexes must be valid indexes of sections.')
+    return sectionInds
+
+
+def _copyElementTemplates(templates:list[Element1D], templateInds:np.ndarray,
+                          members:list[Member], designProps:list) -> list:
+    """
+    Makes many elements from template elements, which are made with their
+    constructors. Each element gets its own member, design props, user 
+    props and display props, and shares the section of its template. 
+    
+    The constructors of the elements are skipped, and the plot 
+    configurations of the display props are shared with the template, 
+    so no configurations are made for each element.
+    """
+    templateData = []
+    for template in templates:
+        display = template.eleDisplayProps
+        # The section and member are the first two display props fields.
+        displayArgs = [getattr(display, field.name) for field in fields(display) 
+                       if field.init][2:]
+        templateData.append((type(template), template.section, type(display), 
+                             displayArgs))
+    
+    newObject = object.__new__
+    elements = []
+    for ind, member, props in zip(templateInds.tolist(), members, designProps):
+        cls, section, displayCls, displayArgs = templateData[ind]
+        # Matches BeamColumn.__init__
+        element = newObject(cls)
+        element.member = member
+        element._section = section
+        element._stiffnessCache = {}
+        element.designProps = props
+        element.userProps = UserProps()
+        element.eleDisplayProps = displayCls(section, member, *displayArgs)
+        elements.append(element)
+    return elements
+
+
+def _copyDesignProps(template, Nelement:int) -> list:
+    """
+    Makes a copy of a design props dataclass for each element, using its 
+    constructor. Attributes set after the template was made are copied 
+    to each element. Lists, dicts and sets are copied, so they are not 
+    shared between elements.
+    """
+    def _copyValue(value):
+        if isinstance(value, (list, dict, set)):
+            return copy(value)
+        return value
+
+    cls = type(template)
+    initNames = [field.name for field in fields(template) if field.init]
+    extraNames = [name for name in vars(template) if name not in initNames]
+    designProps = []
+    for ii in range(Nelement):
+        props = cls(**{name:_copyValue(getattr(template, name)) for name in initNames})
+        for name in extraNames:
+            setattr(props, name, _copyValue(getattr(template, name)))
+        designProps.append(props)
+    return designProps
+
+
+def getBeamColumns(L:np.ndarray, sections:list[SectionAbstract], 
+                   sectionInds:np.ndarray = None, lUnit:str='m', 
+                   supportCodes:np.ndarray = None, supportTypes:list = None,
+                   designProps:dataclass = None) -> list[BeamColumn]:
+    """
+    A function used to return many beamcolumns at once, based on arrays of
+    lengths and section indexes, for parametric studies with a large number
+    of elements. One template element is made for each section with the 
+    BeamColumn constructor, and the elements are made from the templates 
+    without calling the constructor. Elements that use the same section 
+    share the plot configurations of their display props.
+    
+    Supports are chosen with support codes, see initMembers. Elements that 
+    use the same section share the same section object.
+
+    Parameters
+    ----------
+    L : np.ndarray
+        The length of each beamcolumn.
+    sections : list[SectionAbstract]
+        The sections the beamcolumns use.
+    sectionInds : np.ndarray, optional
+        The index of the section in sections for each beamcolumn. 
+        The default is None, which uses the first section for all elements.
+    lUnit : str, optional
+        The units for the input lengths. The default is 'm'.
+    supportCodes : np.ndarray, optional
+        The index of the supports to use in supportTypes for each member. 
+        The default is None, which uses the first supports for all members.
+    supportTypes : list[tuple[Support, Support]], optional
+        The possible start and end supports. The default is None, which 
+        makes simply supported members.
+    designProps : dataclass, optional
+        Design propreties that are copied to each element. The default is 
+        None.
+
+    Returns
+    -------
+    list[BeamColumn]
+        The output beamcolumn objects.
+
+    """
+    members = initMembers(L, lUnit, supportCodes, supportTypes)
+    Nelement = len(members)
+    sectionInds = _getSectionInds(sections, sectionInds, Nelement)
+    if designProps is None:
+        designProps = DefaultDesignProps()
+    elementProps = _copyDesignProps(designProps, Nelement)
+    
+    templateMember = initSimplySupportedMember(1., lUnit)
+    templates = [BeamColumn(templateMember, section) for section in sections]
+    return _copyElementTemplates(templates, sectionInds, members, elementProps)
+
+
+def getElementStiffness(elements:list[Element1D], 
+                        stiffnessTypes:list[str] = ('EIx', 'EIy', 'GAx', 'GAy'),
+                        lUnit:str='m', sUnit:str='Pa') -> dict[str, np.ndarray]:
+    """
+    Returns the stiffness of many elements as arrays. Each unique section 
+    is only evaluated once, so elements that share a section object share 
+    the same calculation.
+
+    Parameters
+    ----------
+    elements : list[Element1D]
+        The elements to get the stiffness of.
+    stiffnessTypes : list[str], optional
+        The stiffness values to return. Any of 'EIx', 'EIy', 'GAx', and 'GAy'.
+        The default is ('EIx', 'EIy', 'GAx', 'GAy').
+    lUnit : str, optional
+        The length units to output in. The default is 'm'.
+    sUnit : str, optional
+        The stress units to output in. The default is 'Pa'.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        The value of each stiffness type for each element.
+
+    """
+    sectionValues = {}
+    rows = []
+    for element in elements:
+        sectionId = id(element.section)
+        if sectionId not in sectionValues:
+            sectionValues[sectionId] = [element._getStiffness(stiffnessType, lUnit, sUnit) 
+                                        for stiffnessType in stiffnessTypes]
+        rows.append(sectionValues[sectionId])
+        
+    values = np.array(rows, dtype=float).reshape(len(rows), len(stiffnessTypes))
+    return {stiffnessType:values[:, ii] for ii, stiffnessType in enumerate(stiffnessTypes)}
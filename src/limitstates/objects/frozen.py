@@ -0,0 +1,150 @@
+"""
+Internal helpers used to make read only copies of limitstates objects, and
+to compare objects by their content.
+
+A read only copy uses a generated subclass of the object's class, so objects
+that are never frozen pay no cost when their attributes are set.
+"""
+
+from enum import Enum
+from math import isnan
+from types import MethodType
+
+import numpy as np
+
+# Attributes that are not part of an object's content. Converters are shared
+# singletons, and plot geometry is only used for output. Classes with caches
+# that are derived from their other attributes list them in _cacheAttrs.
+_ignoredAttrs = {'lConverter', 'sConverter', 'rhoConverter', 'plotGeom',
+                 '_contentKey', '_contentHash'}
+
+_frozenClasses = {}
+
+class _FrozenObject:
+    """
+    A mixin for read only objects, which blocks changes to attributes.
+    Copies and pickles of a frozen object use the original class, and can be
+    modified.
+    """
+    _baseClass:type
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'{self!r} is read only and can not be modified, copy it first.')
+
+    def __delattr__(self, name):
+        raise AttributeError(f'{self!r} is read only and can not be modified, copy it first.')
+
+    def __reduce_ex__(self, protocol):
+        state = {key:value for key, value in self.__dict__.items()
+                 if key not in ('_contentKey', '_contentHash')}
+        return (object.__new__, (self._baseClass,), state)
+
+def _getFrozenClass(cls:type, mixin:type = _FrozenObject) -> type:
+    """
+    Returns a read only subclass of a class. Each class is only made once.
+    """
+    if (cls, mixin) not in _frozenClasses:
+        attrs = {'_baseClass':cls, '__module__':cls.__module__,
+                 '__qualname__':cls.__qualname__, '__doc__':cls.__doc__}
+        _frozenClasses[(cls, mixin)] = type(cls)(cls.__name__, (mixin, cls), attrs)
+    return _frozenClasses[(cls, mixin)]
+
+def _getBaseClass(obj) -> type:
+    return getattr(type(obj), '_baseClass', type(obj))
+
+def _isFrozen(obj) -> bool:
+    return isinstance(obj, _FrozenObject)
+
+def _freezeValue(value, memo:dict, replace = None):
+    """
+    Returns a read only copy of an attribute value. Objects are frozen along
+    with everything they contain, lists become tuples, and arrays become read
+    only copies. Objects that appear more than once are only frozen once, 
+    using memo. If replace returns a value for an object, it's used instead.
+    """
+    key = id(value)
+    if key in memo:
+        return memo[key]
+    
+    if isinstance(value, (type, Enum)) or _isFrozen(value):
+        out = value
+    elif replace and replace(value) is not None:
+        out = replace(value)
+    elif isinstance(value, np.ndarray):
+        out = value.copy()
+        out.flags.writeable = False
+    elif isinstance(value, (list, tuple)):
+        out = tuple(_freezeValue(item, memo, replace) for item in value)
+    elif isinstance(value, dict):
+        out = {name:_freezeValue(item, memo, replace) for name, item in value.items()}
+    elif isinstance(value, MethodType):
+        out = MethodType(value.__func__, _freezeValue(value.__self__, memo, replace))
+    elif hasattr(value, '__dict__') and not callable(value):
+        out = _freeze(value, memo = memo, replace = replace)
+    else:
+        out = value
+    memo[key] = out
+    return out
+
+def _freeze(obj, mixin:type = _FrozenObject, attrs:dict = None, 
+            memo:dict = None, replace = None):
+    """
+    Returns a read only copy of an object. Attributes in attrs replace the
+    attributes of the original object.
+    
+    Objects nested in the original object, such as the layers of a CLT 
+    section, are also frozen, so they can't be changed through either the 
+    original or the frozen object. Shared converters are kept, and caches 
+    listed in _cacheAttrs start empty.
+    """
+    if memo is None:
+        memo = {}
+    frozenObj = object.__new__(_getFrozenClass(type(obj), mixin))
+    memo[id(obj)] = frozenObj
+    
+    cacheAttrs = getattr(type(obj), '_cacheAttrs', ())
+    state = {}
+    for name, value in vars(obj).items():
+        if name in _ignoredAttrs:
+            state[name] = value
+        elif name in cacheAttrs:
+            state[name] = type(value)()
+        else:
+            state[name] = _freezeValue(value, memo, replace)
+    if attrs:
+        state.update(attrs)
+    object.__setattr__(frozenObj, '__dict__', state)
+    return frozenObj
+
+def _getKeyValue(value):
+    """
+    Converts a value to a hashable value that can be compared. NaN values
+    are replaced, as NaN is not equal to itself, and objects are compared by
+    their content.
+    """
+    if isinstance(value, float) and isnan(value):
+        return ('nan',)
+    if isinstance(value, Enum):
+        return value
+    if isinstance(value, (list, tuple)):
+        return tuple(_getKeyValue(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _getKeyValue(item)) for key, item in value.items()))
+    if isinstance(value, np.ndarray):
+        return ('ndarray', value.dtype.str, value.shape, value.tobytes())
+    if hasattr(value, '_contentKey'):
+        return value._contentKey
+    if hasattr(value, '__dict__') and not isinstance(value, type):
+        return _getContentKey(value)
+    return value
+
+def _getContentKey(obj) -> tuple:
+    """
+    Returns a key that is equal for objects with the same class and content.
+    Methods and shared converters are not included.
+    """
+    cacheAttrs = getattr(type(obj), '_cacheAttrs', ())
+    props = [(key, _getKeyValue(value)) for key, value in vars(obj).items()
+             if key not in _ignoredAttrs and key not in cacheAttrs 
+             and not callable(value)]
+    return (_getBaseClass(obj), tuple(sorted(props, key = lambda item: item[0])))
@@ -4,14 +4,15 @@ independant of any type of design
 """
 
 from dataclasses import dataclass, field
+
 from .support import Support, SupportTypes2D
-from .. units import ConverterLength
+from .. units import ConverterLength, lengthConverter
 import numpy as np
 
 
 __all__ = ['Node', 'getLengthNodes',
            'Line', 'getLineFromNodes', 'getLineFromLength',
-           'Member', 'initSimplySupportedMember']
+           'Member', 'initSimplySupportedMember', 'initMembers']
 
 @dataclass()
 class Node:
@@ -242,7 +243,7 @@ class Member:
         Inititiates the unit of the section.
         """
         self.lUnit      = lUnit
-        self.lConverter = ConverterLength()
+        self.lConverter = lengthConverter
     
     def lConvert(self, outputUnit:str):
         """
@@ -331,13 +332,111 @@ def initSimplySupportedMember(L:float, lUnit:str) -> Member:
 
     """
     
+    return _initSingleSpanMember(L, lUnit, SupportTypes2D.PINNED.value, 
+                                 SupportTypes2D.ROLLER.value)
+
+
+def _initSingleSpanMember(L:float, lUnit:str, start:Support, 
+                          end:Support) -> Member:
+    """
+    Returns a single span member of length L that starts at the origin, with
+    the input supports at the start and end node.
+    """
     line = getLineFromLength(L, lUnit)
-    line.n1.setSupportType(SupportTypes2D.PINNED.value)
-    line.n2.setSupportType(SupportTypes2D.ROLLER.value)
+    line.n1.setSupportType(start)
+    line.n2.setSupportType(end)
     nodes = [line.n1, line.n2]
     return Member(nodes, [line], lUnit)
 
 
+def initMembers(L:np.ndarray, lUnit:str = 'm', supportCodes:np.ndarray = None,
+                supportTypes:list[tuple[Support, Support]] = None) -> list[Member]:
+    """
+    Initializes many single span members at once, each starting at the 
+    origin and lying along the x axis. With the default supports, the result
+    is the same as calling initSimplySupportedMember for each length.
+    
+    Members are made without calling Line.__post_init__ or 
+    Member.__post_init__, because the length and span types of each member
+    are known in advance. The span types come from one template member made
+    for each pair of supports. This is much faster for large numbers of 
+    members. The node locations of all members are views of one array.
+    
+    The support of each member end is chosen with an integer code, which 
+    is the index of a pair of start and end supports in supportTypes. 
+    Support objects are shared between members and should not be modified.
+
+    Parameters
+    ----------
+    L : np.ndarray
+        The length of each member.
+    lUnit : str, optional
+        The units to be used by the members and lines. The default is 'm'.
+    supportCodes : np.ndarray, optional
+        The index of the supports to use in supportTypes for each member. 
+        The default is None, which uses the first supports for all members.
+    supportTypes : list[tuple[Support, Support]], optional
+        The possible start and end supports. The default is None, 
+        which uses a pinned start and roller end, i.e. a simply supported 
+        member.
+
+    Returns
+    -------
+    list[Member]
+        The output members.
+
+    """
+    L = np.atleast_1d(np.asarray(L, dtype=float))
+    Nmember = len(L)
+    
+    if supportTypes is None:
+        supportTypes = [(SupportTypes2D.PINNED.value, SupportTypes2D.ROLLER.value)]
+    if supportCodes is None:
+        supportCodes = 0
+    supportCodes = np.broadcast_to(np.asarray(supportCodes, dtype=int), (Nmember,))
+    if Nmember and (supportCodes.min() < 0 or len(supportTypes) <= supportCodes.max()):
+        raise Exception('Support codes must be valid indexes of supportTypes.')
+    
+    # The span types are found once for each pair of supports.
+    isCantilevers = [_initSingleSpanMember(1., lUnit, start, end).isCantilever
+                     for start, end in supportTypes]
+    
+    points = np.zeros((Nmember, 2, 3))
+    points[:, 1, 0] = L
+    
+    newObject = object.__new__
+    members = []
+    for Lmember, code, p1, p2 in zip(L.tolist(), supportCodes.tolist(), 
+                                     points[:, 0], points[:, 1]):
+        start, end = supportTypes[code]
+        n1 = Node(p1, lUnit, None, start)
+        n2 = Node(p2, lUnit, None, end)
+        
+        # Matches getLineFromLength, without computing the length.
+        line = newObject(Line)
+        line.n1 = n1
+        line.n2 = n2
+        line.units = 'm'
+        line.label = None
+        line.L = Lmember
+        
+        # Matches Member.__post_init__ for a single span member.
+        member = newObject(Member)
+        member.nodes = [n1, n2]
+        member.curves = [line]
+        member.lUnit = lUnit
+        member.label = None
+        member.loadData = None
+        member.analysisData = None
+        member.lConverter = lengthConverter
+        member.L = Lmember
+        member.Nspan = 1
+        member.isMultiSpan = False
+        member.isCantilever = isCantilevers[code].copy()
+        members.append(member)
+    return members
+
+
 
 # =============================================================================
 # Experimental classes, 
@@ -372,7 +471,7 @@ class Surface:
         Inititiates the unit of the section.
         """
         self.lUnit      = lUnit
-        self.lConverter = ConverterLength()
+        self.lConverter = lengthConverter
     
     def lConvert(self, outputUnit:str):
         """
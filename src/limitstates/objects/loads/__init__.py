@@ -0,0 +1,2 @@
+from .case import *
+from .combination import *
@@ -0,0 +1,106 @@
+"""
+Represents load cases, i.e. the member forces caused by a single source of
+load. Load cases are code neutral, and are factored by load combinations.
+"""
+
+import numpy as np
+
+__all__ = ["LoadCase"]
+
+class LoadCase:
+    """
+    Stores the member forces caused by a single source of load, such as dead
+    load or snow load. Forces are stored as arrays at a set of stations along
+    the member, with one array per type of force, i.e. 'M' for moment or 'V'
+    for shear.
+
+    All load cases that are combined together must share the same stations.
+
+    Parameters
+    ----------
+    name : str
+        The name of the load case.
+    loadType : str
+        The type of load, used to find the load factor in each combination.
+        Common types are 'D', 'L', 'Lr', 'S', 'R', 'W', and 'E'.
+    x : np.ndarray, optional
+        The station locations forces are reported at. The default is None.
+    forces : dict[str, np.ndarray], optional
+        A dictionary of forces at each station. The default is None.
+
+    Returns
+    -------
+    None.
+
+    """
+
+    def __init__(self, name:str, loadType:str, x:np.ndarray = None,
+                 forces:dict[str, np.ndarray] = None):
+        self.name = name
+        self.loadType = loadType
+        self.x = None
+        if x is not None:
+            self.x = np.asarray(x, dtype=float)
+
+        self.forces = {}
+        if forces:
+            for forceType, values in forces.items():
+                self.setForces(forceType, values)
+
+    def __repr__(self):
+        return f"<limitstates LoadCase {self.name}, type {self.loadType}>"
+
+    def setForces(self, forceType:str, values:np.ndarray):
+        """
+        Sets the force at each station for one type of force.
+
+        Parameters
+        ----------
+        forceType : str
+            The type of force, i.e. 'M' or 'V'.
+        values : np.ndarray
+            The force at each station.
+
+        """
+        values = np.asarray(values, dtype=float)
+        if self.x is not None and len(values) != len(self.x):
+            raise Exception(f'Expected {len(self.x)} force values, recieved {len(values)}.')
+        self.forces[forceType] = values
+
+    def setDiagram(self, forceType:str, diagram):
+        """
+        Sets the forces for one type of force from a design diagram. The
+        stations of the load case are set to the x values of the diagram.
+
+        Parameters
+        ----------
+        forceType : str
+            The type of force, i.e. 'M' or 'V'.
+        diagram : DesignDiagram
+            The diagram to use.
+
+        """
+        x = diagram.xy[:, 0]
+        if self.forces and not np.array_equal(x, self.x):
+            raise Exception('The diagram must use the same stations as the existing forces in the load case.')
+        self.x = np.array(x, dtype=float)
+        self.forces[forceType] = np.array(diagram.xy[:, 1], dtype=float)
+
+    def getForces(self, forceType:str) -> np.ndarray:
+        """
+        Returns the force at each station for one type of force.
+
+        Parameters
+        ----------
+        forceType : str
+            The type of force, i.e. 'M' or 'V'.
+
+        Returns
+        -------
+        np.ndarray
+            The force at each station.
+
+        """
+        if forceType not in self.forces:
+            raise Exception(f'Load case {self.name} has no forces of type {forceType}.')
+        return self.forces[forceType]
@@ -1,3 +1,262 @@
+"""
+Represents load combinations, and the factored demands they produce.
 
+Each combination is a set of load factors. Factoring many load cases for
+many combinations is done with a single matrix product between the factor
+matrix, with shape (Ncombo, Ncase), and the stacked forces of each case,
+with shape (Ncase, Nstation).
+"""
 
+import numpy as np
 
+from .case import LoadCase
+
+__all__ = ["LoadCombination", "getFactorMatrix", "getCaseForces",
+           "getFactoredDemands", "getNbccCombinations",
+           "getAsce7Combinations"]
+
+class LoadCombination:
+    """
+    Represents a single load combination, as a set of load factors. Factors
+    can be specified for a type of load, i.e. 'D', or the name of a specific
+    load case. If both are given, the factor for the case name is used.
+    Load cases not in the combination have a factor of zero.
+
+    Parameters
+    ----------
+    name : str
+        The name of the load combination.
+    factors : dict[str, float]
+        The load factor for each load type or load case name.
+
+    Returns
+    -------
+    None.
+
+    """
+
+    def __init__(self, name:str, factors:dict[str, float]):
+        self.name = name
+        self.factors = dict(factors)
+
+    def __repr__(self):
+        return f"<limitstates LoadCombination {self.name}>"
+
+    def getFactor(self, case:LoadCase) -> float:
+        """
+        Returns the load factor for a load case.
+
+        Parameters
+        ----------
+        case : LoadCase
+            The load case to factor.
+
+        Returns
+        -------
+        float
+            The load factor.
+
+        """
+        if case.name in self.factors:
+            return self.factors[case.name]
+        return self.factors.get(case.loadType, 0.)
+
+
+def getFactorMatrix(combinations:list[LoadCombination],
+                    cases:list[LoadCase]) -> np.ndarray:
+    """
+    Returns the load factor of each case in each combination.
+
+    Parameters
+    ----------
+    combinations : list[LoadCombination]
+        The load combinations.
+    cases : list[LoadCase]
+        The load cases.
+
+    Returns
+    -------
+    np.ndarray
+        The load factors, with shape (Ncombo, Ncase).
+
+    """
+    return np.array([[combo.getFactor(case) for case in cases]
+                     for combo in combinations], dtype=float)
+
+
+def getCaseForces(cases:list[LoadCase], forceType:str) -> np.ndarray:
+    """
+    Stacks the forces of several load cases into a single array.
+
+    Parameters
+    ----------
+    cases : list[LoadCase]
+        The load cases, which must share the same stations.
+    forceType : str
+        The type of force, i.e. 'M' or 'V'.
+
+    Returns
+    -------
+    np.ndarray
+        The forces of each case, with shape (Ncase, Nstation).
+
+    """
+    forces = [case.getForces(forceType) for case in cases]
+    if len(set(len(values) for values in forces)) > 1:
+        raise Exception('All load cases must have the same number of stations.')
+    return np.array(forces)
+
+
+def getFactoredDemands(cases:list[LoadCase],
+                       combinations:list[LoadCombination],
+                       forceType:str = 'M') -> np.ndarray:
+    """
+    Returns the factored force at each station for every load combination.
+
+    Parameters
+    ----------
+    cases : list[LoadCase]
+        The load cases, which must share the same stations.
+    combinations : list[LoadCombination]
+        The load combinations.
+    forceType : str, optional
+        The type of force, i.e. 'M' or 'V'. The default is 'M'.
+
+    Returns
+    -------
+    np.ndarray
+        The factored demands, with shape (Ncombo, Nstation).
+
+    """
+    return getFactorMatrix(combinations, cases) @ getCaseForces(cases, forceType)
+
+
+# Each entry is the principal load, followed by the load factors. Where there
+# are several possible companion loads, each option is a seperate entry.
+_NBCC20_COMBINATIONS = [
+    (None, {'D':1.4}),
+    ('L',  {'D':1.25, 'L':1.5}),
+    ('L',  {'D':1.25, 'L':1.5, 'S':1.0}),
+    ('L',  {'D':1.25, 'L':1.5, 'W':0.4}),
+    ('S',  {'D':1.25, 'S':1.5}),
+    ('S',  {'D':1.25, 'S':1.5, 'L':1.0}),
+    ('S',  {'D':1.25, 'S':1.5, 'W':0.4}),
+    ('W',  {'D':1.25, 'W':1.4}),
+    ('W',  {'D':1.25, 'W':1.4, 'L':0.5}),
+    ('W',  {'D':1.25, 'W':1.4, 'S':0.5}),
+    ('E',  {'D':1.0,  'E':1.0, 'L':0.5, 'S':0.25}),
+    # Dead load counteracting the principal load.
+    ('L',  {'D':0.9,  'L':1.5}),
+    ('L',  {'D':0.9,  'L':1.5, 'S':1.0}),
+    ('L',  {'D':0.9,  'L':1.5, 'W':0.4}),
+    ('S',  {'D':0.9,  'S':1.5}),
+    ('S',  {'D':0.9,  'S':1.5, 'L':1.0}),
+    ('S',  {'D':0.9,  'S':1.5, 'W':0.4}),
+    ('W',  {'D':0.9,  'W':1.4}),
+    ('W',  {'D':0.9,  'W':1.4, 'L':0.5}),
+    ('W',  {'D':0.9,  'W':1.4, 'S':0.5}),
+]
+
+_ASCE7_16_COMBINATIONS = [
+    (None, {'D':1.4}),
+    ('L',  {'D':1.2, 'L':1.6}),
+    ('L',  {'D':1.2, 'L':1.6, 'Lr':0.5}),
+    ('L',  {'D':1.2, 'L':1.6, 'S':0.5}),
+    ('L',  {'D':1.2, 'L':1.6, 'R':0.5}),
+    ('Lr', {'D':1.2, 'Lr':1.6, 'L':1.0}),
+    ('Lr', {'D':1.2, 'Lr':1.6, 'W':0.5}),
+    ('S',  {'D':1.2, 'S':1.6, 'L':1.0}),
+    ('S',  {'D':1.2, 'S':1.6, 'W':0.5}),
+    ('R',  {'D':1.2, 'R':1.6, 'L':1.0}),
+    ('R',  {'D':1.2, 'R':1.6, 'W':0.5}),
+    ('W',  {'D':1.2, 'W':1.0, 'L':1.0}),
+    ('W',  {'D':1.2, 'W':1.0, 'L':1.0, 'Lr':0.5}),
+    ('W',  {'D':1.2, 'W':1.0, 'L':1.0, 'S':0.5}),
+    ('W',  {'D':1.2, 'W':1.0, 'L':1.0, 'R':0.5}),
+    ('E',  {'D':1.2, 'E':1.0, 'L':1.0, 'S':0.2}),
+    ('W',  {'D':0.9, 'W':1.0}),
+    ('E',  {'D':0.9, 'E':1.0}),
+]
+
+
+def _getCombinationName(factors:dict[str, float]) -> str:
+    return ' + '.join(f'{factor:g}{loadType}' for loadType, factor in factors.items())
+
+
+def _getCombinations(table:list, loadTypes:list[str]) -> list[LoadCombination]:
+    """
+    Makes the combinations in a table for a set of load types. Combinations
+    where the principal load isn't present are skipped, as are combinations
+    that duplicate another combination once missing loads are removed.
+    """
+    if loadTypes is None:
+        loadTypes = set(loadType for _, factors in table for loadType in factors)
+    loadTypes = set(loadTypes)
+
+    factorSets = []
+    for principal, factors in table:
+        if principal is not None and principal not in loadTypes:
+            continue
+        factors = {loadType:factor for loadType, factor in factors.items()
+                   if loadType in loadTypes}
+        factorSets.append(factors)
+
+    combinations = []
+    usedFactors = []
+    for factors in factorSets:
+        if factors in usedFactors or not factors:
+            continue
+        usedFactors.append(factors)
+        combinations.append(LoadCombination(_getCombinationName(factors), factors))
+    return combinations
+
+
+def getNbccCombinations(loadTypes:list[str] = None) -> list[LoadCombination]:
+    """
+    Returns the ultimate limit state load combinations of NBCC 2020,
+    Table 4.1.3.2.A. Where there are several possible companion loads, each
+    option is a seperate combination. For combinations 2 to 4, combinations
+    are also returned with a dead load factor of 0.9, for cases where dead
+    load counteracts the principal load.
+
+    Load types are 'D', 'L', 'S', 'W', and 'E'.
+
+    Parameters
+    ----------
+    loadTypes : list[str], optional
+        The load types present, i.e. [case.loadType for case in cases].
+        Only combinations for these loads are returned. The default is None,
+        which returns combinations for all load types.
+
+    Returns
+    -------
+    list[LoadCombination]
+        The load combinations.
+
+    """
+    return _getCombinations(_NBCC20_COMBINATIONS, loadTypes)
+
+
+def getAsce7Combinations(loadTypes:list[str] = None) -> list[LoadCombination]:
+    """
+    Returns the strength design load combinations of ASCE 7-16,
+    section 2.3.1. Where there are several possible companion loads, each
+    option is a seperate combination. Earthquake loads are represented by a
+    single load type, i.e. E = Eh + Ev.
+
+    Load types are 'D', 'L', 'Lr', 'S', 'R', 'W', and 'E'.
+
+    Parameters
+    ----------
+    loadTypes : list[str], optional
+        The load types present, i.e. [case.loadType for case in cases].
+        Only combinations for these loads are returned. The default is None,
+        which returns combinations for all load types.
+
+    Returns
+    -------
+    list[LoadCombination]
+        The load combinations.
+
+    """
+    return _getCombinations(_ASCE7_16_COMBINATIONS, loadTypes)
@@ -2,9 +2,17 @@
 The material library contains material models
 """
 
-from ... units import ConverterStress, ConverterDensity
+import weakref
 
-__all__ = ["MaterialAbstract", "MaterialElastic"]
+from ... units import stressConverter, densityConverter
+from .. frozen import _freeze, _getContentKey, _isFrozen
+
+__all__ = ["MaterialAbstract", "MaterialElastic", "internMaterial", 
+           "isInterned"]
+
+# Interned materials, keyed by their class and properties. Materials are 
+# removed once nothing else references them.
+_internedMaterials = weakref.WeakValueDictionary()
 
 class MaterialAbstract:
     """
@@ -28,9 +36,9 @@ class MaterialAbstract:
         """
 
         self.sUnit      = sUnit
-        self.sConverter = ConverterStress()
+        self.sConverter = stressConverter
         self.rhoUnit  = rhoUnit
-        self.rhoConverter = ConverterDensity()
+        self.rhoConverter = densityConverter
     
     def sConvert(self, outputUnit:str):
         """
@@ -103,4 +111,57 @@ class MaterialElastic(MaterialAbstract):
         
         self.name = name
 
-          
\ No newline at end of file
+
+def internMaterial(mat:MaterialAbstract) -> MaterialAbstract:
+    """
+    Returns a single shared instance for materials with the same class and 
+    properties. The first time a set of properties is interned, a read only 
+    copy of the material is made, and that copy is returned for every later 
+    material with the same properties. Many elements can then share one 
+    material, and identical materials can be compared with "is".
+    
+    Interned materials can not be modified. Copies made with copy.copy or
+    pickle are normal materials, which can be modified.
+    
+    Materials with properties that can't be hashed are returned unchanged.
+
+    Parameters
+    ----------
+    mat : MaterialAbstract
+        The material to intern.
+
+    Returns
+    -------
+    MaterialAbstract
+        The shared material.
+
+    """
+    try:
+        key = _getContentKey(mat)
+        matOut = _internedMaterials.get(key)
+    except TypeError:
+        return mat
+    
+    if matOut is None:
+        if not _isFrozen(mat):
+            mat = _freeze(mat)
+        _internedMaterials[key] = mat
+        matOut = mat
+    return matOut
+
+def isInterned(mat:MaterialAbstract) -> bool:
+    """
+    Returns true if the material is a shared, read only material.
+
+    Parameters
+    ----------
+    mat : MaterialAbstract
+        The material to check.
+
+    Returns
+    -------
+    bool
+        True if the material has been interned.
+
+    """
+    return _isFrozen(mat)
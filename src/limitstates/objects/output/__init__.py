@@ -1,8 +1,29 @@
 """
 A module that can be used to create outputs, i.e. renderings / takeoffs
+
+Plotting requires matplotlib, and conversion requires planesections. These 
+are only imported the first time they are used.
 """
 
-from .pyplot import plotSection, plotElementSection
-from .convert import convertBeamColumnToPlanesections
+import importlib as _importlib
+
+_lazyImports = {"plotSection":'.pyplot', 
+                "plotElementSection":'.pyplot', 
+                "SectionRenderer":'.pyplot', 
+                "renderSections":'.pyplot', 
+                "convertBeamColumnToPlanesections":'.convert',
+                "convertBeamColumnsToPlanesections":'.convert',
+                "analyzeBeamColumns":'.convert',
+                "GeomBuffer":'.export',
+                "getGeomBuffer":'.export',
+                "exportGeometry":'.export',
+                "readGeomBuffer":'.export'}
 
+def __getattr__(name:str):
+    if name in _lazyImports:
+        module = _importlib.import_module(_lazyImports[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
+def __dir__():
+    return list(globals()) + list(_lazyImports)
@@ -3,66 +3,242 @@ Contains a number of converters that can be used to export beams
 
 """
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Callable, Hashable
+
 import planesections as ps
 import numpy as np
 # from limitstates import Node, Support
 
 from .. section import SectionMonolithic
 from .. element import BeamColumn
+from ...analysis import DesignDiagram
 
 
-
-def convertBeamColumnToPlanesections(element: BeamColumn, meshSize: int = 100,
-                                     lUnit = 'm', sUnit = 'Pa'):
+def _getSectionProps(section:SectionMonolithic, lUnit:str, sUnit:str):
     """
-    All output elements will be lines
-    
-    The input line must have nodes along the x axis only.
+    Returns E, G, A, Ix, Iy, J for a section in the output units.
     """
-    
-    # Create the secton
-    section  = element.section
-    
     if not isinstance(section, SectionMonolithic):
         raise Exception('Only Monolotihic sections can currently be converted.')
     
     # Convert the section regular propreties
-    sfactor = element.section.mat.sConvert(sUnit)
-    E = element.section.mat.E * sfactor
-    G = element.section.mat.G * sfactor
+    sfactor = section.mat.sConvert(sUnit)
+    E = section.mat.E * sfactor
+    G = section.mat.G * sfactor
     
     # Convert the section geometry propreties
-    slfactor = element.section.lConvert(lUnit)
-    A  = element.section.A  * slfactor ** 2
-    Ix = element.section.Ix * slfactor ** 4
-    Iy = element.section.Iy * slfactor ** 4
-    J  = element.section.J  * slfactor ** 4
-    analysisSection = ps.SectionBasic(E, G, A, Ix, Iy, J)
+    slfactor = section.lConvert(lUnit)
+    A  = section.A  * slfactor ** 2
+    Ix = section.Ix * slfactor ** 4
+    Iy = section.Iy * slfactor ** 4
+    J  = section.J  * slfactor ** 4
+    return E, G, A, Ix, Iy, J
+
+
+@lru_cache(maxsize=256)
+def _getMesh(L:float, meshSize:int) -> np.ndarray:
+    mesh = np.linspace(0, L, meshSize)
+    mesh.flags.writeable = False
+    return mesh
+
 
+def _buildBeam(sectionProps, xNodes, fixities, labels, meshSize):
+    """
+    Builds a planesections beam from the section propreties and the nodes.
+    """
+    analysisSection = ps.SectionBasic(*sectionProps)
+    
     # begin beam construction
     beam  = ps.EulerBeam(section = analysisSection)
     
-    nodes  = element.member.nodes
-    xNodes = [node.p1[0] for node in nodes]
-    L = max(xNodes)
-    
     # Add the base meshpoints
-    x       = np.linspace(0, L, meshSize)
-    beam.addNodes(x)
+    L = max(xNodes)
+    beam.addNodes(list(_getMesh(L, meshSize)))
     
     # Add the special nodes with fixity
-    fixities = [list(node.support.fixity) for node in nodes]
-    labels   = [node.label for node in nodes]
-    
-    beam.addNodes(xNodes, fixities, labels)
+    beam.addNodes(list(xNodes), [list(fixity) for fixity in fixities], list(labels))
+    return beam
+
+
+def _getNodeData(element: BeamColumn):
+    nodes    = element.member.nodes
+    xNodes   = tuple(node.p1[0] for node in nodes)
+    fixities = tuple(tuple(node.support.fixity) for node in nodes)
+    labels   = tuple(node.label for node in nodes)
+    return xNodes, fixities, labels
 
+
+def convertBeamColumnToPlanesections(element: BeamColumn, meshSize: int = 100,
+                                     lUnit = 'm', sUnit = 'Pa'):
+    """
+    All output elements will be lines
     
-    return beam
+    The input line must have nodes along the x axis only.
+    """
+    
+    sectionProps = _getSectionProps(element.section, lUnit, sUnit)
+    xNodes, fixities, labels = _getNodeData(element)
+    
+    return _buildBeam(sectionProps, xNodes, fixities, labels, meshSize)
+
+
+def _getBeamSignature(element: BeamColumn, lUnit:str, sUnit:str, 
+                      loadKey:Hashable = None):
+    """
+    Returns a key that is identical for elements that give the same 
+    planesections model.
+    """
+    sectionProps = _getSectionProps(element.section, lUnit, sUnit)
+    xNodes, fixities, _ = _getNodeData(element)
+    return sectionProps, element.member.lUnit, xNodes, fixities, loadKey
 
-# analysisBeam = o86.
+
+def convertBeamColumnsToPlanesections(elements: list[BeamColumn], 
+                                      meshSize: int = 100,
+                                      lUnit = 'm', sUnit = 'Pa', 
+                                      loadKeys:list[Hashable] = None):
+    """
+    Converts many elements to planesections beams. Elements with the same 
+    section propreties, node locations and supports share a single beam,
+    which is only built once.
+
+    Parameters
+    ----------
+    elements : list[BeamColumn]
+        The elements to convert.
+    meshSize : int, optional
+        The number of mesh points used for each beam. The default is 100.
+    lUnit : str, optional
+        The length unit used for the beams. The default is 'm'.
+    sUnit : str, optional
+        The stress unit used for the beams. The default is 'Pa'.
+    loadKeys : list[Hashable], optional
+        A key describing the loads on each element. Elements with different
+        keys are not grouped together. The default is None, which groups 
+        elements by geometry only.
+
+    Returns
+    -------
+    beams : list[ps.EulerBeam]
+        The beam for each unique model.
+    beamInds : list[int]
+        The index of the beam used by each element.
+    loadKeysOut : list[Hashable]
+        The load key of each beam.
+
+    """
+    if loadKeys is None:
+        loadKeys = [None]*len(elements)
+    
+    signatureInds = {}
+    beams = []
+    beamInds = []
+    loadKeysOut = []
+    for element, loadKey in zip(elements, loadKeys):
+        signature = _getBeamSignature(element, lUnit, sUnit, loadKey)
+        ind = signatureInds.get(signature)
+        if ind is None:
+            ind = len(beams)
+            signatureInds[signature] = ind
+            sectionProps, _, xNodes, fixities, _ = signature
+            labels = _getNodeData(element)[2]
+            beams.append(_buildBeam(sectionProps, xNodes, fixities, labels, 
+                                    meshSize))
+            loadKeysOut.append(loadKey)
+        beamInds.append(ind)
     
+    return beams, beamInds, loadKeysOut
+
+
+def _analyzeBeam(beam, analyzer):
+    """
+    Runs the analysis of a loaded beam, and returns the BMD and SFD as xy 
+    arrays. This is used by each process when analyzing in parallel.
+    """
+    analyzer(beam).runAnalysis(recordOutput = True)
+    xyBMD = np.column_stack(beam.getBMD())
+    xySFD = np.column_stack(beam.getSFD())
+    return xyBMD, xySFD
+
+
+def analyzeBeamColumns(elements: list[BeamColumn],
+                       applyLoads: Callable,
+                       loadKeys:list[Hashable] = None,
+                       meshSize: int = 100,
+                       lUnit = 'm', sUnit = 'Pa',
+                       analyzer = ps.OpenSeesAnalyzer2D,
+                       Nprocess:int = 1):
+    """
+    Analyzes many elements with planesections. Elements with identical 
+    models are only analyzed once, see
+    :func:`convertBeamColumnsToPlanesections <limitstates.objects.output.convert.convertBeamColumnsToPlanesections>`.
     
-        
-# import planesections as ps
+    The bending moment and shear force diagrams are stored in each 
+    element's member.analysisData, with the keys 'bmd' and 'sfd'. Elements
+    in the same group share the same diagram objects. The x values of each
+    diagram use the length units of the element's member.
 
-# ps.
+    Parameters
+    ----------
+    elements : list[BeamColumn]
+        The elements to analyze.
+    applyLoads : Callable
+        A function that applies the loads to a planesections beam. It is 
+        called as applyLoads(beam, loadKey) for each unique beam.
+    loadKeys : list[Hashable], optional
+        A key describing the loads on each element, which is passed to 
+        applyLoads. The default is None.
+    meshSize : int, optional
+        The number of mesh points used for each beam. The default is 100.
+    lUnit : str, optional
+        The length unit used for the beams. The default is 'm'.
+    sUnit : str, optional
+        The stress unit used for the beams. The default is 'Pa'.
+    analyzer : optional
+        The planesections analyzer class to use. The default is 
+        ps.OpenSeesAnalyzer2D.
+    Nprocess : int, optional
+        The number of processes used to run the analyses. The default is 1.
+
+    Returns
+    -------
+    bmds : list[DesignDiagram]
+        The bending moment diagram of each element.
+    sfds : list[DesignDiagram]
+        The shear force diagram of each element.
+
+    """
+    beams, beamInds, loadKeysOut = convertBeamColumnsToPlanesections(elements, 
+                                            meshSize, lUnit, sUnit, loadKeys)
+    for beam, loadKey in zip(beams, loadKeysOut):
+        applyLoads(beam, loadKey)
+    
+    if Nprocess <= 1 or len(beams) <= 1:
+        results = [_analyzeBeam(beam, analyzer) for beam in beams]
+    else:
+        with ProcessPoolExecutor(min(Nprocess, len(beams))) as executor:
+            results = list(executor.map(_analyzeBeam, beams, 
+                                        [analyzer]*len(beams)))
+    
+    # Node locations aren't converted, so the x values of each diagram are
+    # in the units of the member. Elements in a group share the same units.
+    memberUnits = {ind:element.member.lUnit for element, ind in zip(elements, beamInds)}
+    diagrams = [(DesignDiagram(xyBMD, memberUnits[ii]), 
+                 DesignDiagram(xySFD, memberUnits[ii])) 
+                for ii, (xyBMD, xySFD) in enumerate(results)]
+    
+    bmds = []
+    sfds = []
+    for element, ind in zip(elements, beamInds):
+        bmd, sfd = diagrams[ind]
+        member = element.member
+        if member.analysisData is None:
+            member.analysisData = {}
+        member.analysisData['bmd'] = bmd
+        member.analysisData['sfd'] = sfd
+        bmds.append(bmd)
+        sfds.append(sfd)
+    
+    return bmds, sfds
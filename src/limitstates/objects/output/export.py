@@ -0,0 +1,214 @@
+"""
+Exports the outlines of many sections or elements to a single binary buffer,
+which can be used by web viewers or other programs.
+
+The buffer stores all outlines as one flat array of verticies, with an array
+of offsets marking where each outline starts. The binary layout is 
+little-endian, and contains:
+    
+    - an 8 byte header, b'LSGEOM' followed by two null bytes.
+    - four uint32 values: the version, number of outlines, number of 
+      verticies and number of elements.
+    - the offsets, as Noutline + 1 uint32 values.
+    - the element index of each outline, as Noutline uint32 values.
+    - the verticies, as Nvert x 2 float32 values.
+
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from .. section import SectionAbstract
+from .. element import BeamColumn
+from .model import _plotGeomFactory
+
+__all__ = ["GeomBuffer", "getGeomBuffer", "exportGeometry", "readGeomBuffer"]
+
+_HEADER  = b'LSGEOM\x00\x00'
+_VERSION = 1
+_UINT    = np.dtype('<u4')
+_FLOAT   = np.dtype('<f4')
+
+
+@dataclass
+class GeomBuffer:
+    """
+    Stores the outlines of many objects in flat arrays.
+
+    Parameters
+    ----------
+    verticies : np.ndarray
+        The (Nvert, 2) array of x/y points for every outline.
+    offsets : np.ndarray
+        The index of the first vertex of each outline, followed by the total
+        number of verticies. Outline ii uses verticies offsets[ii] to 
+        offsets[ii + 1].
+    elementInds : np.ndarray
+        The index of the input object each outline belongs to.
+    Nelement : int, optional
+        The number of input objects, including objects without outlines. 
+        The default is None, which uses one more than the largest element 
+        index.
+
+    """
+    verticies:np.ndarray
+    offsets:np.ndarray
+    elementInds:np.ndarray
+    Nelement:int = None
+    
+    def __post_init__(self):
+        if self.Nelement is None:
+            self.Nelement = int(self.elementInds.max()) + 1 if len(self.elementInds) else 0
+    
+    def __len__(self):
+        return len(self.offsets) - 1
+    
+    def getOutline(self, ind:int) -> np.ndarray:
+        """
+        Returns the verticies of a single outline.
+
+        Parameters
+        ----------
+        ind : int
+            The index of the outline.
+
+        Returns
+        -------
+        np.ndarray
+            The (N, 2) array of verticies in the outline.
+
+        """
+        return self.verticies[self.offsets[ind]:self.offsets[ind + 1]]
+    
+    def toBytes(self) -> bytes:
+        """
+        Returns the binary representation of the buffer.
+        """
+        counts = np.array([_VERSION, len(self), len(self.verticies), 
+                           self.Nelement], dtype=_UINT)
+        
+        return b''.join([_HEADER, 
+                         counts.tobytes(), 
+                         self.offsets.astype(_UINT).tobytes(),
+                         self.elementInds.astype(_UINT).tobytes(),
+                         self.verticies.astype(_FLOAT).tobytes()])
+
+
+def getGeomBuffer(objects:list[SectionAbstract|BeamColumn], 
+                  originLocation:int = 1, 
+                  xy0:np.ndarray = None) -> GeomBuffer:
+    """
+    Gets the outlines of a list of sections or elements as a single buffer.
+    For elements, the element's section is used.
+
+    Parameters
+    ----------
+    objects : list[SectionAbstract|BeamColumn]
+        The sections or elements to export.
+    originLocation : int, optional
+        The location of each section's origin, see PlotOriginPosition.
+        The default is 1, which centers each section.
+    xy0 : np.ndarray, optional
+        A (Nobject, 2) array with the position of each object. The default is 
+        None, which places all objects at (0, 0).
+
+    Returns
+    -------
+    GeomBuffer
+        The buffer of all outlines.
+
+    """
+    if xy0 is None:
+        xy0 = np.zeros((len(objects), 2))
+    
+    outlines = []
+    elementInds = []
+    for ii, item in enumerate(objects):
+        section = item.section if isinstance(item, BeamColumn) else item
+        geom = _plotGeomFactory(section, originLocation, xy0[ii])
+        itemOutlines = geom.getOutlines()
+        outlines += itemOutlines
+        elementInds.append(np.full(len(itemOutlines), ii))
+    
+    lengths = np.fromiter((len(outline) for outline in outlines), int, 
+                          len(outlines))
+    offsets = np.zeros(len(outlines) + 1, dtype=int)
+    np.cumsum(lengths, out = offsets[1:])
+    
+    if outlines:
+        verticies = np.concatenate(outlines)
+        elementInds = np.concatenate(elementInds)
+    else:
+        verticies = np.zeros((0, 2))
+        elementInds = np.zeros(0, dtype=int)
+
+    return GeomBuffer(verticies, offsets, elementInds, len(objects))
+
+
+def exportGeometry(objects:list[SectionAbstract|BeamColumn], fileName:str, 
+                   originLocation:int = 1, 
+                   xy0:np.ndarray = None) -> GeomBuffer:
+    """
+    Writes the outlines of a list of sections or elements to a binary file.
+    See :func:`getGeomBuffer <limitstates.objects.output.export.getGeomBuffer>`.
+
+    Parameters
+    ----------
+    objects : list[SectionAbstract|BeamColumn]
+        The sections or elements to export.
+    fileName : str
+        The path of the output file.
+    originLocation : int, optional
+        The location of each section's origin, see PlotOriginPosition.
+        The default is 1, which centers each section.
+    xy0 : np.ndarray, optional
+        A (Nobject, 2) array with the position of each object. The default is 
+        None, which places all objects at (0, 0).
+
+    Returns
+    -------
+    GeomBuffer
+        The buffer that was written.
+
+    """
+    geomBuffer = getGeomBuffer(objects, originLocation, xy0)
+    with open(fileName, 'wb') as f:
+        f.write(geomBuffer.toBytes())
+    return geomBuffer
+
+
+def readGeomBuffer(fileName:str) -> GeomBuffer:
+    """
+    Reads a binary geometry file written by exportGeometry.
+
+    Parameters
+    ----------
+    fileName : str
+        The path of the file to read.
+
+    Returns
+    -------
+    GeomBuffer
+        The buffer of all outlines.
+
+    """
+    with open(fileName, 'rb') as f:
+        data = f.read()
+    
+    if data[:len(_HEADER)] != _HEADER:
+        raise Exception(f'{fileName} is not a limitstates geometry file.')
+    
+    start = len(_HEADER)
+    version, Noutline, Nvert, Nelement = np.frombuffer(data, _UINT, 4, start)
+    if version != _VERSION:
+        raise Exception(f'Geometry file version {version} is not supported.')
+    
+    start += 4*_UINT.itemsize
+    offsets = np.frombuffer(data, _UINT, Noutline + 1, start)
+    start += (Noutline + 1)*_UINT.itemsize
+    elementInds = np.frombuffer(data, _UINT, Noutline, start)
+    start += Noutline*_UINT.itemsize
+    verticies = np.frombuffer(data, _FLOAT, 2*Nvert, start).reshape(-1, 2)
+    
+    return GeomBuffer(verticies, offsets, elementInds, int(Nelement))
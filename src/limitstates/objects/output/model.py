@@ -4,21 +4,73 @@ all classes are unit agnostic.
 
 """
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from math import ceil
-from  .. section import LayerGroupClt
+from  .. section import (LayerGroupClt, SectionAbstract, SectionRectangle, 
+                         SectionSteel, SteelSectionTypes, SectionCLT)
+from .. display import PlotOriginPosition
 
 import numpy as np
 
+
+@lru_cache(maxsize=4096)
+def _getCachedVerticies(geomType:type, shapeKey:tuple, 
+                        methodName:str) -> np.ndarray:
+    """
+    Returns a read only array of verticies for a geometry placed at the 
+    origin. Verticies are cached for each geometry type and set of 
+    dimensions, so repeated shapes are only generated once.
+    """
+    geom  = geomType(**dict(shapeKey))
+    verts = np.ascontiguousarray(getattr(geom, methodName)(), dtype=float)
+    verts.flags.writeable = False
+    return verts
+
+
+@lru_cache(maxsize=None)
+def _getUnitArc(Npoints:int) -> np.ndarray:
+    """
+    Returns Npoints on a quarter circle of radius one, starting at (1, 0) 
+    and ending at (0, 1).
+    """
+    t = np.linspace(0, 1, Npoints)*np.pi/2
+    arc = np.column_stack((np.cos(t), np.sin(t)))
+    arc.flags.writeable = False
+    return arc
+
+
 class GeomModel(ABC):
     """
-    Represents a geometry and can return a set of verticies
+    Represents a geometry and can return a set of verticies.
+    Verticies are returned as (N, 2) arrays of x/y points.
     """
        
     @abstractmethod
     def getVerticies(self):
         pass
     
+    def getOutlines(self) -> list[np.ndarray]:
+        """
+        Returns each closed outline of the geometry as a (N, 2) array.
+        """
+        return [self.getVerticies()]
+    
+    def _getShapeKey(self) -> tuple:
+        """
+        Returns the dimensions of the geometry, excluding it's offset.
+        """
+        return tuple((field.name, getattr(self, field.name)) 
+                     for field in fields(self) 
+                     if field.name not in ('dx0', 'dy0'))
+    
+    def _getOffsetVerticies(self, methodName:str) -> np.ndarray:
+        """
+        Returns the cached verticies at the origin for a method, moved to the 
+        location of the geometry. 
+        """
+        verts = _getCachedVerticies(type(self), self._getShapeKey(), methodName)
+        return verts + (self.dx0, self.dy0)
     
 
 @dataclass
@@ -27,17 +79,15 @@ class GeomModelRectangle(GeomModel):
     h:float
     dx0:float = 0
     dy0:float = 0
-        
-    def getVerticies(self):
-        
-        h = self.h
+    
+    def _getOriginVerticies(self):
         b = self.b
-        dx0 = self.dx0
-        dy0 = self.dy0
-        
-        x = np.array([-b/2, -b/2 , b/2, b/2, -b/2]) + dx0
-        y = np.array([-h/2 , h/2 , h/2,   -h/2,    -h/2])   + dy0
-        return list(x), list(y)
+        h = self.h
+        return np.array([[-b/2, -h/2], [-b/2, h/2], [b/2, h/2], 
+                         [b/2, -h/2], [-b/2, -h/2]])
+    
+    def getVerticies(self) -> np.ndarray:
+        return self._getOffsetVerticies('_getOriginVerticies')
 
    
 
@@ -53,43 +103,35 @@ class GeomModelGlulam(GeomModel):
     dhTarget:float = 38
     dx0:float = 0
     dy0:float = 0
-        
-    def getVerticies(self):
-        
-        h = self.h
+    
+    def _getOriginVerticies(self):
         b = self.b
-        dx0 = self.dx0 
-        dy0 = self.dy0 
+        h = self.h
+        return np.array([[-b/2, -h/2], [-b/2, h/2], [b/2, h/2], 
+                         [b/2, -h/2], [-b/2, -h/2]])
         
-        x = np.array([-b/2, -b/2 , b/2, b/2, -b/2]) + dx0
-        y = np.array([-h/2 , h/2 , h/2,   -h/2,    -h/2])   + dy0 
-        return list(x), list(y)
+    def getVerticies(self) -> np.ndarray:
+        return self._getOffsetVerticies('_getOriginVerticies')
     
-    def getFillVerticies(self):
-        """
-        Returns the verticies for the input fill lines.
-        """
-        
+    def _getOriginFillVerticies(self):
         h = self.h
         b = self.b
-        dx0 = self.dx0
-        dy0 = self.dy0 
-        dhTarget = self.dhTarget
         
-        Nline = ceil(h / dhTarget)
+        Nline = ceil(h / self.dhTarget)
         dh    = h / Nline
-
         
-        x0 = [-b/2  + dx0, b/2 + dx0]
-        xlines = []
-        ylines = []
-        dy = -h/2 + dy0 
-        for ii in range(Nline-1):
-            y = (ii +1)* dh  + dy
-            xlines.append(x0)
-            ylines.append([y, y])
-
-        return xlines, ylines
+        lines = np.zeros((Nline - 1, 2, 2))
+        lines[:, 0, 0] = -b/2
+        lines[:, 1, 0] =  b/2
+        lines[:, :, 1] = (np.arange(1, Nline)*dh - h/2)[:, None]
+        return lines
+    
+    def getFillVerticies(self) -> np.ndarray:
+        """
+        Returns the verticies for the input fill lines, as an array with 
+        shape (Nline, 2, 2).
+        """
+        return self._getOffsetVerticies('_getOriginFillVerticies')
 
 
 
@@ -111,7 +153,7 @@ class GeomModelClt(GeomModel):
     Nboard:int = 8 
     dstart:int = 0.05 
         
-    def getVerticies(self):
+    def getVerticies(self) -> np.ndarray:
         
         # directions = self.cltLayers.
         h = self.cltLayers.d
@@ -126,12 +168,15 @@ class GeomModelClt(GeomModel):
         hmin = -h/2  + dy0
         hmax = h/2 + dy0
         
-        x = [bmin, bmin , bmax, bmax, bmin]
-        y = [hmin, hmax , hmax, hmin, hmin]
-        return x, y
+        return np.array([[bmin, hmin], [bmin, hmax], [bmax, hmax], 
+                         [bmax, hmin], [bmin, hmin]])
     
         
-    def getFillVerticies(self):
+    def getFillVerticies(self) -> np.ndarray:
+        """
+        Returns the verticies for the layer and board lines, as an array with 
+        shape (Nline, 2, 2).
+        """
         
         h = self.cltLayers.d
         b = self.w
@@ -141,14 +186,11 @@ class GeomModelClt(GeomModel):
         boundaries   = h - np.array(self.cltLayers.lBoundaries)
         orientations = self.cltLayers.getLayerOrientations()
         Nlayers      = len(self.cltLayers)
-        # h = [layer.t for layer in self.cltLayers]
 
         
         bmin = -b/2  + dx0
         bmax = b/2 + dx0
-        x0 = [bmin, bmax]
-        xlayers = []
-        ylayers = []
+        lines = []
         
         dstart = b*self.dstart
         Nboard = self.Nboard
@@ -159,19 +201,21 @@ class GeomModelClt(GeomModel):
             ymin = boundaries[ii] -h/2 + dy0  
             ymax = boundaries[ii + 1] -h/2 + dy0
             
-            xlayers.append(x0)
-            ylayers.append([ymax, ymax])
+            lines.append([[bmin, ymax], [bmax, ymax]])
             
             if not ort:
                 for jj in range(Nboard):
-                    xlayers.append([xverticals[jj],xverticals[jj]])
-                    ylayers.append([ymin, ymax])
+                    lines.append([[xverticals[jj], ymin], [xverticals[jj], ymax]])
 
-        return xlayers, ylayers
+        return np.array(lines, dtype=float).reshape(-1, 2, 2)
     
     
     
-    def getFillAreas(self):
+    def getFillAreas(self) -> np.ndarray:
+        """
+        Returns the verticies for the weak axis layers, as an array with 
+        shape (Nlayer, 5, 2).
+        """
         h = self.cltLayers.d
         b = self.w
         dx0 = self.dx0
@@ -180,25 +224,21 @@ class GeomModelClt(GeomModel):
         boundaries  = h - np.array(self.cltLayers.lBoundaries)
         orientations = self.cltLayers.getLayerOrientations()
         Nlayers     = len(self.cltLayers)
-        # h = [layer.t for layer in self.cltLayers]
 
         
         bmin = -b/2  + dx0
         bmax = b/2 + dx0
-        x0 = [bmin, bmax, bmax, bmin, bmin]
-        xlayers = []
-        ylayers = []
+        areas = []
         for ii in range(Nlayers):
             
             ort  = orientations[ii]
             ymin = boundaries[ii] -h/2  + dy0
             ymax = boundaries[ii + 1] -h/2  + dy0
             if not ort:
+                areas.append([[bmin, ymax], [bmax, ymax], [bmax, ymin], 
+                              [bmin, ymin], [bmin, ymax]])
 
-                xlayers.append(x0)
-                ylayers.append([ymax, ymax, ymin, ymin, ymax])
-
-        return xlayers, ylayers
+        return np.array(areas, dtype=float).reshape(-1, 5, 2)
     
     
 
@@ -213,23 +253,23 @@ class GeomModelIbeam(GeomModel):
     dx0:float = 0
     dy0:float = 0
     
-    def getVerticies(self):
-        """ Gets the a list of (x, y) verticies in clockwise order"""
+    def _getOriginVerticies(self):
         h = self.d 
         w = self.bf 
         tw = self.tw 
         tf = self.tf 
-        dx0 = self.dx0
-        dy0 = self.dy0
         
-        x = np.array([-w/2, w/2, w/2, tw/2, tw/2, w/2,  
-                      w/2, -w/2, -w/2, -tw/2, -tw/2, -w/2,
-                      -w/2])
-        y = np.array([ h/2, h/2, h/2 - tf, h/2 - tf, -h/2 + tf,  
+        x = [-w/2, w/2, w/2, tw/2, tw/2, w/2,  
+             w/2, -w/2, -w/2, -tw/2, -tw/2, -w/2,
+             -w/2]
+        y = [ h/2, h/2, h/2 - tf, h/2 - tf, -h/2 + tf,  
              -h/2 + tf, -h/2,-h/2, -h/2+tf, -h/2+tf, h/2-tf, h/2-tf,
-             h/2])
-        
-        return list(x + dx0), list(y + dy0)    
+             h/2]
+        return np.column_stack((x, y))
+    
+    def getVerticies(self) -> np.ndarray:
+        """ Gets the a list of (x, y) verticies in clockwise order"""
+        return self._getOffsetVerticies('_getOriginVerticies')
 
 @dataclass
 class GeomModelIbeamRounded(GeomModel):
@@ -248,83 +288,52 @@ class GeomModelIbeamRounded(GeomModel):
         """
         dx /  dy are direction terms which are either 1 or negative 1
         """
-        
-        x = np.cos(np.linspace(0,1,self.NradiusPoints)*np.pi/2)*dx0*r + x0
-        y = np.sin(np.linspace(0,1,self.NradiusPoints)*np.pi/2)*dy0*r + y0
-        
-        return list(x), list(y)
+        return _getUnitArc(self.NradiusPoints)*(dx0*r, dy0*r) + (x0, y0)
     
-    def getVerticies(self):
-        """ Gets the a list of (x, y) verticies in clockwise order"""
+    def _getOriginVerticies(self):
         h   = self.d 
         w   = self.bf 
         tw  = self.tw 
         tf  = self.tf 
-        dx0  = self.dx0
-        dy0  = self.dy0
         rf:float = self.rf
         rw:float = self.rw
 
         
-        tLeg_x = [-w/2, w/2]
-        tLeg_y = [ h/2, h/2]
+        tLeg = [[-w/2, h/2], [w/2, h/2]]
         
         # Top right flange
-        xCorner = w/2 - rf
-        yCorner = h/2 - tf + rf
-        trfx, trfy = self._getcornerVerticies(xCorner, yCorner, rf, 1, -1)
+        trf = self._getcornerVerticies(w/2 - rf, h/2 - tf + rf, rf, 1, -1)
 
         # Top right web
-        xCorner = tw/2 + rw
-        yCorner = h/2 - tf - rw
-        trwx, trwy = self._getcornerVerticies(xCorner, yCorner, rw, -1, 1)
-        trwx = trwx[::-1]
-        trwy = trwy[::-1]
+        trw = self._getcornerVerticies(tw/2 + rw, h/2 - tf - rw, rw, -1, 1)[::-1]
 
         # Bottom right web
-        xCorner = tw/2 + rw
-        yCorner = -h/2 + tf + rw
-        brwx, brwy = self._getcornerVerticies(xCorner, yCorner, rw, -1, -1)
+        brw = self._getcornerVerticies(tw/2 + rw, -h/2 + tf + rw, rw, -1, -1)
         
         # Bottom right flange
-        xCorner = w/2 - rf
-        yCorner = -h/2 + tf - rf
-        brfx, brfy = self._getcornerVerticies(xCorner, yCorner, rf, 1, 1)
-        brfx = brfx[::-1]
-        brfy = brfy[::-1]
+        brf = self._getcornerVerticies(w/2 - rf, -h/2 + tf - rf, rf, 1, 1)[::-1]
         
         # Bottom leg
-        bLeg_x = [w/2, -w/2]
-        bLeg_y = [-h/2,-h/2]
+        bLeg = [[w/2, -h/2], [-w/2, -h/2]]
         
         # Bottom left flange
-        xCorner = -w/2 + rf
-        yCorner = -h/2 + tf  - rf
-        blfx, blfy = self._getcornerVerticies(xCorner, yCorner, rf, -1, 1)
+        blf = self._getcornerVerticies(-w/2 + rf, -h/2 + tf  - rf, rf, -1, 1)
 
         # Bottom left web
-        xCorner = -tw/2 - rw
-        yCorner = -h/2 + tf +rw 
-        blwx, blwy = self._getcornerVerticies(xCorner, yCorner, rw, 1, -1)
-        blwx = blwx[::-1]
-        blwy = blwy[::-1]
+        blw = self._getcornerVerticies(-tw/2 - rw, -h/2 + tf +rw, rw, 1, -1)[::-1]
         
         # top left web
-        xCorner = -tw/2 - rw
-        yCorner = h/2 - tf - rw
-        tlwx, tlwy = self._getcornerVerticies(xCorner, yCorner, rw, 1, 1)
+        tlw = self._getcornerVerticies(-tw/2 - rw, h/2 - tf - rw, rw, 1, 1)
 
         # top left flange
-        xCorner = -w/2 + rf
-        yCorner = h/2 - tf + rf
-        tlfx, tlfy = self._getcornerVerticies(xCorner, yCorner, rf, -1, -1)                
-        tlfx = tlfx[::-1]
-        tlfy = tlfy[::-1]        
-        
-        x = tLeg_x + trfx + trwx + brwx + brfx + bLeg_x + blfx + blwx + tlwx + tlfx + [-w/2]
-        y = tLeg_y + trfy + trwy + brwy + brfy + bLeg_y + blfy + blwy + tlwy + tlfy  + [ h/2]       
+        tlf = self._getcornerVerticies(-w/2 + rf, h/2 - tf + rf, rf, -1, -1)[::-1]
         
-        return list(np.array(x) + dx0), list(np.array(y) + dy0)
+        return np.concatenate((tLeg, trf, trw, brw, brf, bLeg, blf, blw, 
+                               tlw, tlf, [[-w/2, h/2]]))
+    
+    def getVerticies(self) -> np.ndarray:
+        """ Gets the a list of (x, y) verticies in clockwise order"""
+        return self._getOffsetVerticies('_getOriginVerticies')
 
 
 @dataclass
@@ -347,61 +356,118 @@ class GeomModelHss(GeomModel):
         corner rounding - clockwise, v.s. counterclockwise.
         
         """
-        
-        x = np.sin(np.linspace(0,1,self.NradiusPoints)*np.pi/2)*dx0*r + x0
-        y = np.cos(np.linspace(0,1,self.NradiusPoints)*np.pi/2)*dy0*r + y0
-        
-        return list(x), list(y)
+        return _getUnitArc(self.NradiusPoints)[:, ::-1]*(dx0*r, dy0*r) + (x0, y0)
     
     
     def _getVerticiesRoundedRectangle(self, h, w, r):
-        dx0  = self.dx0
-        dy0  = self.dy0
         
-        tLeg_x = [-w/2 + r]
-        tLeg_y = [ h/2]
+        tLeg = [[-w/2 + r, h/2]]
         
         # Top right flange
-        xCorner = w/2   - r 
-        yCorner = h/2 - r 
-        tr_x, tr_y = self._getcornerVerticies(xCorner, yCorner, r, 1, 1)
-
-        xCorner =  w/2  - r 
-        yCorner = -h/2 +r
-        br_x, br_y = self._getcornerVerticies(xCorner, yCorner, r, 1, -1)        
-        br_x = br_x[::-1]
-        br_y = br_y[::-1]
-        
-        
-        xCorner = -w/2 + r
-        yCorner = -h/2  +r
-        bl_x, bl_y = self._getcornerVerticies(xCorner, yCorner, r, -1, -1)        
-        
-        xCorner = -w/2  + r 
-        yCorner =  h/2 - r
-        tl_x, tl_y = self._getcornerVerticies(xCorner, yCorner, r, -1, 1)            
-        tl_x = tl_x[::-1]
-        tl_y = tl_y[::-1]
+        tr = self._getcornerVerticies(w/2 - r, h/2 - r, r, 1, 1)
+        br = self._getcornerVerticies(w/2 - r, -h/2 + r, r, 1, -1)[::-1]
+        bl = self._getcornerVerticies(-w/2 + r, -h/2 + r, r, -1, -1)        
+        tl = self._getcornerVerticies(-w/2 + r, h/2 - r, r, -1, 1)[::-1]
     
-    
-        x = tLeg_x + tr_x + br_x + bl_x + tl_x 
-        y = tLeg_y + tr_y + br_y + bl_y + tl_y 
-        
-        return list(np.array(x) + dx0), list(np.array(y) + dy0)    
+        return np.concatenate((tLeg, tr, br, bl, tl))
 
-    
-    def getVerticies(self):
-        """ Gets the a list of (x, y) verticies in clockwise order"""
+    def _getOriginVerticies(self):
         h   = self.d 
         w   = self.b
         t   = self.t 
 
-        ro:float = self.ro
-        ri:float = self.ri
+        xyOutter = self._getVerticiesRoundedRectangle(h, w, self.ro)  
+        xyInner  = self._getVerticiesRoundedRectangle(h - 2*t, w- 2*t, self.ri)  
+        return np.concatenate((xyOutter, xyInner))
+    
+    def getVerticies(self) -> np.ndarray:
+        """ 
+        Gets the a list of (x, y) verticies in clockwise order. The outside
+        verticies are followed by the inside verticies.
+        """
+        return self._getOffsetVerticies('_getOriginVerticies')
+    
+    def getOutlines(self) -> list[np.ndarray]:
+        """
+        Returns the outside and inside outlines of the section.
+        """
+        return np.split(self.getVerticies(), 2)
+
+
+
+# =============================================================================
+# Factories
+# =============================================================================
+
+def _getPlotOrigin(option, b, d,  xy0):
+    if option == PlotOriginPosition.centered:
+        return (0 + xy0[0],   0 + xy0[1])
+    elif option == PlotOriginPosition.bottomCenter:
+        return (0 + xy0[0], d/2 + xy0[1])
+    elif option == PlotOriginPosition.bottomLeft:
+        return (b/2 + xy0[0], d/2 + xy0[1])
+    
+    else:
+        raise Exception()
 
-        xyOutter = self._getVerticiesRoundedRectangle(h, w, ro)  
-        xyInner  = self._getVerticiesRoundedRectangle(h - 2*t, w- 2*t, ri)  
-        xy = np.column_stack((xyOutter, xyInner))
-        
-        return xy[0,:], xy[1,:]
 
+
+
+def _plotGeomFactory(section: SectionAbstract, 
+                     originLocation: int|PlotOriginPosition,
+                     xy0) -> GeomModel:
+    """
+    A function that returns the appropriate geometry object given a section.
+    
+    A thought - why haven't we made this an object attribute?
+
+    """
+
+    if isinstance(section, SectionRectangle):
+        b, d = section.b, section.d
+        xy   = _getPlotOrigin(originLocation, b, d, xy0)
+        geom = GeomModelRectangle(b, d, *xy)
+    elif isinstance(section, SectionSteel):
+        b, d  = section.bf, section.d        
+        xy    = _getPlotOrigin(originLocation, b, d, xy0)
+        geom  = _plotFactorySteel(section, *xy)
+    elif isinstance(section, SectionCLT):
+        b, layers = section.w, section.sLayers
+        xy        = _getPlotOrigin(originLocation, b, layers.d, xy0)
+        geom      = GeomModelClt(layers, b, *xy)
+    else:
+        raise Exception(f'Section of type {section} is not supported.')
+        
+    return geom
+
+
+
+
+def _plotFactorySteel(section:SectionSteel, *args):
+    enum = section.typeEnum
+    if SteelSectionTypes.w == enum:
+        # If there is information about the rounded section, plot that
+        if hasattr(section, 'r1') and hasattr(section, 'r2'):
+            geom = GeomModelIbeamRounded(section.d, 
+                                            section.tw, 
+                                            section.bf, 
+                                            section.tf,  
+                                            section.r2,  
+                                            section.r1,  
+                                            *args)
+        # If there is information about the rounded section, plot that
+        else:
+            geom = GeomModelIbeam(section.d, 
+                                    section.tw, 
+                                    section.bf, 
+                                    section.tf,  
+                                    *args)
+            
+    elif SteelSectionTypes.hss == enum:
+        ro = section.ro
+        ri = section.ri
+        
+        geom = GeomModelHss(section.d, section.bf, section.t, ro, ri, *args)
+        
+    
+    return geom
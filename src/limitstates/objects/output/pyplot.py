@@ -8,16 +8,24 @@ Features of a plot:
     - Show a dictionary of results
 
 """
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.collections import LineCollection, PatchCollection
 from matplotlib.patches import Circle, Polygon
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 
 from .. section import SectionAbstract, SectionRectangle, SectionSteel, SteelSectionTypes, SectionCLT
 from .. element import BeamColumn
 from .. display import MATCOLOURS, PlotConfigCanvas, PlotConfigObject, PlotOriginPosition
 # from .model import GeomModel, GeomModelRectangle, GeomModelIbeam, GeomModelIbeamRounded, GeomModelGlulam
 import limitstates.objects.output.model as md
+from .model import _getPlotOrigin, _plotGeomFactory
 
 import matplotlib.patches as mpatches
 import matplotlib.path as mpath
@@ -53,8 +61,8 @@ class SectionPlotter:
         return dx / dmax * maxFigsize, dy / dmax * maxFigsize
     
     def initPlot(self, ax:Axes = None):
-        x, y = self.geom.getVerticies()
-        xlims, ylims = self._getPlotLimits(x,y)
+        xy = self.geom.getVerticies()
+        xlims, ylims = self._getPlotLimits(xy[:,0], xy[:,1])
         
         xplot, yplot = self._getPlotSize(xlims, ylims)
 
@@ -183,19 +191,6 @@ class SectionPlotterWithHole(SectionPlotter):
         
         return ax
 
-def _getPlotOrigin(option, b, d,  xy0):
-    if option == PlotOriginPosition.centered:
-        return (0 + xy0[0],   0 + xy0[1])
-    elif option == PlotOriginPosition.bottomCenter:
-        return (0 + xy0[0], d/2 + xy0[1])
-    elif option == PlotOriginPosition.bottomLeft:
-        return (b/2 + xy0[0], d/2 + xy0[1])
-    
-    else:
-        raise Exception()
-
-
-
 """
 We can combine the following two funcitons by assigning each section a plot
 enumeration, i.e. 1 = glulam, 2 = steel, 3 = CLT,
@@ -218,35 +213,6 @@ def _defaultConfigFactory(section):
         raise Exception(f'Section of type {section} is not supported.')
     return defaultProps
 
-def _plotGeomFactory(section: SectionAbstract, 
-                     originLocation: int|PlotOriginPosition,
-                     xy0) -> md.GeomModel:
-    """
-    A function that returns the appropriate geometry object given a section.
-    
-    A thought - why haven't we made this an object attribute?
-
-    """
-
-    if isinstance(section, SectionRectangle):
-        b, d = section.b, section.d
-        xy   = _getPlotOrigin(originLocation, b, d, xy0)
-        geom = md.GeomModelRectangle(b, d, *xy)
-    elif isinstance(section, SectionSteel):
-        b, d  = section.bf, section.d        
-        xy    = _getPlotOrigin(originLocation, b, d, xy0)
-        geom  = _plotFactorySteel(section, *xy)
-    elif isinstance(section, SectionCLT):
-        b, layers = section.w, section.sLayers
-        xy        = _getPlotOrigin(originLocation, b, layers.d, xy0)
-        geom      = md.GeomModelClt(layers, b, *xy)
-    else:
-        raise Exception(f'Section of type {section} is not supported.')
-        
-    return geom
-
-
-
 def _plotterFactory(section: SectionAbstract, 
                     geom: md.GeomModel,
                     canvasConfig: PlotConfigCanvas) -> SectionPlotter:
@@ -263,53 +229,18 @@ def _plotterFactory(section: SectionAbstract,
         return SectionPlotter(geom, canvasConfig)
         
 
-def _plotFactorySteel(section:SectionSteel, *args):
-    enum = section.typeEnum
-    if SteelSectionTypes.w == enum:
-        # If there is information about the rounded section, plot that
-        if hasattr(section, 'r1') and hasattr(section, 'r2'):
-            geom = md.GeomModelIbeamRounded(section.d, 
-                                            section.tw, 
-                                            section.bf, 
-                                            section.tf,  
-                                            section.r2,  
-                                            section.r1,  
-                                            *args)
-        # If there is information about the rounded section, plot that
-        else:
-            geom = md.GeomModelIbeam(section.d, 
-                                    section.tw, 
-                                    section.bf, 
-                                    section.tf,  
-                                    *args)
-            
-    elif SteelSectionTypes.hss == enum:
-        ro = section.ro
-        ri = section.ri
-        
-        geom = md.GeomModelHss(section.d, section.bf, section.t, ro, ri, *args)
-        
-    
-    return geom
-
-
 def _setupSummaryDict(listIn, ):
     pass
 
 
 def _plotfillLines(ax, geom, objectConfig):
-    linex, liney = geom.getFillVerticies()
-    lverts = [np.column_stack((x,y)) for x, y in zip(linex, liney)]
-    lines = LineCollection(lverts, colors = objectConfig.cFillLines,
+    lines = LineCollection(geom.getFillVerticies(), colors = objectConfig.cFillLines,
                            linewidth = 0.5)
     ax.add_collection(lines)
 
 
 def _plotfillPatches(ax, geom, objectConfig):
-    linex, liney = geom.getFillAreas()
-    lverts = [np.column_stack((x,y)) for x, y in zip(linex, liney)]
-    
-    p = PatchCollection([Polygon(vert) for vert in lverts], color = objectConfig.cFillPatch)
+    p = PatchCollection([Polygon(vert) for vert in geom.getFillAreas()], color = objectConfig.cFillPatch)
     ax.add_collection(p)
 
 
@@ -386,7 +317,7 @@ def plotSection(section:SectionAbstract,
     plotter = _plotterFactory(section, geom, canvasConfig)
     
     fig, ax = plotter.initPlot(ax)
-    xyVerts = np.column_stack(geom.getVerticies())
+    xyVerts = geom.getVerticies()
     
     plotter.plot(ax, xyVerts, objectConfig, *args, **kwargs)
 
@@ -481,7 +412,7 @@ def _plotBasic(dispProps, ax = None):
     
     fig, ax = plotter.initPlot(ax)
     
-    xy = np.column_stack(geom.getVerticies())
+    xy = geom.getVerticies()
     plotter.plot(ax, xy, cObjConfig)
     return fig, ax
 
@@ -514,7 +445,7 @@ def _plotGlulam(dispProps, ax = None):
     fig, ax = plotter.initPlot(ax)
     
     # Plot the base object
-    plotter.plot(ax, np.column_stack(geom.getVerticies()), canvasObjConfig)
+    plotter.plot(ax, geom.getVerticies(), canvasObjConfig)
     
     # Plot the fire section.
     if hasFireSection:
@@ -526,7 +457,7 @@ def _plotGlulam(dispProps, ax = None):
         dh           = dispProps.displayLamHeight
         geom         = md.GeomModelGlulam(sFire.b, sFire.d, dh, dx + dx0, dy + dy0)
         objectConfig = dispProps.configObject
-        plotter.plot(ax, np.column_stack(geom.getVerticies()), objectConfig)
+        plotter.plot(ax, geom.getVerticies(), objectConfig)
     
     # Plot the internal fill lines
     _plotfillLines(ax, geom, canvasObjConfig)
@@ -556,7 +487,7 @@ def _plotCLT(dispProps, ax = None):
     fig, ax = plotter.initPlot(ax)
     
     # Plot the base object
-    plotter.plot(ax, np.column_stack(geom.getVerticies()), canvasObjConfig)
+    plotter.plot(ax, geom.getVerticies(), canvasObjConfig)
     
     if hasFireSection:
         sFire  = dispProps.sectionFire
@@ -566,7 +497,7 @@ def _plotCLT(dispProps, ax = None):
         geom         = md.GeomModelClt(plotLayers, b, dx + dx0, dy + dy0)
         objectConfig = dispProps.configObject
         
-        plotter.plot(ax, np.column_stack(geom.getVerticies()), objectConfig)
+        plotter.plot(ax, geom.getVerticies(), objectConfig)
 
     _plotfillLines(ax, geom, canvasObjConfig)
     _plotfillPatches(ax, geom, canvasObjConfig)
@@ -635,3 +566,230 @@ def plotElementSection(element:BeamColumn,
         
         
     
+
+
+
+# =============================================================================
+# Batch rendering
+# =============================================================================
+
+class SectionRenderer:
+    """
+    Renders sections to image files using a single figure on the 
+    non-interactive Agg backend. The figure is not managed by pyplot, so no
+    figures are leaked when many sections are rendered.
+    
+    For sections with a single outline, i.e. rectangles and W sections, the 
+    vertex data of the same polygon and outline artists are swapped in place 
+    for each section. Other sections are drawn with the standard plotters,
+    and their artists removed once the file is written.
+    
+    The renderer can be used as a context manager, which closes the figure
+    on exit.
+
+    Parameters
+    ----------
+    canvasConfig : PlotConfigCanvas, optional
+        The canvas configuration object to be used. The when set to none a 
+        default object is used.
+
+    """
+    def __init__(self, canvasConfig: PlotConfigCanvas = None):
+        if not canvasConfig:
+            canvasConfig = PlotConfigCanvas()
+        self.canvasConfig = canvasConfig
+        
+        self.fig = Figure(dpi = canvasConfig.dpi)
+        FigureCanvasAgg(self.fig)
+        self.ax = self.fig.add_subplot()
+        if canvasConfig.showAxis != True:
+            self.ax.axis('off')
+        
+        self.patch = Polygon(np.zeros((1,2)))
+        self.line  = Line2D([], [])
+        self.ax.add_patch(self.patch)
+        self.ax.add_line(self.line)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *args):
+        self.close()
+    
+    def _setCanvas(self, plotter:SectionPlotter, xy:np.ndarray):
+        """
+        Resizes the figure and sets the axis limits for a new section.
+        """
+        xlims, ylims = plotter._getPlotLimits(xy[:,0], xy[:,1])
+        self.fig.set_size_inches(*plotter._getPlotSize(xlims, ylims))
+        self.ax.set_xlim(xlims)
+        self.ax.set_ylim(ylims)
+        
+    def _setOutline(self, xy:np.ndarray, objectConfig:PlotConfigObject, 
+                    isVisible:bool):
+        """
+        Updates the reused polygon and outline artists in place.
+        """
+        self.patch.set_visible(isVisible)
+        self.line.set_visible(isVisible and objectConfig.showOutline)
+        if not isVisible:
+            return
+        
+        self.patch.set_xy(xy)
+        self.patch.set_color(objectConfig.c)
+        self.line.set_data(xy[:,0], xy[:,1])
+        self.line.set_linewidth(objectConfig.lineWidth)
+        self.line.set_color(objectConfig.cLine)
+        
+    def render(self, section:SectionAbstract, fileName:str, 
+               objectConfig: PlotConfigObject = None) -> str:
+        """
+        Renders a section and writes it to a file. The file format is taken 
+        from the file extension, for example .png or .svg.
+
+        Parameters
+        ----------
+        section : SectionAbstract
+            The section to be rendered.
+        fileName : str
+            The path of the output file.
+        objectConfig : PlotConfigObject, optional
+            The object configuration object to be used. When set to none, a 
+            default object will be chosen based on the section type input.
+
+        Returns
+        -------
+        str
+            The path of the output file.
+
+        """
+        if not objectConfig:
+            objectConfig = _defaultConfigFactory(section)
+        
+        geom    = _plotGeomFactory(section, objectConfig.originLocation, [0,0])
+        plotter = _plotterFactory(section, geom, self.canvasConfig)
+        xy      = geom.getVerticies()
+        self._setCanvas(plotter, xy)
+        
+        # Simple outlines reuse the existing artists.
+        isSimple = type(plotter) is SectionPlotter
+        self._setOutline(xy, objectConfig, isSimple)
+        
+        baseArtists = set(self.ax.get_children())
+        if not isSimple:
+            plotter.plot(self.ax, xy, objectConfig)
+        if hasattr(geom, 'getFillVerticies'):
+            _plotfillLines(self.ax, geom, objectConfig)
+        if hasattr(geom, 'getFillAreas'):
+            _plotfillPatches(self.ax, geom, objectConfig)
+        
+        self.fig.savefig(fileName)
+        
+        for artist in set(self.ax.get_children()) - baseArtists:
+            artist.remove()
+        
+        return fileName
+    
+    def close(self):
+        """
+        Clears the figure and releases the resources used by the renderer.
+        """
+        self.fig.clear()
+        self.fig = None
+        self.ax = None
+
+
+def _getSectionFileNames(sections:list[SectionAbstract], outputDir:str,
+                         fileFormat:str) -> list[str]:
+    """
+    Returns a file name for each section, based on the section name. 
+    If several sections have the same name, the index of each section is 
+    added to its file name, so no file is overwritten.
+    """
+    names = []
+    for ind, section in enumerate(sections):
+        name = getattr(section, 'name', None) or f'section_{ind}'
+        names.append(name.replace('/', '_').replace(os.sep, '_'))
+    
+    counts = Counter(names)
+    return [os.path.join(outputDir, f'{name}_{ind}.{fileFormat}' if 1 < counts[name] 
+                         else f'{name}.{fileFormat}') 
+            for ind, name in enumerate(names)]
+
+
+def _renderSectionBatch(sections, fileNames, canvasConfig, objectConfig):
+    """
+    Renders a batch of sections with one renderer. This is used by each 
+    process when rendering in parallel.
+    """
+    with SectionRenderer(canvasConfig) as renderer:
+        return [renderer.render(section, fileName, objectConfig) 
+                for section, fileName in zip(sections, fileNames)]
+
+
+def renderSections(sections:list[SectionAbstract], 
+                   outputDir:str = '.',
+                   fileFormat:str = 'png',
+                   fileNames:list[str] = None,
+                   canvasConfig: PlotConfigCanvas = None,
+                   objectConfig: PlotConfigObject = None,
+                   Nprocess:int = 1) -> list[str]:
+    """
+    Renders a list of sections to image files. A single figure is reused 
+    for all sections, see 
+    :class:`SectionRenderer <limitstates.objects.output.pyplot.SectionRenderer>`.
+    
+    If more than one process is used, the sections are split into one batch 
+    per process, and each process renders it's batch with its own figure.
+
+    Parameters
+    ----------
+    sections : list[SectionAbstract]
+        The sections to be rendered.
+    outputDir : str, optional
+        The directory to write the files to. The default is '.'.
+    fileFormat : str, optional
+        The image format to use, for example 'png' or 'svg'. 
+        The default is 'png'.
+    fileNames : list[str], optional
+        The output path for each section. If none, files are named after 
+        each section in the output directory, and the index of the section
+        is added to names that repeat. The default is None.
+    canvasConfig : PlotConfigCanvas, optional
+        The canvas configuration object to be used. The when set to none a 
+        default object is used.
+    objectConfig : PlotConfigObject, optional
+        The object configuration object to be used for all sections. When set 
+        to none, a default object will be chosen based on each section type.
+    Nprocess : int, optional
+        The number of processes to use. The default is 1, which renders all 
+        sections in the current process.
+
+    Returns
+    -------
+    list[str]
+        The path of each output file.
+
+    """
+    if fileNames is None:
+        fileNames = _getSectionFileNames(sections, outputDir, fileFormat)
+    elif len(set(fileNames)) < len(fileNames):
+        raise Exception('Each section must have a unique file name.')
+    
+    if Nprocess <= 1 or len(sections) <= 1:
+        return _renderSectionBatch(sections, fileNames, canvasConfig, objectConfig)
+    
+    Nprocess = min(Nprocess, len(sections))
+    inds = np.array_split(np.arange(len(sections)), Nprocess)
+    batches = [([sections[ii] for ii in ind], [fileNames[ii] for ii in ind]) 
+               for ind in inds]
+    
+    fileNamesOut = []
+    with ProcessPoolExecutor(Nprocess) as executor:
+        futures = [executor.submit(_renderSectionBatch, batchSections, 
+                                   batchNames, canvasConfig, objectConfig) 
+                   for batchSections, batchNames in batches]
+        for future in futures:
+            fileNamesOut += future.result()
+    
+    return fileNamesOut
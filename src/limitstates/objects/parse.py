@@ -4,8 +4,10 @@ Contains functions for sorting collections of limitstate objects
 
 
 from operator import attrgetter
+import numpy as np
 
-__all__ = ["sortByAttr", "filterByAttrRange", "filterByName", "getByName"]
+__all__ = ["sortByAttr", "filterByAttrRange", "filterByName", "getByName", 
+           "SectionIndex"]
 
 
 def sortByAttr(objectList:list, attr:str, reverse:bool = False):
@@ -130,4 +132,278 @@ def getByName(objectList:list, filterVal:str):
         if filterVal in objectList[ii].name.lower():
             return objectList[ii]
     
-    raise Exception(f'No object with name {filterVal} found')
\ No newline at end of file
+    raise Exception(f'No object with name {filterVal} found')
+
+
+class SectionIndex:
+    """
+    An index over a list of objects, typically sections from a database,
+    which is used to run many queries on the same list quickly.
+    
+    Object names are sorted once, so name prefix queries are a binary 
+    search. The values of each attribute are sorted the first time that 
+    attribute is queried, after which range queries are also a binary search.
+    Queries for text anywhere in a name or string attribute use a sorted 
+    array of every suffix of the text, which is made on the first query.
+    
+    Queries return boolean masks with one value per object, which can be 
+    combined with & and | before getting the objects with getObjects.
+    For example:
+        
+        mask = index.getRangeMask('d', 300, 500) & index.getPrefixMask('W')
+        sections = index.getObjects(mask)
+
+    Parameters
+    ----------
+    objectList : list
+        The objects to index.
+
+    Returns
+    -------
+    None.
+
+    """
+    
+    def __init__(self, objectList:list):
+        self.objects = list(objectList)
+        self.N = len(self.objects)
+        
+        self.names = np.array([item.name.lower() for item in self.objects], 
+                              dtype=str)
+        self._nameOrder = np.argsort(self.names, kind = 'stable')
+        self._sortedNames = self.names[self._nameOrder]
+        
+        self._nameInds = {}
+        for ii, name in enumerate(self.names):
+            self._nameInds.setdefault(name, ii)
+        
+        self._attrValues = {}
+        self._attrOrders = {}
+        self._attrSorted = {}
+        self._suffixes = {}
+    
+    def __len__(self):
+        return self.N
+    
+    def _getSortedAttr(self, attr:str):
+        """
+        Returns the values of the attribute, the order that sorts them, and
+        the sorted values. Each attribute is only sorted once.
+        """
+        if attr not in self._attrValues:
+            getter = attrgetter(attr)
+            values = np.array([getter(item) for item in self.objects])
+            order = np.argsort(values, kind = 'stable')
+            self._attrValues[attr] = values
+            self._attrOrders[attr] = order
+            self._attrSorted[attr] = values[order]
+        return self._attrValues[attr], self._attrOrders[attr], self._attrSorted[attr]
+    
+    def _getSuffixes(self, key, strings:np.ndarray):
+        """
+        Returns every suffix of the input strings in sorted order, and the 
+        index of the string each suffix is from. Strings that contain a 
+        value are the strings with a suffix that starts with the value. 
+        Suffixes are only found once for each key.
+        """
+        if key not in self._suffixes:
+            suffixes = []
+            inds = []
+            for ii, string in enumerate(strings.tolist()):
+                suffixes += [string[jj:] for jj in range(len(string))]
+                inds += [ii]*len(string)
+            suffixes = np.array(suffixes, dtype=str)
+            order = np.argsort(suffixes, kind = 'stable')
+            self._suffixes[key] = (suffixes[order], np.array(inds, dtype=int)[order])
+        return self._suffixes[key]
+    
+    def _getContainsMask(self, key, strings:np.ndarray, 
+                         filterVal:str) -> np.ndarray:
+        """
+        Returns a mask of the strings that contain the filter value, using
+        a binary search of their suffixes.
+        """
+        if not filterVal:
+            return np.ones(self.N, dtype=bool)
+        suffixes, inds = self._getSuffixes(key, strings)
+        i1 = np.searchsorted(suffixes, filterVal, 'left')
+        i2 = np.searchsorted(suffixes, filterVal + chr(0x10ffff), 'left')
+        return self._getMaskFromInds(inds[i1:i2])
+    
+    def _getMaskFromInds(self, inds:np.ndarray) -> np.ndarray:
+        mask = np.zeros(self.N, dtype=bool)
+        mask[inds] = True
+        return mask
+    
+    def getAttr(self, attr:str) -> np.ndarray:
+        """
+        Returns the value of an attribute for every object.
+
+        Parameters
+        ----------
+        attr : str
+            The attribute to get.
+
+        Returns
+        -------
+        np.ndarray
+            The value of the attribute for each object.
+
+        """
+        return self._getSortedAttr(attr)[0]
+    
+    def getRangeMask(self, attr:str, lowerLim = None, 
+                     upperLim = None) -> np.ndarray:
+        """
+        Returns a mask of objects with an attribute between an upper and 
+        lower limit. Limits are inclusive, and a limit of None is not used.
+
+        Parameters
+        ----------
+        attr : str
+            The attribute to filter by.
+        lowerLim : float, optional
+            The lower limit of the attribute. The default is None.
+        upperLim : float, optional
+            The upper limit of the attribute. The default is None.
+
+        Returns
+        -------
+        np.ndarray
+            True for each object in the range.
+
+        """
+        _, order, sortedValues = self._getSortedAttr(attr)
+        
+        i1 = 0
+        i2 = self.N
+        if lowerLim is not None:
+            i1 = np.searchsorted(sortedValues, lowerLim, 'left')
+        if upperLim is not None:
+            i2 = np.searchsorted(sortedValues, upperLim, 'right')
+        
+        return self._getMaskFromInds(order[i1:i2])
+    
+    def getPrefixMask(self, prefix:str) -> np.ndarray:
+        """
+        Returns a mask of objects with names that start with the prefix. 
+        Results are not case sensetive.
+
+        Parameters
+        ----------
+        prefix : str
+            The start of the name, i.e. 'W310'.
+
+        Returns
+        -------
+        np.ndarray
+            True for each object with a matching name.
+
+        """
+        prefix = prefix.lower()
+        i1 = np.searchsorted(self._sortedNames, prefix, 'left')
+        i2 = np.searchsorted(self._sortedNames, prefix + chr(0x10ffff), 'left')
+        return self._getMaskFromInds(self._nameOrder[i1:i2])
+    
+    def getNameMask(self, filterVal:str) -> np.ndarray:
+        """
+        Returns a mask of objects that have the string filterVal anywhere in 
+        their name. Results are not case sensetive. For names that start with
+        filterVal, getPrefixMask is faster.
+
+        Parameters
+        ----------
+        filterVal : str
+            The string to check if is in any names.
+
+        Returns
+        -------
+        np.ndarray
+            True for each object with a matching name.
+
+        """
+        return self._getContainsMask('name', self.names, filterVal.lower())
+    
+    def getAttrValMask(self, attr:str, filterVal:str) -> np.ndarray:
+        """
+        Returns a mask of objects where the string attribute "attr" contains
+        the filter value. This is the indexed version of filterByAttrVal, 
+        and is case sensetive.
+
+        Parameters
+        ----------
+        attr : str
+            The attribute to filter by.
+        filterVal : str
+            The value to be included in the attribute of each object.
+
+        Returns
+        -------
+        np.ndarray
+            True for each object with a matching attribute.
+
+        """
+        values = self.getAttr(attr)
+        if self.N and values.dtype.kind != 'U':
+            raise Exception(f'Attribute {attr} must be a string to filter by value.')
+        return self._getContainsMask(('attr', attr), values, filterVal)
+    
+    def getByName(self, name:str):
+        """
+        Returns the object with a name. Exact matches are found first, 
+        otherwise the first object that contains the name is returned. 
+        Results are not case sensetive.
+
+        Parameters
+        ----------
+        name : str
+            The name of the object.
+
+        Returns
+        -------
+        object
+            The object with the name.
+
+        """
+        name = name.lower()
+        if name in self._nameInds:
+            return self.objects[self._nameInds[name]]
+        
+        inds = np.flatnonzero(self.getNameMask(name))
+        if len(inds):
+            return self.objects[inds[0]]
+        raise Exception(f'No object with name {name} found')
+    
+    def getObjects(self, mask:np.ndarray = None, sortAttr:str = None,
+                   reverse:bool = False) -> list:
+        """
+        Returns the objects in a mask, optionally sorted by an attribute.
+
+        Parameters
+        ----------
+        mask : np.ndarray, optional
+            A boolean mask of objects to return. The default is None, which 
+            returns all objects.
+        sortAttr : str, optional
+            If given, the objects are sorted by this attribute, from 
+            smallest to largest. The default is None, which keeps the 
+            original order.
+        reverse : bool, optional
+            A flag that reverses the sorted order. The default is False.
+
+        Returns
+        -------
+        list
+            The objects in the mask.
+
+        """
+        if sortAttr is None:
+            inds = np.arange(self.N)
+        else:
+            inds = self._getSortedAttr(sortAttr)[1]
+        
+        if mask is not None:
+            inds = inds[mask[inds]]
+        if reverse:
+            inds = inds[::-1]
+        return [self.objects[ii] for ii in inds]
@@ -11,24 +11,32 @@ material files from the specific design library they are targeting.
 
 """
 
+from __future__ import annotations
+
 import os
 from dataclasses import dataclass
-
-import pandas as pd
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 from math import isnan
 
-from .material import MaterialAbstract
+from .material import MaterialAbstract, internMaterial
 from .section import SectionAbstract, SectionRectangle, LayerClt, SectionCLT, LayerGroupClt, SectionSteel
+from .. units import lengthConverter
+
+# pandas is only imported when a database is first read.
+if TYPE_CHECKING:
+    import pandas as pd
 
 
-__all__ = ["getSteelSections", "getRectangularSections"]
+__all__ = ["getSteelSections", "getRectangularSections", "convertSectionTable"]
 
 
 filepath = os.path.realpath(__file__)
 basedir = os.path.dirname(filepath)
 matBaseDir = os.path.join(os.path.dirname(basedir), 'design')
 
-@dataclass
+@dataclass(frozen=True)
 class DBConfig:
     """
     A configuration file, used to load a file from a database.
@@ -77,6 +85,7 @@ def _setupLoader(objType):
         dbPath  = os.path.join(base, config.code, config.dbType)    
         fileID =  config.dbName + '.csv'
         dbPath  = os.path.join(dbPath, fileID)    
+        import pandas as pd
         return pd.read_csv(dbPath)
     
     return _loadDBDict
@@ -102,9 +111,93 @@ def _loadMaterialDB(config:DBConfig,
     
     return materials
 
+@lru_cache(maxsize=None)
+def _loadMaterialRegistry(config:DBConfig,
+                          MatClass:MaterialAbstract,
+                          keyAttrs:tuple[str] = ('species', 'grade'),
+                          sUnit:str = 'MPa', 
+                          rhoUnit:str = 'kg/m3') -> MappingProxyType:
+    """
+    Loads a material database once per process, and returns a read only 
+    dictionary of the materials keyed by the values of keyAttrs, i.e. 
+    (species, grade). Later calls return the same dictionary, so materials 
+    are shared by every object that uses them. Materials are interned, and 
+    are read only.
+    """
+    materials = _loadMaterialDB(config, MatClass, sUnit, rhoUnit)
+    registry = {}
+    for mat in materials:
+        mat = internMaterial(mat)
+        registry[tuple(getattr(mat, attr) for attr in keyAttrs)] = mat
+    return MappingProxyType(registry)
+
 # =============================================================================
 # Section read files
 # =============================================================================
+
+# The power of length each database column is stored in. Columns that are not
+# pure lengths, i.e. weight per length or slenderness ratios, are not included.
+# Repeated columns are read by pandas with a suffix, i.e. 'Ix.1'.
+sectionLengthPowers = {'d':1, 'd.1':1, 'ddet':1, 'Ht':1, 'h':1, 'OD':1, 
+                       'ID':1, 'B':1, 'b':1, 'bf':1, 'bfdet':1, 't':1, 
+                       'tnom':1, 'tdes':1, 'tw':1, 'twdet':1, 'twdet/2':1, 
+                       'tf':1, 'tfdet':1, 'ho':1, 'r1':1, 'r2':1, 'ro':1, 
+                       'ri':1, 'dclear':1, 'k':1, 'kdes':1, 'kdet':1, 'k1':1, 
+                       'x':1, 'y':1, 'eo':1, 'xp':1, 'yp':1, 
+                       'zA':1, 'zB':1, 'zC':1, 'wA':1, 'wB':1, 'wC':1,
+                       'rx':1, 'ry':1, 'rz':1, 'rp':1, 'rts':1, 
+                       'PA':1, 'PA2':1, 'PB':1, 'PC':1, 'PD':1, 'T':1, 
+                       'WGi':1, 'WGo':1,
+                       'A':2, 'Avx':2, 'Avy':2, 'Wno':2, 
+                       'Zx':3, 'Zy':3, 'Sx':3, 'Sy':3, 'Sz':3, 
+                       'Zx.1':3, 'Zy.1':3, 'Sx.1':3, 'Sy.1':3, 
+                       'SwA':3, 'SwB':3, 'SwC':3, 'SzA':3, 'SzB':3, 'SzC':3,
+                       'Qf':3, 'Qw':3, 'Sj':3, 'C':3, 'Zxweb':3, 'Zyflange':3,
+                       'Ix':4, 'Iy':4, 'Iz':4, 'Iw':4, 'Ip':4, 'Ix.1':4, 
+                       'Iy.1':4, 'J':4, 'Jstv':4, 'Jwarp':4, 
+                       'Sw1':4, 'Sw2':4, 'Sw3':4, 'ZJ':4, 
+                       'Cw':6}
+
+def convertSectionTable(sectionTable:pd.DataFrame, inputUnit:str, 
+                        outputUnit:str, 
+                        lengthPowers:dict[str,int] = None) -> pd.DataFrame:
+    """
+    Converts the length units of a section database table. All columns 
+    are rescaled in a single vectorized operation, with each column raised to
+    the power of length it is stored in, i.e. A is scaled by the length factor
+    squared, and Cw by the factor to the power of six.
+    
+    Columns that are not in the length powers dictionary are not modified.
+
+    Parameters
+    ----------
+    sectionTable : pd.DataFrame
+        The section table to convert, with one row per section.
+    inputUnit : str
+        The length unit the table is currently in.
+    outputUnit : str
+        The length unit to convert the table to.
+    lengthPowers : dict[str,int], optional
+        A dictionary with the power of length for each column. The default is
+        None, which uses the powers for the limitstates section databases.
+
+    Returns
+    -------
+    pd.DataFrame
+        A copy of the section table in the output units.
+
+    """
+    if lengthPowers is None:
+        lengthPowers = sectionLengthPowers
+    
+    columns = [col for col in sectionTable.columns if col in lengthPowers]
+    powers  = [lengthPowers[col] for col in columns]
+    values  = sectionTable[columns].to_numpy(dtype=float)
+    
+    tableOut = sectionTable.copy()
+    tableOut[columns] = lengthConverter.convertArray(inputUnit, outputUnit, 
+                                                     values, powers)
+    return tableOut
         
 # def _loadSectionDBDict(config:DBConfig) -> pd.DataFrame:
 #     """
@@ -203,11 +296,15 @@ sectionDict = {'w':SectionSteel, 'hss':SectionSteel}
 def getSteelSections(mat:MaterialAbstract, 
                      code:str, 
                      dbName:str,
-                     steelShapeType:str) -> list[SectionSteel]:
+                     steelShapeType:str,
+                     lUnit:str = None) -> list[SectionSteel]:
     """
     Returns a list of steel sections from a section database.
     The section database must be one of the steel databases here: 
     https://limitstates.readthedocs.io/en/latest/rst/objects-section-db.html
+    
+    If a length unit is given, the full database table is converted to that 
+    unit before sections are created.
 
     Parameters
     ----------
@@ -219,6 +316,9 @@ def getSteelSections(mat:MaterialAbstract,
         The type of database to use, i.e. aisc, cisc
     steelShapeType : str
         The type of steel section to load, i.e. W, hss.
+    lUnit : str, optional
+        The length units to use for the sections. The default is None, which
+        uses the units of the database.
 
     Returns
     -------
@@ -230,9 +330,12 @@ def getSteelSections(mat:MaterialAbstract,
     steelShapeType = steelShapeType.lower()
     # !!! This is a bandaid
     if '_si' in dbName:
-        lUnit =  'mm'
+        dbUnit =  'mm'
     else:
-        lUnit  = _getCodeUnits(code)
+        dbUnit  = _getCodeUnits(code)
+    
+    if not lUnit:
+        lUnit = dbUnit
     
     # !!! do we actually need a different section for
     if steelShapeType in list(sectionDict.keys()):
@@ -244,6 +347,8 @@ def getSteelSections(mat:MaterialAbstract,
     rawDbData   = _loadSectionDBDict(config)
 
     filteredDbData = getSectionTypes(rawDbData, steelShapeType)
+    if lUnit != dbUnit:
+        filteredDbData = convertSectionTable(filteredDbData, dbUnit, lUnit)
     
     filteredDict = filteredDbData.to_dict(orient='index')
     SectionClass = sectionDict[steelShapeType]
@@ -341,16 +446,18 @@ def _parseCLTDataFrame(matDfDict):
     return newMatDict
 
 
-def _getLayerInd(cltGrade, mats):
+def _getMatsByGrade(mats:list) -> dict:
     """
-    Finds the index of the clt grade to use.
+    Returns a dictionary of the [strong, weak] materials for each clt grade.
+    Where a grade is repeated, the first materials are used.
     """
-    for ii in range(len(mats)):
-        if mats[ii][0].grade == cltGrade:
-            return ii
+    matsByGrade = {}
+    for strongMat, weakMat in mats:
+        matsByGrade.setdefault(strongMat.grade, (strongMat, weakMat))
+    return matsByGrade
     
 
-def _getCLTSectionLayers(sectionDict:dict, mats:list, 
+def _getCLTSectionLayers(sectionDict:dict, matsByGrade:dict, 
                          lUnit:str) -> list[LayerClt]:
     """
     Creates the group of layers for the CLT section.
@@ -359,8 +466,8 @@ def _getCLTSectionLayers(sectionDict:dict, mats:list,
     ----------
     sectionDict : dict
         The input section dictionary containing geometry information.
-    mats : list
-        The input material list containing all possible materials.
+    matsByGrade : dict
+        The [strong, weak] materials for each clt grade.
 
     Returns
     -------
@@ -376,8 +483,7 @@ def _getCLTSectionLayers(sectionDict:dict, mats:list,
     
     Nlayer = len(layerThicknesses)
     
-    ind = _getLayerInd(cltGrade, mats)
-    strongMat, weakMat = mats[ind]
+    strongMat, weakMat = matsByGrade[cltGrade]
     
     layerMats = []
     for ii in range(Nlayer):
@@ -425,10 +531,11 @@ def _loadSectionsCLT(mats:list[[MaterialAbstract, MaterialAbstract]],
 
     sectionsDict = _parseCLTDataFrame(tempDict)
    
+    matsByGrade = _getMatsByGrade(mats)
     sections = []
     for key in sectionsDict.keys():
         sectionDict = sectionsDict[key]
-        layers = LayerGroupClt(_getCLTSectionLayers(sectionDict, mats, lUnit))
+        layers = LayerGroupClt(_getCLTSectionLayers(sectionDict, matsByGrade, lUnit))
         sections.append(SectionCLT(layers, **sectionkwargs))
 
     return sections
@@ -4,9 +4,9 @@ Classes that are used to represent CLT sections.
 
 """
 
-from .section import SectionAbstract
+from .section import SectionAbstract, memoizeSection
 from ..material import MaterialElastic
-from ... units import ConverterStress, ConverterDensity, ConverterLength
+from ... units import lengthConverter
 
 from dataclasses import dataclass
 import numpy as np
@@ -64,7 +64,7 @@ class LayerClt:
     def _initUnits(self, lUnit):
         """Initiates the length unit used for the layer"""
         self.lUnit = lUnit
-        self.lConverter = ConverterLength()   
+        self.lConverter = lengthConverter   
     
     def lConvert(self, outputUnit:str):
         """
@@ -136,6 +136,9 @@ class LayerGroupClt:
     ybar:float
     dnet:float
     grade:str
+    
+    # Caches that are not part of the group's content, see frozen.py
+    _cacheAttrs = ('_layerArrays', '_props', '_activeGroups')
        
     def __init__(self, layers:list[LayerClt]):
 
@@ -149,6 +152,57 @@ class LayerGroupClt:
         self.lConvert = self.layers[0].lConvert
         self.sConvert = self.layers[0].mat.sConvert
         self.grade = self.layers[0].mat.grade
+        self._clearCache()
+
+    def _clearCache(self):
+        """
+        Clears the cached layer arrays, section propreties, and active layer
+        groups. This is needed if the layers are modified.
+        """
+        self._layerArrays = {}
+        self._props = {}
+        self._activeGroups = {}
+
+    def _getLayerArray(self, name:str, parallelToStrong:bool = True) -> np.ndarray:
+        """
+        Returns the thickness 't', absolute midpoint 'yMid', 'E', or 'G' of 
+        each layer as an array, for the given global orientation. Each array
+        is only made once.
+        """
+        key = (name, parallelToStrong)
+        if key not in self._layerArrays:
+            if name == 't':
+                values = [layer.t for layer in self.layers]
+            elif name == 'yMid':
+                values = self.lMidpointsAbs
+            elif name == 'E':
+                values = [layer.getLayerE(parallelToStrong) for layer in self.layers]
+            elif name == 'G':
+                values = [layer.getLayerG(parallelToStrong) for layer in self.layers]
+            self._layerArrays[key] = np.array(values, dtype=float)
+        return self._layerArrays[key]
+
+    def getActiveGroup(self, searchInStrong:bool = True):
+        """
+        Returns the active layers of the group as a new layer group, see
+        getActiveLayers. The group is only made once for each direction.
+
+        Parameters
+        ----------
+        searchInStrong : bool, optional
+            A flag that can be used to get active layers in either the 
+            strong or weak direction. The default is True.
+
+        Returns
+        -------
+        LayerGroupClt
+            The active layers.
+
+        """
+        if searchInStrong not in self._activeGroups:
+            activeLayers = getActiveLayers(self, searchInStrong)
+            self._activeGroups[searchInStrong] = LayerGroupClt(activeLayers)
+        return self._activeGroups[searchInStrong]
 
     def getLayerAttr(self, attr:str) -> np.ndarray:
         out = []
@@ -178,6 +232,7 @@ class LayerGroupClt:
         self._setLayerBoundaries()
         self._setLayerMidpointsAbs()        
         self.d = self.lBoundaries[-1]
+        self._clearCache()
      
     def _setLayerBoundaries(self):
         y0 = 0
@@ -194,24 +249,16 @@ class LayerGroupClt:
         self.lMidpointsAbs = lMidpointsAbs
         
     def getYbar(self, checkInStrong:bool =True) -> float:
-        EAy = 0
-        EA = 0        
-        for ii in range(len(self.layers)):
-            layer = self.layers[ii]
-            E = layer.getLayerE(checkInStrong)
-            EAtemp = E * layer.t
-            EA += EAtemp
-            EAy += EAtemp*self.lMidpointsAbs[ii]
-            
-        return EAy / EA   
-        
-    def _getLayerMidpointsRelative(self, parallelToStrong:bool = True):
-        lMidpointsRel = []
-        
+        key = ('ybar', checkInStrong)
+        if key not in self._props:
+            EA = self._getLayerArray('E', checkInStrong) * self._getLayerArray('t')
+            yMid = self._getLayerArray('yMid')
+            self._props[key] = float(np.sum(EA * yMid) / np.sum(EA))
+        return self._props[key]
+        
+    def _getLayerMidpointsRelative(self, parallelToStrong:bool = True) -> np.ndarray:
         ybar = self.getYbar(parallelToStrong)
-        for ii in range(len(self.layers)):
-            lMidpointsRel.append(ybar - self.lMidpointsAbs[ii])
-        return lMidpointsRel
+        return ybar - self._getLayerArray('yMid')
         
     def getYmax(self, parallelToStrong:bool = True) -> float:
         ybar = self.getYbar(parallelToStrong)
@@ -241,12 +288,13 @@ class LayerGroupClt:
 
         """
         
-        EI = 0
-        lMid = self._getLayerMidpointsRelative(parallelToStrong)
-        for ii, layer in enumerate(self.layers):
-            E = layer.getLayerE(parallelToStrong)
-            EI += layer.t**3 * E / 12
-            EI += layer.t * lMid[ii]**2  * E
+        key = ('EI', parallelToStrong)
+        if key not in self._props:
+            t = self._getLayerArray('t')
+            E = self._getLayerArray('E', parallelToStrong)
+            lMid = self._getLayerMidpointsRelative(parallelToStrong)
+            self._props[key] = float(np.sum(t**3 * E / 12 + t * lMid**2 * E))
+        EI = self._props[key]
         
         sfactor = self.sConvert(sUnit)
         lfactor = self.lConvert(lUnit)
@@ -278,36 +326,29 @@ class LayerGroupClt:
 
         """
         
-        layers = self.layers
-        Nlayer = len(layers)
-        
+        Nlayer = len(self.layers)
         if not NlayerTotal:
             NlayerTotal = Nlayer
         
-        denom = 0
-        h = 0
-        
-        # Get the first terms of the denominator.
-        G0 = layers[0].getLayerG(parallelToStrong)
-        t0 = layers[0].t/2
-        denom += t0/G0 
-        h += t0
-        
-        # account for the final layer if it's present.
-        if NlayerTotal == Nlayer:
-            GN = layers[NlayerTotal-1].getLayerG(parallelToStrong)
-            tN = layers[NlayerTotal-1].t / 2
-            denom += tN/GN
-            h += tN 
+        key = ('GA', parallelToStrong, NlayerTotal == Nlayer)
+        if key not in self._props:
+            t = self._getLayerArray('t')
+            G = self._getLayerArray('G', parallelToStrong)
         
-        # middle terms.
-        for ii in range(1, Nlayer-1):
-            layer = layers[ii]
-            G = layer.getLayerG(parallelToStrong)
-            denom += layer.t  / G
-            h += layer.t
-        
-        GA = h**2 / denom
+            # Get the first terms of the denominator.
+            denom = t[0] / 2 / G[0]
+            h = t[0] / 2
+            
+            # account for the final layer if it's present.
+            if NlayerTotal == Nlayer:
+                denom += t[-1] / 2 / G[-1]
+                h += t[-1] / 2
+            
+            # middle terms.
+            denom += np.sum(t[1:-1] / G[1:-1])
+            h += np.sum(t[1:-1])
+            self._props[key] = float(h**2 / denom)
+        GA = self._props[key]
         
         sfactor = self.sConvert(sUnit)
         lfactor = self.lConvert(lUnit)
@@ -335,11 +376,12 @@ class LayerGroupClt:
 
         """
         
-        EA = 0
-        # lMid = self._getLayerMidpointsRelative(parallelToStrong)
-        for ii, layer in enumerate(self.layers):
-            E = layer.getLayerE(parallelToStrong)
-            EA += layer.t * E 
+        key = ('EA', parallelToStrong)
+        if key not in self._props:
+            t = self._getLayerArray('t')
+            E = self._getLayerArray('E', parallelToStrong)
+            self._props[key] = float(np.sum(t * E))
+        EA = self._props[key]
         
         sfactor = self.sConvert(sUnit)
         lfactor = self.lConvert(lUnit)
@@ -376,19 +418,19 @@ class SectionLayered(SectionAbstract):
     Represents a layered section, for example CLT.
     """
     
-    def getEA(sUnit='Pa', lUnit='m'):
+    def getEA(self, lUnit='m', sUnit='Pa'):
         pass    
     
-    def getEIx(sUnit='Pa', lUnit='m'):
+    def getEIx(self, lUnit='m', sUnit='Pa'):
         pass
     
-    def getEIy(sUnit='Pa', lUnit='m'):
+    def getEIy(self, lUnit='m', sUnit='Pa'):
         pass
     
-    def getGAx(sUnit='Pa', lUnit='m'):
+    def getGAx(self, lUnit='m', sUnit='Pa'):
         pass
     
-    def getGAy(sUnit='Pa', lUnit='m'):
+    def getGAy(self, lUnit='m', sUnit='Pa'):
         pass
 
 
@@ -513,13 +555,13 @@ class SectionCLT(SectionLayered):
         self.NlayerTotal = NlayerTotal
         
         self.layers = layers # the base section shouldn't be used for design.
-        self.sLayers = LayerGroupClt(getActiveLayers(layers,True))
-        self.wLayers = LayerGroupClt(getActiveLayers(layers,False))
+        self.sLayers = layers.getActiveGroup(True)
+        self.wLayers = layers.getActiveGroup(False)
     
     def _initUnits(self, lUnit):
         """Initiates the length unit used for the layer"""
         self.lUnit = lUnit
-        self.lConverter = ConverterLength()
+        self.lConverter = lengthConverter
     
     @property
     def name(self):
@@ -562,6 +604,7 @@ class SectionCLT(SectionLayered):
     def getEAw(self, sUnit='Pa', lUnit='m'):
         raise NotImplementedError('Returning EA is still in development.')
     
+    @memoizeSection
     def getEIs(self, sUnit='Pa', lUnit='m'):
         """
         Returns EI about the sections strong axis. 
@@ -583,6 +626,7 @@ class SectionCLT(SectionLayered):
         lconvertWidth = self.w*self.lConvert(lUnit)
         return self.sLayers.getEI(True, sUnit, lUnit)*lconvertWidth
     
+    @memoizeSection
     def getEIw(self, sUnit='Pa', lUnit='m'):
         """
         Returns EI about the sections weak axis. 
@@ -604,6 +648,7 @@ class SectionCLT(SectionLayered):
         lconvertWidth = self.w*self.lConvert(lUnit)
         return self.wLayers.getEI(False, sUnit, lUnit)*lconvertWidth
     
+    @memoizeSection
     def getGAs(self, sUnit='Pa', lUnit='m'):
         """
         Returns GA about the sections strong axis. 
@@ -627,6 +672,7 @@ class SectionCLT(SectionLayered):
         Nlayer = self.NlayerTotal
         return self.sLayers.getGA(True, Nlayer, sUnit, lUnit)*lconvertWidth
     
+    @memoizeSection
     def getGAw(self, sUnit='Pa', lUnit='m'):
         """
         Returns GA about the sections weak axis. 
@@ -649,3 +695,31 @@ class SectionCLT(SectionLayered):
         Nlayer = self.NlayerTotal
         return self.sLayers.getGA(False, Nlayer, sUnit, lUnit)*lconvertWidth
 
+    
+    def getEIx(self, lUnit='m', sUnit='Pa'):
+        """
+        Returns EI about the sections local x axis, which is the strong axis.
+        Equivalent to getEIs.
+        """
+        return self.getEIs(sUnit = sUnit, lUnit = lUnit)
+    
+    def getEIy(self, lUnit='m', sUnit='Pa'):
+        """
+        Returns EI about the sections local y axis, which is the weak axis.
+        Equivalent to getEIw.
+        """
+        return self.getEIw(sUnit = sUnit, lUnit = lUnit)
+    
+    def getGAx(self, lUnit='m', sUnit='Pa'):
+        """
+        Returns GA about the sections local x axis, which is the strong axis.
+        Equivalent to getGAs.
+        """
+        return self.getGAs(sUnit = sUnit, lUnit = lUnit)
+    
+    def getGAy(self, lUnit='m', sUnit='Pa'):
+        """
+        Returns GA about the sections local y axis, which is the weak axis.
+        Equivalent to getGAw.
+        """
+        return self.getGAw(sUnit = sUnit, lUnit = lUnit)
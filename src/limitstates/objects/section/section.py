@@ -10,13 +10,143 @@ For example, a csao86 CLT section will store it's information.
 
 from abc import ABC, abstractmethod
 from enum import Enum
+from functools import lru_cache, wraps
 
-from .. material import MaterialAbstract, MaterialElastic
-from ... units import ConverterLength
+from .. material import MaterialAbstract, MaterialElastic, internMaterial
+from .. frozen import _FrozenObject, _freeze, _getContentKey
+from ... units import lengthConverter
 # from .plot import GeomRectangle, SectionPlotter, plotDisplayParameters
 
 __all__ = ['SectionAbstract', 'SectionMonolithic', 'SectionGeneric', 
-           'SectionRectangle', 'SectionSteel', 'SteelSectionTypes']
+           'SectionRectangle', 'SectionSteel', 'SteelSectionTypes',
+           'freezeSection', 'isFrozenSection', 'memoizeSection', 
+           'clearSectionCache']
+
+# =============================================================================
+# Frozen sections
+# =============================================================================
+
+class _FrozenSection(_FrozenObject):
+    """
+    A mixin for read only sections. Frozen sections are hashable, and are 
+    equal to other frozen sections with the same content.
+    """
+    
+    def __hash__(self):
+        return self._contentHash
+    
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, _FrozenSection):
+            return NotImplemented
+        return self._contentKey == other._contentKey
+
+def freezeSection(section:'SectionAbstract') -> 'SectionAbstract':
+    """
+    Returns a read only copy of a section. The section's material is 
+    interned, so frozen sections with the same material share it.
+    
+    Frozen sections have a hash based on their content, so they can be used
+    as dictionary keys, and the results of functions decorated with 
+    memoizeSection are cached for them. Copies made with copy.copy are 
+    normal sections, which can be modified.
+    
+    Objects nested in the section, such as CLT layers, are also frozen, so 
+    changes to the original section do not change the frozen section. Copies
+    made with copy.copy share these frozen objects, use copy.deepcopy to 
+    get a section that can be fully modified.
+
+    Parameters
+    ----------
+    section : SectionAbstract
+        The section to freeze.
+
+    Returns
+    -------
+    SectionAbstract
+        The read only section.
+
+    """
+    if isFrozenSection(section):
+        return section
+    
+    attrs = {}
+    if isinstance(getattr(section, 'mat', None), MaterialAbstract):
+        attrs['mat'] = internMaterial(section.mat)
+    
+    frozenSection = _freeze(section, _FrozenSection, attrs, replace = _internNested)
+    key = _getContentKey(frozenSection)
+    try:
+        keyHash = hash(key)
+    except TypeError:
+        raise Exception(f'{section} has propreties that can not be hashed.')
+    object.__setattr__(frozenSection, '_contentKey', key)
+    object.__setattr__(frozenSection, '_contentHash', keyHash)
+    return frozenSection
+
+def _internNested(value):
+    """
+    Returns the interned copy of materials nested in a section, i.e. the 
+    material of each CLT layer.
+    """
+    if isinstance(value, MaterialAbstract):
+        return internMaterial(value)
+
+def isFrozenSection(section:'SectionAbstract') -> bool:
+    """
+    Returns true if the section is a read only section made by freezeSection.
+    """
+    return isinstance(section, _FrozenSection)
+
+_memoizedFunctions = []
+
+def memoizeSection(func):
+    """
+    A decorator for functions that only depend on a section, and other 
+    hashable inputs. The section must be the first argument of the function,
+    which includes methods of section classes.
+    
+    Results are cached for frozen sections, so repeated calls with equal 
+    frozen sections and inputs are looked up instead of recalculated. Normal
+    sections can be modified, so their results are never cached.
+
+    Parameters
+    ----------
+    func : function
+        The function to memoize.
+
+    Returns
+    -------
+    function
+        The memoized function.
+
+    """
+    cachedFunc = lru_cache(maxsize = 4096)(func)
+    _memoizedFunctions.append(cachedFunc)
+    
+    @wraps(func)
+    def wrapper(section, *args, **kwargs):
+        if isinstance(section, _FrozenSection):
+            try:
+                return cachedFunc(section, *args, **kwargs)
+            except TypeError:
+                pass
+        return func(section, *args, **kwargs)
+    wrapper.cache_clear = cachedFunc.cache_clear
+    wrapper.cache_info  = cachedFunc.cache_info
+    return wrapper
+
+def clearSectionCache():
+    """
+    Clears the cached results of all functions decorated with memoizeSection.
+    """
+    for cachedFunc in _memoizedFunctions:
+        cachedFunc.cache_clear()
+
+# =============================================================================
+# Sections
+# =============================================================================
 
 #Rename this to SectionArchetype?
 class SectionAbstract(ABC):
@@ -123,7 +253,7 @@ class SectionAbstract(ABC):
         """
 
         self.lUnit      = lUnit
-        self.lConverter = ConverterLength()
+        self.lConverter = lengthConverter
     
     def lConvert(self, outputUnit:str):
         """
@@ -159,6 +289,7 @@ class SectionMonolithic(SectionAbstract):
     def _getCfactors(self, lUnit='m', sUnit='Pa'):
         return self.mat.sConvert(sUnit), self.lConvert(lUnit)
     
+    @memoizeSection
     def getEA(self, lUnit='m', sUnit='Pa'):
         """
         Returns the axis stiffness EA for the section. 
@@ -181,6 +312,7 @@ class SectionMonolithic(SectionAbstract):
         sfactor, lfactor = self._getCfactors(lUnit, sUnit)
         return self.mat.E * sfactor * self.A * lfactor**2
         
+    @memoizeSection
     def getEIx(self, lUnit='m', sUnit='Pa'):
         """
         Returns EI about the sections local x axis, which is generally the 
@@ -202,6 +334,7 @@ class SectionMonolithic(SectionAbstract):
         sfactor, lfactor = self._getCfactors(lUnit, sUnit)
         return self.mat.E * sfactor * self.Ix * lfactor**4        
     
+    @memoizeSection
     def getEIy(self, lUnit='m', sUnit='Pa'):
         """
         Returns EI about the sections local y axis, which is generally the 
@@ -223,6 +356,7 @@ class SectionMonolithic(SectionAbstract):
         sfactor, lfactor = self._getCfactors(lUnit, sUnit)
         return self.mat.E * sfactor * self.Iy * lfactor**4
     
+    @memoizeSection
     def getGAx(self, lUnit='m', sUnit='Pa'):
         """
         Returns GA about the sections local x axis, which is generally the 
@@ -244,6 +378,7 @@ class SectionMonolithic(SectionAbstract):
         sfactor, lfactor = self._getCfactors(lUnit, sUnit)
         return self.mat.E * sfactor * self.Avx * lfactor**2
          
+    @memoizeSection
     def getGAy(self, lUnit='m', sUnit='Pa'):
         """
         Returns GA about the sections local y axis, which is generally the 
@@ -470,6 +605,7 @@ class SectionSteel(SectionMonolithic):
     def __repr__(self):
         return f'<limitstates {self.name} Section>'
     
+    @memoizeSection
     def getCy(self, lUnit = 'm', sUnit='Pa'):
         lfactor = self.lConvert(lUnit)
         sfactor = self.mat.sConvert(sUnit)
@@ -479,6 +615,7 @@ class SectionSteel(SectionMonolithic):
     def Cy(self):
         return self.getCy( 'm', 'Pa')
     
+    @memoizeSection
     def getZ(self, useX:bool = True, lUnit:str = 'mm'):
         """
         Returns the section's plastic modulus in the units and direction input.
@@ -503,6 +640,7 @@ class SectionSteel(SectionMonolithic):
         else:
             return self.Zy*lfactor**3
     
+    @memoizeSection
     def getS(self, useX = True, lUnit = 'mm'):
         """
         Returns the section's elastic modulus in the units and direction input.
@@ -528,6 +666,7 @@ class SectionSteel(SectionMonolithic):
         else:
             return self.Sy*lfactor**3    
     
+    @memoizeSection
     def getI(self, useX = True, lUnit = 'mm'):
         """
         Returns the section's moment of inertia in the units 
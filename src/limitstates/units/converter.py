@@ -5,21 +5,48 @@ different types.
 
 from abc import ABC
 from dataclasses import dataclass
+import numpy as np
 
 __all__= ["UnitConverter","ConverterLength", "ConverterLengthImperialinch",
-          "ConverterForce","ConverterStress","ConverterDensity"]
+          "ConverterForce","ConverterStress","ConverterDensity", "UnitArray",
+          "lengthConverter", "forceConverter", "stressConverter",
+          "densityConverter"]
 
 @dataclass
 class Unit:
     name:str
     factor:float
 
+def _buildFactorTable(unitDict:dict) -> dict[tuple[str,str], float]:
+    """
+    Precomputes the conversion factor between every pair of units in the unit
+    dictionary. Factors between a unit and itself are exactly 1.
+    """
+    factorTable = {}
+    for inputUnit, inputFactor in unitDict.items():
+        for outputUnit, outputFactor in unitDict.items():
+            if inputUnit == outputUnit:
+                factorTable[(inputUnit, outputUnit)] = 1
+            else:
+                factorTable[(inputUnit, outputUnit)] = inputFactor / outputFactor
+    return factorTable
+
 class UnitConverter(ABC):
     """
     The base unit converter class, contains interfaces all unit converter
     classes use.
+    
+    The conversion factor between each pair of units is computed once when 
+    the converter class is defined, and stored in the 'factorTable' attribute.
+    Converters are stateless, so a single instance can be shared between 
+    objects.
     """
     unitDict = {}
+    factorTable = {}
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.factorTable = _buildFactorTable(cls.unitDict)
     
     def _unsupportedException(self, unit):
         raise Exception(f'Unit {unit} is unspported, expected one of '\
@@ -55,6 +82,41 @@ class UnitConverter(ABC):
         """
 
         return value * (self.getConversionFactor(inputUnit, outputUnit))
+    
+    def convertArray(self, inputUnit:str, outputUnit:str, values, 
+                     powers:int|list[int] = 1) -> np.ndarray:
+        """
+        Converts an array of values from one unit to another unit in a single 
+        operation. 
+        
+        Each value can be raised to a power of the unit, i.e. a length 
+        converter can be used for areas (power 2) or moments of inertia 
+        (power 4). The powers are broadcast against the values, so a table 
+        with one row per object and one column per property can be converted
+        by passing one power per column.
+
+        Parameters
+        ----------
+        inputUnit : str
+            A string representing the input unit. Must be one of the units in 
+            the the unit converter 'unitDict' attribute.
+        outputUnit : str
+            A string representing the output unit. Must be one of the units in 
+            the the unit converter 'unitDict' attribute.
+        values : array_like
+            The values to be converted.
+        powers : int|list[int], optional
+            The power of the unit for each value, or for each column of 
+            values. The default is 1.
+
+        Returns
+        -------
+        np.ndarray
+            The values converted from the input unit to the output unit.
+
+        """
+        factor = self.getConversionFactor(inputUnit, outputUnit)
+        return np.asarray(values, dtype=float) * factor**np.asarray(powers)
         
     def getConversionFactor(self, inputUnit:str, outputUnit:str) -> float:
         """
@@ -75,11 +137,9 @@ class UnitConverter(ABC):
             The conversion factor between units.
 
         """
-        #!!! Consider returning 1 if the units are the same. Check the performance of this.
-        
         # Most of the time we expect units to work, so we use try and except.
         try:
-            return self.unitDict[inputUnit] / self.unitDict[outputUnit]
+            return self.factorTable[(inputUnit, outputUnit)]
         # In the rare case they do not work, find out what went wrong.
         except:
             self._checkInDict(inputUnit)
@@ -135,4 +195,66 @@ class ConverterDensity(UnitConverter):
     unitDict = {'kg/m3':1, 'lbm/ft3':0.062427960576145, 'N/m3':9.8066500286389, 
                 'kN/m3':9.8066500286389 / 1000}
 
+@dataclass
+class UnitArray:
+    """
+    An array of values that is tagged with the unit it is stored in.
+    
+    Parameters
+    ----------
+    values : np.ndarray
+        The values of the array.
+    unit : str
+        The unit the values are stored in.
+    power : int|list[int], optional
+        The power of the unit for each value, or each column of values, e.g. 
+        2 for areas, 4 for moments of inertia. The default is 1.
+    converter : UnitConverter, optional
+        The converter for the type of unit used. The default is None, which 
+        uses the shared length converter.
+    """
+    values:np.ndarray
+    unit:str
+    power:int|list[int] = 1
+    converter:UnitConverter = None
+    
+    def __post_init__(self):
+        self.values = np.asarray(self.values, dtype=float)
+        if self.converter is None:
+            self.converter = lengthConverter
+    
+    def __len__(self):
+        return len(self.values)
+    
+    def __array__(self, dtype = None, copy = None):
+        if dtype is None:
+            return self.values
+        return self.values.astype(dtype)
+    
+    def convert(self, outputUnit:str) -> 'UnitArray':
+        """
+        Returns a new array with the values converted to the output unit.
+
+        Parameters
+        ----------
+        outputUnit : str
+            The unit to convert the values to.
+
+        Returns
+        -------
+        UnitArray
+            The converted array.
+
+        """
+        values = self.converter.convertArray(self.unit, outputUnit, 
+                                             self.values, self.power)
+        return UnitArray(values, outputUnit, self.power, self.converter)
+
+# =============================================================================
+# Shared converters
+# =============================================================================
 
+lengthConverter  = ConverterLength()
+forceConverter   = ConverterForce()
+stressConverter  = ConverterStress()
+densityConverter = ConverterDensity()
@@ -5,6 +5,7 @@ Checks 8.5.10 from the Canadian CLT handbook.
 import limitstates as ls
 
 import limitstates.design.csa.o86.c19 as o86
+import numpy as np
 
 import pytest
 
@@ -116,12 +117,70 @@ def test_Panel_DB():
     assert VrSol == pytest.approx(Vr, 0.01)
     assert VrWSol == pytest.approx(VrW, 0.01) # There is likely rounding erros in the presented solution.
 
+
+def test_Panel_DB_batched():
+    
+    """
+    Checks the batched checks match the checks for a single panel.
+    """
+    
+    sections = _initDB()
+    member = ls.initSimplySupportedMember(6, 'm')
+
+    for useStrongAxis in [True, False]:
+        Mr = o86.checkMrCltSections(sections, useStrongAxis = useStrongAxis)
+        Vr = o86.checkCltSectionsShear(sections, useStrongAxis = useStrongAxis)
+        assert Mr.shape == (len(sections), 1)
+        
+        for ii, section in enumerate(sections):
+            beamColumn = o86.BeamColumnCltCsa19(member, section)
+            MrSingle = o86.checkMrCltBeam(beamColumn, useStrongAxis = useStrongAxis)
+            VrSingle = o86.checkCltBeamShear(beamColumn, useStrongAxis = useStrongAxis)
+            assert Mr[ii, 0] == pytest.approx(MrSingle)
+            assert Vr[ii, 0] == pytest.approx(VrSingle)
+
+
+def test_Panel_DB_batched_fire():
+    
+    """
+    Checks the batched fire checks against the wood design manual, see
+    test_design_clt_fire.
+    """
+    
+    sections = _initDB()
+    knet = o86.kdfi*o86.kfi['cltE']
+    FRR = np.array([45, 90, 600])
+    
+    Mrx = o86.checkMrCltSections(sections, knet, FRR, Bn = 0.65)
+    Mry = o86.checkMrCltSections(sections, knet, FRR, Bn = 0.65, useStrongAxis=False)
+    assert Mrx.shape == (len(sections), 3)
+    assert Mrx[0, 0] == pytest.approx(7.03*1e3, 0.01)
+    assert Mry[0, 0] == pytest.approx(1.91*1e3, 0.01)
+    
+    # Panels that are fully burnt have no capacity.
+    assert np.all(Mrx[:, 2] == 0)
+    
+    # Fire portection delays the burn.
+    portection = o86.GypusmFlatCSA19('15.9mm')
+    Vr = o86.checkCltSectionsShear(sections, knet, FRR, Bn = 0.65)
+    VrPort = o86.checkCltSectionsShear(sections, knet, FRR, portection, Bn = 0.65)
+    assert np.all(VrPort[:, :2] >= Vr[:, :2])
+    assert np.any(VrPort[:, :2] > Vr[:, :2])
+    
+    # knet can be different for each fire duration.
+    MrKnet = o86.checkMrCltSections(sections, [knet, 1, 1], FRR, Bn = 0.65)
+    assert MrKnet[0, 0] == Mrx[0, 0]
+    assert MrKnet[0, 1] == pytest.approx(Mrx[0, 1] / knet)
+
+
 if __name__ == '__main__':
     # pass
     test_Panel_Mr()
     test_Panel_Vr()
     
     test_Panel_DB()
+    test_Panel_DB_batched()
+    test_Panel_DB_batched_fire()
 
 
     
\ No newline at end of file
@@ -54,7 +54,23 @@ def test_getGlulamBeamColumn():
     assert hasattr(myElement.designProps, 'sectionFire')
 
  
+def test_getGlulamBeamColumns():
+    """
+    Checks if many glulam elements initialize with the same design 
+    propreties as single elements.
+    """
+    sections = [mySection, ls.SectionRectangle(myMat, width, 2*depth)]
+    myElements = o86.getBeamColumnsGlulamCsa19([Length, 2*Length], sections, [0, 1], 
+                                               kexB = 1.2)
+    myElement = o86.getBeamColumnGlulamCsa19(Length, mySection, kexB = 1.2)
+    
+    assert vars(myElements[0].designProps) == vars(myElement.designProps)
+    assert myElements[1].designProps.Lx == 2*Length
+    assert myElements[1].section is sections[1]
+    assert o86.checkMrGlulamBeamSimple(myElements[0]) == o86.checkMrGlulamBeamSimple(myElement)
+
 
 if __name__ == "__main__":
     test_GlulamInits()
-    test_getGlulamBeamColumn()
\ No newline at end of file
+    test_getGlulamBeamColumn()
+    test_getGlulamBeamColumns()
\ No newline at end of file
@@ -4,6 +4,7 @@ Tests if sections load properly for CSA o86
 
 import limitstates as ls
 import limitstates.design.csa.o86.c19 as csa
+import pytest
 
 mm = 0.001
 m = 1
@@ -41,6 +42,29 @@ def test_loadMat():
     assert myMat.grade == '20f-E'
     assert str(myMat) == "<limitstates CSAo86-19 glulam SPF 20f-E material.>"
 
+def test_loadMat_shared():
+    """
+    Materials are only loaded once, and shared between calls.
+    """
+    myMat = csa.loadGlulamMaterial('SPF', '20f-E')
+    assert myMat is csa.loadGlulamMaterial('SPF', '20f-E')
+    assert myMat in csa.loadGlulamMaterialDB()
+    
+    cltMats = csa.loadCltMatDB()
+    assert cltMats[0][0] is csa.loadCltMatDB()[0][0]
+    
+    sections1 = csa.loadCltSections()
+    sections2 = csa.loadCltSections()
+    layer1 = sections1[0].layers[0]
+    layer2 = sections2[0].layers[0]
+    assert layer1.mat is layer2.mat
+
+def test_loadMat_missing():
+    with pytest.raises(Exception):
+        csa.loadGlulamMaterial('SPF', '30f-E')
+
 if __name__ == "__main__":
     test_repr()
-    test_loadMat()
\ No newline at end of file
+    test_loadMat()
+    test_loadMat_shared()
+    test_loadMat_missing()
\ No newline at end of file
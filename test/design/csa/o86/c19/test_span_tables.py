@@ -0,0 +1,136 @@
+"""
+Tests CLT span tables.
+"""
+
+import limitstates as ls
+import limitstates.design.csa.o86.c19 as o86
+import numpy as np
+import pytest
+
+sections = o86.loadCltSections()
+loads = np.array([1.9, 2.4, 4.8])
+limits = np.array([240, 360])
+
+def test_vibration_span():
+    section = sections[0]
+    EI = section.getEIs() / (section.w / 1000)
+    m = sum(layer.t / 1000 * layer.mat.rho for layer in section.layers)
+    
+    assert o86.getCltLinearMass([section])[0] == pytest.approx(m)
+    Lv = o86.getCltVibrationSpans([section])[0]
+    assert Lv == pytest.approx(0.11 * EI**0.29 / m**0.12)
+
+def test_deflection_spans():
+    """
+    The deflection of each panel at its maximum span should match the limit.
+    """
+    spans = o86.getCltDeflectionSpans(sections, loads, limits, Nspan = 2)
+    assert spans.shape == (len(sections), 3, 2)
+    
+    section = sections[3]
+    L = spans[3, 1, 1]
+    delta = ls.getMaxDeflection(section.getEIs(), section.getGAs(), 2400, L, 2)
+    assert delta == pytest.approx(L / 360)
+    
+    # Higher loads and stricter limits give shorter spans.
+    assert np.all(np.diff(spans, axis = 1) < 0)
+    assert np.all(spans[..., 1] < spans[..., 0])
+
+def test_span_table():
+    spans, deflectionSpans, vibrationSpans = o86.getCltSpanTable(
+        sections, loads, limits, multiSpanFactor = 1.2)
+    assert spans.shape == (len(sections), 3, 3, 2)
+    assert vibrationSpans.shape == (len(sections), 3)
+    assert vibrationSpans[:, 1] == pytest.approx(1.2*vibrationSpans[:, 0])
+    assert np.all(spans == np.minimum(deflectionSpans, vibrationSpans[..., None, None]))
+    
+    spans, deflectionSpans, _ = o86.getCltSpanTable(sections, loads, limits,
+                                                    checkVibration = False)
+    assert np.all(spans == deflectionSpans)
+
+glulamMat = o86.loadGlulamMaterial('SPF', '20f-E')
+glulamSections = o86.loadGlulamSections(glulamMat)[::40]
+glulamLoads = np.array([5., 20., 60.])
+
+def test_kL_vectorized():
+    E, Fb = glulamMat.E, glulamMat.fb
+    Cb = np.array([9.9, 10.1, 30, 60])
+    kL = o86.checkKL(Cb, E, Fb)
+    assert kL == pytest.approx([o86.checkKL(x, E, Fb) for x in Cb])
+
+def test_glulam_factored_loads():
+    """
+    Load resistances should match the element checks.
+    """
+    section = glulamSections[10]
+    spans = np.array([4., 9.])
+    wMr, wVr = o86.getGlulamFactoredLoads([section], spans, knet = 0.8)
+    
+    for ii, L in enumerate(spans):
+        element = o86.getBeamColumnGlulamCsa19(L, section, 'm')
+        Mr = o86.checkMrGlulamBeamSimple(element, 0.8)
+        Vr = o86.checkVrGlulamBeamSimple(element, 0.8)
+        Wr = o86.checkWrGlulamBeamSimple(element, 0.8)
+        assert wMr[0, ii]*1000 == pytest.approx(8*Mr / L**2)
+        assert wVr[0, ii]*1000 == pytest.approx(max(2*Vr / L, Wr / L))
+
+def test_glulam_slender_loads():
+    """
+    Beams with Cb over 50 should have no moment resistance.
+    """
+    section = [s for s in o86.loadGlulamSections(glulamMat) 
+               if s.name.startswith('79x1406')]
+    spans = np.array([4., 6., 12., 20.])
+    wMr, wVr = o86.getGlulamFactoredLoads(section, spans, lateralSupport = False)
+    
+    b, d = section[0].b, section[0].d
+    Cb = o86.checkCb(spans*1000*1.92, d, b)
+    assert np.any(Cb > 50) and np.any(Cb < 50)
+    assert np.all(np.isnan(wMr[0]) == (Cb > 50))
+    assert np.all(wMr[~np.isnan(wMr)] > 0)
+    
+    wr, _ = o86.getGlulamLoadTable(section, spans, lateralSupport = False)
+    assert np.all(np.isnan(wr[0]) == (Cb > 50))
+
+def test_glulam_load_table():
+    spans = np.array([3., 6.])
+    wr, wDelta = o86.getGlulamLoadTable(glulamSections, spans, limits = [360])
+    assert wr.shape == (len(glulamSections), 2)
+    assert wDelta.shape == (len(glulamSections), 2, 1)
+    
+    section = glulamSections[5]
+    EI = section.mat.E*section.Ix
+    assert wDelta[5, 1, 0] == pytest.approx(384*EI / (5*6000**3*360))
+
+def test_glulam_span_table():
+    """
+    The resistance at each strength controlled span should equal the load.
+    """
+    for lateralSupport in [True, False]:
+        spans, strengthSpans, deflectionSpans = o86.getGlulamSpanTable(
+            glulamSections, glulamLoads, glulamLoads / 1.5, [240, 360],
+            lateralSupport = lateralSupport)
+        assert spans.shape == (len(glulamSections), 3, 2)
+        
+        for jj, w in enumerate(glulamLoads):
+            L = strengthSpans[:, jj]
+            wMr, wVr = o86.getGlulamFactoredLoads(glulamSections, L, 
+                                                  lateralSupport = lateralSupport)
+            wr = np.minimum(wMr, wVr).diagonal()
+            assert np.all(wr >= w*(1 - 1e-9))
+            
+            wMr, wVr = o86.getGlulamFactoredLoads(glulamSections, L*1.0001, 
+                                                  lateralSupport = lateralSupport)
+            assert np.all(np.minimum(wMr, wVr).diagonal() < w)
+            
+    assert np.all(spans == np.minimum(strengthSpans[..., None], deflectionSpans))
+
+if __name__ == '__main__':
+    test_vibration_span()
+    test_deflection_spans()
+    test_span_table()
+    test_kL_vectorized()
+    test_glulam_factored_loads()
+    test_glulam_slender_loads()
+    test_glulam_load_table()
+    test_glulam_span_table()
@@ -168,6 +168,41 @@ def test_case4():
     assert Mrmulti[1] == Mru2 
     assert Mrmulti[2] == Mru3 
 
+def test_envelope():
+    """
+    Checks all load cases in an envelope at once.
+    """
+    myBeam = _initBeam('W460x89')
+    bmd = _getBMD(myBeam)
+    bmd2 = ls.DesignDiagram(bmd.xy * [1, 0.5])
+    env = ls.getDesignDiagramEnvelope([bmd, bmd2])
+    
+    MrEnv, xout, omegaEnv = s16.checkMrBeamMultiSpan(myBeam, env, 2)    
+    
+    for ii, diagram in enumerate([bmd, bmd2]):
+        Mrmulti, _, omega = s16.checkMrBeamMultiSpan(myBeam, diagram, 2)
+        assert MrEnv[ii] == pytest.approx(Mrmulti)
+        assert omegaEnv[ii] == pytest.approx(omega)
+
+def test_pattern_envelope():
+    """
+    Checks all skip loading patterns from the influence model at once.
+    """
+    myBeam = _initBeam('W460x89')
+    model = ls.InfluenceModel(myBeam.member)
+    sfdEnv, bmdEnv = model.getPatternDiagrams(-10, -2)
+    
+    MrEnv, xout, omegaEnv = s16.checkMrBeamMultiSpan(myBeam, bmdEnv, 2)    
+    assert len(MrEnv) == len(bmdEnv)
+    
+    Mrmulti, _, omega = s16.checkMrBeamMultiSpan(myBeam, bmdEnv[1], 2)
+    assert MrEnv[1] == pytest.approx(Mrmulti)
+    assert omegaEnv[1] == pytest.approx(omega)
+    
+    sfdEnv, bmdEnv = model.getPatternEnvelope(-10, -2)
+    MrEnv, xout, omegaEnv = s16.checkMrBeamMultiSpan(myBeam, bmdEnv, 2)    
+    assert len(MrEnv) == 2
+
 def _getOmega(x,y, L):
     xy = np.column_stack((x, y))
     bmd = ls.DesignDiagram(xy)
@@ -212,4 +247,6 @@ if __name__ == "__main__":
     test_case2()
     test_case3()
     test_case4()
+    test_envelope()
+    test_pattern_envelope()
     test_bmd_omegas()
\ No newline at end of file
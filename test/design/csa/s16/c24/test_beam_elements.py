@@ -0,0 +1,60 @@
+"""
+Tests if steel elements initialize properly for CSA S16
+"""
+
+import limitstates.design.csa.s16.c24 as s16
+import limitstates as ls
+import pytest
+from limitstates.objects.read import getSteelSections
+
+mat = s16.MaterialSteelCsa24(345)
+steelSections = getSteelSections(mat, 'us', 'aisc_16_si', 'W')
+sections = [ls.getByName(steelSections, 'W310x74'), 
+            ls.getByName(steelSections, 'W530x72')]
+
+def test_getBeamColumns():
+    beams = s16.getBeamColumnsSteelCsa24([6, 8, 4], sections, [1, 0, 1], 
+                                         kz = 1.2, lateralSupport = False)
+    beam = s16.getBeamColumnSteelCsa24(8, sections[0], kz = 1.2, 
+                                       lateralSupport = False)
+    
+    assert len(beams) == 3
+    assert vars(beams[1].designProps) == vars(beam.designProps)
+    assert beams[0].section is sections[1]
+    assert beams[2].designProps.Lez == pytest.approx(4*1.2)
+    
+    Mr = s16.checkBeamMrUnsupported(beams[1])
+    assert Mr == s16.checkBeamMrUnsupported(beam)
+
+def test_getBeamColumns_cantilever():
+    fixed = ls.SupportTypes2D.FIXED.value
+    free  = ls.SupportTypes2D.FREE.value
+    pin   = ls.SupportTypes2D.PINNED.value
+    roller = ls.SupportTypes2D.ROLLER.value
+    supportTypes = [(pin, roller), (fixed, free)]
+    beams = s16.getBeamColumnsSteelCsa24([6, 3], sections, 0, 
+                                         supportCodes = [0, 1],
+                                         supportTypes = supportTypes)
+    
+    assert beams[0].member.nodes[1].support == roller
+    assert beams[1].member.nodes[0].support == fixed
+    assert beams[1].member.nodes[1].support == free
+    
+def test_getBeamColumns_props():
+    beams = s16.getBeamColumnsSteelCsa24([6, 8], sections, [1, 1])
+    beam = s16.getBeamColumnSteelCsa24(8, sections[1])
+    
+    assert type(beams[1]) == type(beam)
+    assert vars(beams[1]).keys() == vars(beam).keys()
+    assert beams[1].eleDisplayProps.member is beams[1].member
+    assert beams[1].eleDisplayProps.section is sections[1]
+    assert beams[1].eleDisplayProps.configObject == beam.eleDisplayProps.configObject
+    
+    beams[0].userProps['a'] = 1
+    assert 'a' not in beams[1].userProps
+    assert beams[0].getEIx() == beam.getEIx()
+
+if __name__ == '__main__':
+    test_getBeamColumns()
+    test_getBeamColumns_cantilever()
+    test_getBeamColumns_props()
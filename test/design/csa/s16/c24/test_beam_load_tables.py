@@ -0,0 +1,84 @@
+"""
+Tests steel beam load tables.
+"""
+
+import limitstates.design.csa.s16.c24 as s16
+import limitstates as ls
+import numpy as np
+import pytest
+import os
+import tempfile
+from limitstates.objects.read import getSteelSections
+
+mat = s16.MaterialSteelCsa24(350)
+wSections = getSteelSections(mat, 'csa', 'cisc_12', 'w')[::20]
+hssSections = getSteelSections(mat, 'csa', 'cisc_12', 'hss')
+spans = np.array([2., 6., 12.])
+
+def test_Mr_unsupported_vectorized():
+    Mx = 300.
+    Mu = np.array([100., 250., 1000.])
+    Mr = s16.getMrUnsupported(Mx, Mu)
+    assert Mr == pytest.approx([s16.getMrUnsupported(Mx, x) for x in Mu])
+    assert Mr[0] == 100.
+
+def test_factored_loads_supported():
+    section = wSections[5]
+    wMr, wVr = s16.getSteelBeamFactoredLoads([section], spans)
+    
+    for ii, L in enumerate(spans):
+        beam = s16.getBeamColumnSteelCsa24(L, section)
+        Mr = s16.checkBeamMrSupported(beam)
+        Vr = s16.checkFsBeam(beam)
+        assert wMr[0, ii]*1000 == pytest.approx(8*Mr / L**2)
+        assert wVr[0, ii]*1000 == pytest.approx(2*Vr / L)
+
+def test_factored_loads_unsupported():
+    section = wSections[5]
+    omega2 = s16.checkOmega(1, 0.75, 1, 0.75)
+    wMr, _ = s16.getSteelBeamFactoredLoads([section], spans, False)
+    
+    for ii, L in enumerate(spans):
+        beam = s16.getBeamColumnSteelCsa24(L, section)
+        Mr = s16.checkBeamMrUnsupported(beam, omega2)
+        assert wMr[0, ii]*1000 == pytest.approx(8*Mr / L**2)
+
+def test_load_table():
+    table = s16.getSteelBeamLoadTable(wSections + hssSections, spans, 
+                                      limits = [240, 360])
+    Nsection = len(wSections) + len(hssSections)
+    assert table.wr.shape == (Nsection, 3)
+    assert table.wDelta.shape == (Nsection, 3, 2)
+    
+    section = wSections[2]
+    ind = table.getSectionIndex(section.name)
+    EI = section.mat.E*1e6*section.Ix / 1000**4
+    assert table.wDelta[ind, 1, 1]*1000 == pytest.approx(384*EI / (5*6**3*360))
+    assert table.wr[ind] == pytest.approx(np.minimum(table.wMr[ind], table.wVr[ind]))
+    
+    # Class 4 HSS sections can't be designed.
+    assert np.any(np.isnan(table.wr[len(wSections):]))
+    assert not np.any(np.isnan(table.wr[:len(wSections)]))
+
+def test_load_table_npz():
+    table = s16.getSteelBeamLoadTable(wSections, spans, limits = 360)
+    tableNoLimits = s16.getSteelBeamLoadTable(wSections, spans)
+    with tempfile.TemporaryDirectory() as tempDir:
+        fileName = os.path.join(tempDir, 'beamLoadTable.npz')
+        table.toNPZ(fileName)
+        tableRead = s16.BeamLoadTable.fromNPZ(fileName)
+        
+        tableNoLimits.toNPZ(fileName)
+        tableNoLimitsRead = s16.BeamLoadTable.fromNPZ(fileName)
+    
+    assert tableRead.names == table.names
+    assert np.array_equal(tableRead.wr, table.wr)
+    assert np.array_equal(tableRead.wDelta, table.wDelta)
+    assert tableNoLimitsRead.wDelta is None
+
+if __name__ == '__main__':
+    test_Mr_unsupported_vectorized()
+    test_factored_loads_supported()
+    test_factored_loads_unsupported()
+    test_load_table()
+    test_load_table_npz()
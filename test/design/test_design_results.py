@@ -0,0 +1,100 @@
+"""
+Tests the column store for design results.
+"""
+
+import csv
+import os
+import tempfile
+
+import numpy as np
+import pytest
+from limitstates.design import DesignResults
+
+def _getResults():
+    results = DesignResults(capacity = 2)
+    results.add(0, 'Mr', '7.5.6.5', '1.4D', 10, 20)
+    results.add(0, 'Vr', '7.5.7', '1.4D', -15, 20)
+    results.add([1, 1, 1], 'Mr', '7.5.6.5', ['1.4D', '1.25D + 1.5L', '1.25D + 1.5S'], 
+                [5, 30, 12], 25)
+    results.add(2, 'Mr', '7.5.6.5', '1.4D', 8, [10, 40])
+    return results
+
+def test_add():
+    results = _getResults()
+    assert len(results) == 7
+    assert results.capacity == 8
+    assert results.getColumn('utilization') == pytest.approx([0.5, 0.75, 0.2, 1.2, 0.48, 0.8, 0.2])
+    assert list(results.getColumn('check')) == ['Mr', 'Vr', 'Mr', 'Mr', 'Mr', 'Mr', 'Mr']
+    assert results.names['combination'] == ['1.4D', '1.25D + 1.5L', '1.25D + 1.5S']
+
+def test_governing():
+    results = _getResults()
+    assert results.getGoverningIndex() == 3
+    assert results.getGoverningIndex(results.getMask(elementId = 0)) == 1
+    
+    elementIds, inds = results.getGoverningByElement()
+    assert list(elementIds) == [0, 1, 2]
+    assert list(inds) == [1, 3, 5]
+    
+    elementIds, inds = results.getGoverningByElement('Mr')
+    assert list(inds) == [0, 3, 5]
+    assert list(results.getFailures()) == [3]
+
+def test_governing_empty():
+    results = DesignResults()
+    with pytest.raises(Exception):
+        results.getGoverningIndex()
+    
+    results = _getResults()
+    with pytest.raises(Exception):
+        results.getGoverningIndex(results.getMask(check = 'Nr'))
+
+def test_mask():
+    results = _getResults()
+    mask = results.getMask(check = 'Mr', combination = '1.4D')
+    assert list(np.flatnonzero(mask)) == [0, 2, 5, 6]
+    assert not np.any(results.getMask(check = 'Nr'))
+
+def test_export():
+    results = _getResults()
+    with tempfile.TemporaryDirectory() as tempDir:
+        csvFile = os.path.join(tempDir, 'results.csv')
+        results.toCSV(csvFile)
+        with open(csvFile) as f:
+            lines = f.read().splitlines()
+        assert lines[0] == 'elementId,check,clause,combination,demand,resistance,utilization'
+        assert lines[4] == '1,Mr,7.5.6.5,1.25D + 1.5L,30,25,1.2'
+        assert len(lines) == 8
+        
+        npzFile = os.path.join(tempDir, 'results.npz')
+        results.toNPZ(npzFile)
+        resultsIn = DesignResults.fromNPZ(npzFile)
+    
+    assert len(resultsIn) == 7
+    assert resultsIn.getColumn('demand') == pytest.approx(results.getColumn('demand'))
+    assert list(resultsIn.getColumn('combination')) == list(results.getColumn('combination'))
+    
+    resultsIn.add(3, 'Mr', '7.5.6.5', '1.4D', 1, 10)
+    assert resultsIn.names['combination'] == results.names['combination']
+
+def test_export_quoted():
+    results = DesignResults()
+    results.add(0, 'Mr', '7.5.6.5, 7.5.6.6', '1.25D + 1.5L "snow"', 10, 20)
+    with tempfile.TemporaryDirectory() as tempDir:
+        csvFile = os.path.join(tempDir, 'results.csv')
+        results.toCSV(csvFile)
+        with open(csvFile, newline='') as f:
+            rows = list(csv.reader(f))
+    
+    assert len(rows) == 2
+    assert rows[1] == ['0', 'Mr', '7.5.6.5, 7.5.6.6', '1.25D + 1.5L "snow"', 
+                       '10', '20', '0.5']
+
+
+if __name__ == '__main__':
+    test_add()
+    test_governing()
+    test_governing_empty()
+    test_mask()
+    test_export()
+    test_export_quoted()
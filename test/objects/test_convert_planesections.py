@@ -1,5 +1,7 @@
 
 
+import copy
+
 import limitstates as ls
 import limitstates.design.csa.o86.c19 as o86
 import planesections as ps
@@ -44,7 +46,8 @@ def _setup_Beam_2():
     L = 3
     supportPositions = [0, L]
     
-    myMat       = o86.loadGlulamMaterial('SPF', '20f-E')
+    # Database materials are shared, so they are copied before modifying.
+    myMat       = copy.copy(o86.loadGlulamMaterial('SPF', '20f-E'))
     myMat.E = E
     myMat.G = E/16
     mySection   = ls.SectionRectangle(myMat, b, h)
@@ -112,12 +115,61 @@ def test_maxDisp():
     assert (check1 and check2)
 
 
-# def
+def _applyLoad(psBeam, loadKey):
+    psBeam.addVerticalLoad(2, Py)
+
+def test_batch_convert_groups():
+    elements = [_setup_Beam_2(), _setup_Beam_1(), _setup_Beam_2()]
+    beams, beamInds, _ = ls.convertBeamColumnsToPlanesections(elements)
+    
+    assert len(beams) == 2
+    assert beamInds == [0, 1, 0]
+
+def test_batch_convert_loadKeys():
+    elements = [_setup_Beam_2(), _setup_Beam_2()]
+    beams, beamInds, loadKeys = ls.convertBeamColumnsToPlanesections(elements, 
+                                                        loadKeys = ['A', 'B'])
+    assert len(beams) == 2
+    assert loadKeys == ['A', 'B']
+
+def test_batch_analysis():
+    elements = [_setup_Beam_2(), _setup_Beam_2()]
+    bmds, sfds = ls.analyzeBeamColumns(elements, _applyLoad, 
+                                       analyzer = ps.PyNiteAnalyzer2D)
+    
+    L = 3
+    MAsolution = abs(4*L*Py / 27)
+    bmd = elements[1].member.analysisData['bmd']
+    assert bmd is bmds[0]
+    assert isinstance(elements[0].member.analysisData['sfd'], ls.DesignDiagram)
+    assert abs(bmd.getForceAtx(0)) == pytest.approx(MAsolution, 0.001)
+
+def _applyLoadmm(psBeam, loadKey):
+    psBeam.addVerticalLoad(2000, Py)
+
+def test_batch_analysis_units():
+    """
+    Diagrams should use the length units of each member.
+    """
+    element = _setup_Beam_2()
+    member = ls.initSimplySupportedMember(3000, 'mm')
+    elementmm = o86.BeamColumnGlulamCsa19(member, element.section, 
+                                          o86.DesignPropsGlulam19())
+    bmds, sfds = ls.analyzeBeamColumns([elementmm], _applyLoadmm, 
+                                       analyzer = ps.PyNiteAnalyzer2D)
+    
+    assert bmds[0].lUnit == 'mm'
+    assert sfds[0].lUnit == 'mm'
+    assert bmds[0].xy[-1, 0] == pytest.approx(3000)
 
 
 if __name__ == '__main__':
     test_Mmax()
     test_maxDisp()
+    test_batch_convert_groups()
+    test_batch_convert_loadKeys()
+    test_batch_analysis()
+    test_batch_analysis_units()
 #     test_node_lengths()
 #     test_line_fromNodes()
 #     test_line_fromlengths()
@@ -2,7 +2,10 @@
 Tests if materials can initalize correctly and use unit conversions.
 """
 
-from limitstates import MaterialElastic, SectionRectangle, getBeamColumn
+from limitstates import (MaterialElastic, SectionRectangle, getBeamColumn, 
+                         getBeamColumns, getElementStiffness)
+import limitstates.design.csa.o86.c19 as c19
+from dataclasses import dataclass, field
 import pytest
 
 
@@ -17,9 +20,112 @@ def test_getBeam():
     
     assert myBeam.getLength() == L
     
+
+def test_stiffness_units():
+    myMat = MaterialElastic(9.5*1000, 500, sUnit = 'MPa')
+    section = SectionRectangle(myMat, 200, 600)
+    myBeam = getBeamColumn(4, section, 'm')
+    
+    EI = 9.5*1000 * 200*600**3 / 12
+    assert myBeam.getEIx('mm', 'MPa') == pytest.approx(EI)
+    assert myBeam.getEIx() == pytest.approx(EI * 1e6 * 1e-12)
+    assert myBeam.getVolume('m') == pytest.approx(4*0.2*0.6)
+
+
+def test_stiffness_cache():
+    myMat = MaterialElastic(9.5*1000)
+    section = SectionRectangle(myMat, 200, 600)
+    myBeam = getBeamColumn(4, section, 'm')
+    
+    EI = myBeam.getEIx()
+    assert myBeam.getEIx() == EI
+    
+    # A new section replaces the cached values.
+    myBeam.section = SectionRectangle(myMat, 200, 300)
+    assert myBeam.getEIx() == pytest.approx(EI / 8)
+    
+    # Sections modified in place need the cache to be cleared.
+    myBeam.section.Ix *= 8
+    assert myBeam.getEIx() == pytest.approx(EI / 8)
+    myBeam.clearStiffnessCache()
+    assert myBeam.getEIx() == pytest.approx(EI)
+
+
+def test_stiffness_clt():
+    section = c19.loadCltSections()[0]
+    myBeam = getBeamColumn(4, section, 'm')
+    
+    assert myBeam.getEIx() == section.getEIs()
+    assert myBeam.getGAy() == section.getGAw()
+    
+    # Positional units match monolithic sections, i.e. length then stress.
+    assert section.getEIx('mm', 'MPa') == section.getEIs('MPa', 'mm')
+    assert section.getGAy('mm', 'MPa') == section.getGAw('MPa', 'mm')
     
+
+def test_element_stiffness_arrays():
+    myMat = MaterialElastic(9.5*1000)
+    section1 = SectionRectangle(myMat, 200, 600)
+    section2 = SectionRectangle(myMat, 200, 300)
+    beams = [getBeamColumn(4, section, 'm') for section in [section1, section2]*3]
+    
+    stiffness = getElementStiffness(beams, lUnit = 'mm')
+    assert set(stiffness) == {'EIx', 'EIy', 'GAx', 'GAy'}
+    assert len(stiffness['EIx']) == 6
+    assert stiffness['EIx'][0] == beams[0].getEIx('mm')
+    assert stiffness['EIx'][3] == beams[1].getEIx('mm')
+    assert stiffness['GAy'][4] == beams[4].getGAy('mm')
+    
+    stiffness = getElementStiffness([], ['EIx'])
+    assert len(stiffness['EIx']) == 0
+
+def test_getBeams():
+    myMat = MaterialElastic(9.5*1000)
+    sections = [SectionRectangle(myMat, 200, 600), SectionRectangle(myMat, 200, 300)]
+    L = [4, 5, 6]
+    beams = getBeamColumns(L, sections, [1, 0, 1], 'm')
     
+    assert len(beams) == 3
+    assert beams[1].getLength() == 5
+    assert beams[0].section is sections[1]
+    assert beams[2].section is sections[1]
+    assert beams[1].getEIx() == getBeamColumn(5, sections[0], 'm').getEIx()
+    assert beams[0].designProps is not beams[1].designProps
+    
+    with pytest.raises(Exception):
+        getBeamColumns(L, sections, [0, 1, 2])
+
+@dataclass
+class _DesignProps:
+    Lx:float = None
+    spanLengths:list[float] = field(default_factory=list)
+    
+    def __post_init__(self):
+        self.isInitialized = True
 
+def test_getBeams_designProps():
+    """
+    Each element should get its own copy of the design props, made with 
+    the constructor.
+    """
+    myMat = MaterialElastic(9.5*1000)
+    sections = [SectionRectangle(myMat, 200, 600)]
+    template = _DesignProps(4, [4])
+    template.Lex = 8
+    beams = getBeamColumns([4, 4], sections, designProps = template)
+    beam = getBeamColumn(4, sections[0], 'm', template)
+    
+    assert vars(beams[0].designProps) == vars(beam.designProps)
+    assert beams[0].designProps.spanLengths is not template.spanLengths
+    
+    beams[0].designProps.spanLengths.append(5)
+    assert beams[1].designProps.spanLengths == [4]
 
 if __name__ == '__main__':
-    test_getBeam()
\ No newline at end of file
+    test_getBeam()
+    test_stiffness_units()
+    test_stiffness_cache()
+    test_stiffness_clt()
+    test_element_stiffness_arrays()
+    test_getBeams()
+    test_getBeams_designProps()
\ No newline at end of file
@@ -0,0 +1,77 @@
+"""
+Tests load cases, load combinations, and factored demands.
+"""
+
+import limitstates as ls
+import numpy as np
+import pytest
+
+x = np.linspace(0, 5, 11)
+
+def _getCases():
+    dead = ls.LoadCase('dead', 'D', x, {'M':np.ones(11), 'V':2*np.ones(11)})
+    live = ls.LoadCase('live', 'L', x, {'M':np.linspace(0, 1, 11)})
+    snow = ls.LoadCase('snow', 'S', x, {'M':-np.ones(11)})
+    return [dead, live, snow]
+
+def test_load_case():
+    dead = _getCases()[0]
+    assert dead.getForces('V') == pytest.approx(2*np.ones(11))
+    
+    with pytest.raises(Exception):
+        dead.getForces('N')
+    with pytest.raises(Exception):
+        dead.setForces('N', np.ones(3))
+
+def test_load_case_diagram():
+    bmd = ls.DesignDiagram(np.column_stack((x, x**2)))
+    case = ls.LoadCase('live', 'L')
+    case.setDiagram('M', bmd)
+    
+    assert case.x == pytest.approx(x)
+    assert case.getForces('M') == pytest.approx(x**2)
+
+def test_factor_matrix():
+    cases = _getCases()
+    combos = [ls.LoadCombination('c1', {'D':1.25, 'L':1.5}),
+              ls.LoadCombination('c2', {'D':1.25, 'snow':1.5, 'S':1.0})]
+    factors = ls.getFactorMatrix(combos, cases)
+    
+    assert factors == pytest.approx(np.array([[1.25, 1.5, 0], [1.25, 0, 1.5]]))
+
+def test_factored_demands():
+    cases = _getCases()
+    combos = ls.getNbccCombinations([case.loadType for case in cases])
+    demands = ls.getFactoredDemands(cases, combos, 'M')
+    
+    assert demands.shape == (len(combos), 11)
+    for combo, demand in zip(combos, demands):
+        expected = sum(combo.getFactor(case)*case.getForces('M') for case in cases)
+        assert demand == pytest.approx(expected)
+
+def test_nbcc_combinations():
+    combos = ls.getNbccCombinations(['D', 'L'])
+    names = [combo.name for combo in combos]
+    assert names == ['1.4D', '1.25D + 1.5L', '0.9D + 1.5L']
+    
+    combos = ls.getNbccCombinations()
+    factors = [combo.factors for combo in combos]
+    assert {'D':1.0, 'E':1.0, 'L':0.5, 'S':0.25} in factors
+    assert {'D':1.25, 'S':1.5, 'W':0.4} in factors
+    assert {'D':0.9, 'W':1.4} in factors
+    assert len(combos) == 20
+
+def test_asce7_combinations():
+    combos = ls.getAsce7Combinations(['D', 'L', 'S'])
+    factors = [combo.factors for combo in combos]
+    assert factors == [{'D':1.4}, {'D':1.2, 'L':1.6}, {'D':1.2, 'L':1.6, 'S':0.5}, 
+                       {'D':1.2, 'S':1.6, 'L':1.0}, {'D':1.2, 'S':1.6}]
+
+
+if __name__ == '__main__':
+    test_load_case()
+    test_load_case_diagram()
+    test_factor_matrix()
+    test_factored_demands()
+    test_nbcc_combinations()
+    test_asce7_combinations()
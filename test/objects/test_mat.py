@@ -2,7 +2,13 @@
 Tests if materials can initalize correctly and use unit conversions.
 """
 
-from limitstates import MaterialElastic
+import copy
+import pickle
+
+import pytest
+from limitstates import MaterialElastic, internMaterial, isInterned
+import limitstates.design.csa.s16.c24 as s16
+import limitstates.design.csa.o86.c19 as o86
 
 def test_initialize():
     
@@ -12,5 +18,42 @@ def test_initialize():
     assert mySteel.sConvert('GPa') == 0.001
     assert mySteel.rhoConvert('kg/m3') == 1
 
+def test_intern():
+    mat1 = internMaterial(s16.MaterialSteelCsa24(345))
+    mat2 = internMaterial(s16.MaterialSteelCsa24(345))
+    mat3 = internMaterial(s16.MaterialSteelCsa24(350))
+    mat4 = internMaterial(MaterialElastic(200000, 77000, 8000))
+    
+    assert mat1 is mat2
+    assert mat1 is not mat3
+    assert mat1 is not mat4
+    assert isInterned(mat1)
+    assert not isInterned(s16.MaterialSteelCsa24(345))
+
+def test_intern_read_only():
+    mat = internMaterial(MaterialElastic(12345))
+    with pytest.raises(AttributeError):
+        mat.E = 1
+    
+    matCopy = copy.copy(mat)
+    matCopy.E = 1
+    assert mat.E == 12345
+    assert not isInterned(matCopy)
+    assert not isInterned(pickle.loads(pickle.dumps(mat)))
+
+def test_intern_db():
+    """
+    Database materials are interned, including CLT materials with NaN values.
+    """
+    mat = o86.loadGlulamMaterial('SPF', '20f-E')
+    assert isInterned(mat)
+    assert internMaterial(copy.copy(mat)) is mat
+    
+    strongMat, weakMat = o86.loadCltMatDB()[0]
+    assert internMaterial(copy.copy(strongMat)) is strongMat
+
 if __name__ == '__main__':
     test_initialize()
+    test_intern()
+    test_intern_read_only()
+    test_intern_db()
@@ -2,6 +2,7 @@
 Tests if single and multispan members are being initialized properly.
 """
 import limitstates as ls
+import numpy as np
 import pytest
 
 
@@ -30,6 +31,62 @@ def test_classifySpans():
     assert member.isCantilever[1] == True
     
 
+def test_initMembers():
+    L = np.array([3., 5., 8.])
+    members = ls.initMembers(L, 'm')
+    member = ls.initSimplySupportedMember(5., 'm')
+    
+    assert len(members) == 3
+    assert members[1].L == member.L
+    assert members[1].curves[0].L == member.curves[0].L
+    assert np.all(members[1].nodes[1].p1 == member.nodes[1].p1)
+    assert members[1].nodes[0].support == member.nodes[0].support
+    assert members[1].nodes[1].support == member.nodes[1].support
+    assert members[1].isCantilever == member.isCantilever
+    assert members[1].lConvert('mm') == 1000
+    assert ls.getLengthNodes(*members[2].nodes) == 8
+
+def _getVars(obj):
+    """
+    Returns the attributes of a geometry object in a form that can be 
+    compared, i.e. arrays are converted to lists and nodes to dicts.
+    """
+    attrs = {}
+    for name, value in vars(obj).items():
+        if isinstance(value, np.ndarray):
+            value = value.tolist()
+        elif isinstance(value, (ls.Node, ls.Line)):
+            value = _getVars(value)
+        elif name in ['nodes', 'curves']:
+            value = [_getVars(item) for item in value]
+        attrs[name] = value
+    return attrs
+
+def test_initMembers_vars():
+    """
+    Members should have the same attributes as a simply supported member.
+    """
+    for lUnit in ['m', 'mm']:
+        member = ls.initMembers([5.], lUnit)[0]
+        expected = ls.initSimplySupportedMember(5., lUnit)
+        assert _getVars(member) == _getVars(expected)
+
+def test_initMembers_supportCodes():
+    fixed = ls.SupportTypes2D.FIXED.value
+    free  = ls.SupportTypes2D.FREE.value
+    pin   = ls.SupportTypes2D.PINNED.value
+    supportTypes = [(pin, pin), (fixed, free)]
+    members = ls.initMembers([3., 5., 8.], 'm', [0, 1, 0], supportTypes)
+    
+    assert members[1].nodes[0].support == fixed
+    assert members[1].nodes[1].support == free
+    assert members[2].nodes[1].support == pin
+    
+    with pytest.raises(Exception):
+        ls.initMembers([3., 5.], 'm', [0, 2], supportTypes)
 
 if __name__ == '__main__':
     test_classifySpans()
+    test_initMembers()
+    test_initMembers_vars()
+    test_initMembers_supportCodes()
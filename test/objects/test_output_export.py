@@ -0,0 +1,79 @@
+"""
+Tests that section outlines are exported to, and read from, binary buffers.
+"""
+
+import os
+import tempfile
+
+import numpy as np
+import pytest
+
+import limitstates as ls
+import limitstates.design.csa.o86.c19 as o86
+
+myMat = ls.MaterialElastic(200*1000)
+
+def _getSections():
+    return [ls.SectionRectangle(myMat, 200, 400), 
+            ls.getSteelSections(myMat, 'csa', 'cisc_12', 'hss')[0],
+            ls.getSteelSections(myMat, 'csa', 'cisc_12', 'W')[0]]
+
+def test_geom_buffer():
+    sections = _getSections()
+    geomBuffer = ls.getGeomBuffer(sections)
+    
+    # The HSS section has an inside and outside outline.
+    assert len(geomBuffer) == 4
+    assert list(geomBuffer.elementInds) == [0, 1, 1, 2]
+    assert geomBuffer.offsets[-1] == len(geomBuffer.verticies)
+    
+    xy = geomBuffer.getOutline(0)
+    assert xy[1][0] == -100
+    assert xy[1][1] == 200
+
+def test_geom_buffer_elements():
+    member = ls.initSimplySupportedMember(6, 'm')
+    section = ls.SectionRectangle(myMat, 200, 400)
+    element = o86.BeamColumnGlulamCsa19(member, section)
+    geomBuffer = ls.getGeomBuffer([element, element], xy0 = [[0, 0], [1000, 0]])
+    
+    xy1 = geomBuffer.getOutline(0)
+    xy2 = geomBuffer.getOutline(1)
+    assert xy2 == pytest.approx(xy1 + [1000, 0])
+
+def test_export_read():
+    sections = _getSections()
+    
+    with tempfile.TemporaryDirectory() as outputDir:
+        fileName = os.path.join(outputDir, 'sections.bin')
+        geomBuffer = ls.exportGeometry(sections, fileName)
+        geomRead = ls.readGeomBuffer(fileName)
+    
+    assert np.all(geomRead.offsets == geomBuffer.offsets)
+    assert np.all(geomRead.elementInds == geomBuffer.elementInds)
+    assert geomRead.verticies == pytest.approx(geomBuffer.verticies)
+    assert geomRead.Nelement == geomBuffer.Nelement == 3
+
+def test_export_read_Nelement():
+    """
+    The number of elements is stored, even if the last elements have no 
+    outlines.
+    """
+    verticies = np.array([[0, 0], [1, 0], [1, 1]])
+    geomBuffer = ls.GeomBuffer(verticies, np.array([0, 3]), np.array([1]), 4)
+    assert ls.GeomBuffer(verticies, np.array([0, 3]), np.array([1])).Nelement == 2
+    
+    with tempfile.TemporaryDirectory() as outputDir:
+        fileName = os.path.join(outputDir, 'sections.bin')
+        with open(fileName, 'wb') as f:
+            f.write(geomBuffer.toBytes())
+        geomRead = ls.readGeomBuffer(fileName)
+    
+    assert geomRead.Nelement == 4
+    assert list(geomRead.elementInds) == [1]
+
+if __name__ == "__main__":
+    test_geom_buffer()
+    test_geom_buffer_elements()
+    test_export_read()
+    test_export_read_Nelement()
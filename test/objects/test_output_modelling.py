@@ -5,7 +5,7 @@ Tests if the verticies are corretly output for the model files.
 import numpy as np
 import pytest
 
-from limitstates.objects.output.model import GeomModelRectangle, GeomModelClt, GeomModelHss
+from limitstates.objects.output.model import GeomModelRectangle, GeomModelClt, GeomModelHss, GeomModelGlulam
 
 import limitstates as ls
 import limitstates.design.csa.o86.c19 as o86
@@ -28,7 +28,7 @@ def test_geom_rectangle():
     # section     = ls.SectionRectangle(myMat, 200, 400)
     
     geom = GeomModelRectangle(b, d)
-    x, y = geom.getVerticies()
+    x, y = geom.getVerticies().T
     
     Aout = PolyArea(x, y)
     assert b*d == pytest.approx(Aout, 0.01)
@@ -50,16 +50,41 @@ def test_clt():
     geom = GeomModelClt(layers)
         
     verts = geom.getFillVerticies()
-    assert len(verts[0]) == 11
+    assert verts.shape == (11, 2, 2)
     
 def test_Hss():
     geom = GeomModelHss(305, 205, 10, 15, 10)
-    x, y = geom.getVerticies()
+    xy = geom.getVerticies()
     
-    assert len(x)  == 2*(6*4 +1) 
+    assert xy.shape == (2*(6*4 +1), 2)
+
+def test_cached_verticies():
+    """
+    Identical shapes should reuse verticies, with the offset applied to a copy.
+    """
+    geom1 = GeomModelHss(305, 205, 10, 15, 10)
+    geom2 = GeomModelHss(305, 205, 10, 15, 10, dx0 = 100)
+    geom3 = GeomModelHss(305, 205, 10, 15, 10, NradiusPoints = 10)
+    
+    xy1 = geom1.getVerticies()
+    xy2 = geom2.getVerticies()
+    xy1[0] = 0
+    
+    assert geom1.getVerticies()[1:] == pytest.approx(xy2[1:] - [100, 0])
+    assert geom1.getVerticies()[0, 0] != 0
+    assert len(geom3.getVerticies()) == 2*(10*4 +1)
+
+def test_glulam_fill():
+    geom = GeomModelGlulam(175, 608, 38, dy0 = 10)
+    lines = geom.getFillVerticies()
+    
+    assert lines.shape == (15, 2, 2)
+    assert lines[0, 0, 1] == pytest.approx(-304 + 38 + 10)
 
 if __name__ == "__main__":
     test_geom_rectangle()
     test_clt()
     test_Hss()
+    test_cached_verticies()
+    test_glulam_fill()
 
@@ -3,7 +3,7 @@ Tests if the CLT section is properly counting layers.
 
 """
 
-from limitstates import MaterialElastic, LayerClt, LayerGroupClt
+from limitstates import MaterialElastic, LayerClt, LayerGroupClt, SectionCLT
 import numpy as np
 import pytest
 
@@ -98,6 +98,35 @@ def test_layer_orientation_3():
 
     assert np.all(orientations == [True, True, False, True, True])
 
+
+def test_active_groups_cached():
+    layers = [LayerClt(35, myMat, False), LayerClt(35, myMat), 
+              LayerClt(35, myMat, False), LayerClt(35, myMat)]
+    layerGroup = LayerGroupClt(layers)
+    
+    strongGroup = layerGroup.getActiveGroup(True)
+    assert strongGroup is layerGroup.getActiveGroup(True)
+    assert len(strongGroup) == 3
+    assert len(layerGroup.getActiveGroup(False)) == 3
+    
+    section = SectionCLT(layerGroup)
+    assert section.sLayers is strongGroup
+    assert section.wLayers is layerGroup.getActiveGroup(False)
+
+def test_layerGroup_cache_units():
+    layers = [LayerClt(35, myMat), LayerClt(35, myMat, False), LayerClt(35, myMat)]
+    layerGroup = LayerGroupClt(layers)
+    EI = layerGroup.getEI(lUnit='m')
+    EA = layerGroup.getEA(lUnit='m')
+    assert layerGroup.getEI(lUnit='m') == EI
+    
+    # Cached values are cleared when the units change.
+    layerGroup.updateUnits('m')
+    assert layerGroup.getEI(lUnit='m') == pytest.approx(EI)
+    assert layerGroup.getEA(lUnit='m') == pytest.approx(EA)
+    assert layerGroup.getYbar() == pytest.approx(0.0525)
+
+
 if __name__ == '__main__':
     # pass
     test_layerRepr()
@@ -110,5 +139,5 @@ if __name__ == '__main__':
     test_layer_orientation()
     test_layer_orientation_2()
     test_layer_orientation_3()
-
-    
\ No newline at end of file
+    test_active_groups_cached()
+    test_layerGroup_cache_units()
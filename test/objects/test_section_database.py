@@ -3,7 +3,10 @@ Tests if materials can initalize correctly and use unit conversions.
 """
 
 from limitstates import MaterialElastic
-from limitstates.objects.read import getRectangularSections, _loadSectionDBDict, DBConfig, getSteelSections
+from limitstates.objects.read import (getRectangularSections, _loadSectionDBDict, 
+                                     DBConfig, getSteelSections, convertSectionTable,
+                                     sectionLengthPowers)
+import numpy as np
 import pytest
 
 
@@ -34,7 +37,86 @@ def test_load_steel():
     assert sections[38].kdet == pytest.approx(87.3,0.01)
 
 
+def test_load_steel_convert():  
+    
+    myMat = MaterialElastic(200*1000)
+    
+    sectionsIn = getSteelSections(myMat, 'us', 'aisc_16_us', 'W')
+    sectionsmm = getSteelSections(myMat, 'us', 'aisc_16_us', 'W', lUnit='mm')
+
+    assert sectionsmm[0].lUnit == 'mm'
+    assert sectionsmm[0].d  == pytest.approx(sectionsIn[0].d*25.4)
+    assert sectionsmm[0].A  == pytest.approx(sectionsIn[0].A*25.4**2)
+    assert sectionsmm[0].Ix == pytest.approx(sectionsIn[0].Ix*25.4**4)
+    assert sectionsmm[0].Cw == pytest.approx(sectionsIn[0].Cw*25.4**6)
+    assert sectionsmm[0].W  == sectionsIn[0].W
+
+def test_convert_table():  
+    config = DBConfig('us', 'steel', 'aisc_16_si_w')
+    table  = _loadSectionDBDict(config)
+    tableOut = convertSectionTable(table, 'mm', 'm')
+    
+    assert tableOut['d'].iloc[0] == pytest.approx(table['d'].iloc[0] / 1000)
+    assert tableOut['Zx'].iloc[0] == pytest.approx(table['Zx'].iloc[0] / 1e9)
+    assert tableOut['EDI_Std_Nomenclature'].iloc[0] == table['EDI_Std_Nomenclature'].iloc[0]
+
+def test_convert_table_ZJ():
+    """
+    ZJ is four times Sw1 in the CISC tables, so it's a length to the fourth.
+    """
+    config = DBConfig('csa', 'steel', 'cisc_12_w')
+    table  = _loadSectionDBDict(config)
+    tableOut = convertSectionTable(table, 'mm', 'm')
+    
+    assert tableOut['ZJ'].iloc[0] == pytest.approx(table['ZJ'].iloc[0] / 1e12)
+    assert tableOut['ZJ'].iloc[0] == pytest.approx(4*tableOut['Sw1'].iloc[0], rel = 0.01)
+
+# Numeric columns in the steel databases that are not lengths.
+nonLengthColumns = ['W', 'T_F', 'bf/2tf', 'b/t', 'b/tdes', 'h/tw', 'h/tdes', 
+                    'D/t', 'H', 'tan(α)', 'Am']
+
+steelDatabases = [('us', 'aisc_16_us_all', 'in'), ('us', 'aisc_16_si_all', 'mm'),
+                  ('us', 'aisc_16_us_hss', 'in'), ('us', 'aisc_16_si_hss', 'mm'),
+                  ('us', 'aisc_16_us_w', 'in'), ('us', 'aisc_16_si_w', 'mm'),
+                  ('csa', 'cisc_12_w', 'mm'), ('csa', 'cisc_12_hss', 'mm')]
+
+def test_convert_table_all_columns():
+    """
+    Every numeric column in the steel databases should be converted, and 
+    converting to a different unit and back should give the input table.
+    """
+    for code, dbName, dbUnit in steelDatabases:
+        table  = _loadSectionDBDict(DBConfig(code, 'steel', dbName))
+        numeric = table.select_dtypes('number').columns
+        lengthColumns = [col for col in numeric if col not in nonLengthColumns]
+        missing = [col for col in lengthColumns if col not in sectionLengthPowers]
+        assert missing == [], dbName
+        
+        otherUnit = 'mm' if dbUnit == 'in' else 'in'
+        tableOther = convertSectionTable(table, dbUnit, otherUnit)
+        tableOut   = convertSectionTable(tableOther, otherUnit, dbUnit)
+        for col in lengthColumns:
+            values = table[col].to_numpy(dtype=float)
+            assert np.allclose(tableOut[col].to_numpy(dtype=float), values, 
+                               equal_nan=True), (dbName, col)
+            if np.any(values[~np.isnan(values)] != 0):
+                assert not np.allclose(tableOther[col].to_numpy(dtype=float), 
+                                       values, equal_nan=True), (dbName, col)
+
+def test_load_steel_convert_hss():  
+    myMat = MaterialElastic(200*1000)
+    sectionsIn = getSteelSections(myMat, 'us', 'aisc_16_us', 'hss')
+    sectionsmm = getSteelSections(myMat, 'us', 'aisc_16_us', 'hss', lUnit='mm')
+    
+    assert sectionsmm[0].C == pytest.approx(sectionsIn[0].C*25.4**3)
+    assert sectionsmm[0].J == pytest.approx(sectionsIn[0].J*25.4**4)
+
 
 if __name__ == '__main__':
     test_load_gl()
     test_load_steel()
+    test_load_steel_convert()
+    test_convert_table()
+    test_convert_table_ZJ()
+    test_convert_table_all_columns()
+    test_load_steel_convert_hss()
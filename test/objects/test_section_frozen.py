@@ -0,0 +1,126 @@
+"""
+Tests frozen sections, and caching results for frozen sections.
+"""
+
+import copy
+
+import limitstates as ls
+import limitstates.design.csa.s16.c24 as s16
+import limitstates.design.csa.o86.c19 as o86
+from limitstates.objects.read import getSteelSections
+import pytest
+
+mat = s16.MaterialSteelCsa24(345)
+
+def _getSteelSection(name = 'W310X97'):
+    sections = getSteelSections(s16.MaterialSteelCsa24(345), 'us', 'aisc_16_si', 'W')
+    return ls.getByName(sections, name)
+
+def test_freeze():
+    section = _getSteelSection()
+    frozen1 = ls.freezeSection(section)
+    frozen2 = ls.freezeSection(_getSteelSection())
+    frozen3 = ls.freezeSection(_getSteelSection('W250X67'))
+    
+    assert ls.isFrozenSection(frozen1)
+    assert not ls.isFrozenSection(section)
+    assert isinstance(frozen1, ls.SectionSteel)
+    assert frozen1 == frozen2
+    assert hash(frozen1) == hash(frozen2)
+    assert frozen1 != frozen3
+    assert frozen1.mat is frozen2.mat
+    assert ls.freezeSection(frozen1) is frozen1
+
+def test_read_only():
+    frozen = ls.freezeSection(ls.SectionRectangle(mat, 100, 200))
+    with pytest.raises(AttributeError):
+        frozen.d = 300
+    with pytest.raises(AttributeError):
+        frozen.convertUnits('m')
+    
+    sectionCopy = copy.copy(frozen)
+    sectionCopy.convertUnits('m')
+    assert sectionCopy.d == pytest.approx(0.2)
+    assert not ls.isFrozenSection(sectionCopy)
+
+def test_memoize():
+    ls.clearSectionCache()
+    section = _getSteelSection()
+    frozen = ls.freezeSection(section)
+    
+    assert frozen.getZ(True, 'm') == section.getZ(True, 'm')
+    assert frozen.getZ(True, 'm') == section.getZ(True, 'm')
+    assert ls.SectionSteel.getZ.cache_info().hits == 1
+    assert frozen.Cy == section.Cy
+    assert frozen.getEIx('m', 'Pa') == section.getEIx('m', 'Pa')
+    
+    assert s16.classifySection(frozen) == s16.classifySection(section)
+    s16.classifySection(ls.freezeSection(_getSteelSection()))
+    assert s16.classifySection.cache_info().hits == 1
+    assert s16.checkCompressionLimits(frozen)
+    
+    ls.clearSectionCache()
+    assert s16.classifySection.cache_info().currsize == 0
+
+def test_memoize_unfrozen():
+    ls.clearSectionCache()
+    section = _getSteelSection()
+    s16.classifySection(section)
+    s16.classifySection(section)
+    assert s16.classifySection.cache_info().currsize == 0
+
+def test_freeze_clt():
+    sections = o86.loadCltSections()
+    frozen1 = ls.freezeSection(sections[0])
+    frozen2 = ls.freezeSection(o86.loadCltSections()[0])
+    frozen3 = ls.freezeSection(sections[1])
+    
+    assert frozen1 == frozen2
+    assert frozen1 != frozen3
+    assert frozen1.getEIs() == sections[0].getEIs()
+
+def test_freeze_clt_cache():
+    """
+    Cached layer propreties should not change the content of a section.
+    """
+    section1 = o86.loadCltSections()[0]
+    section2 = o86.loadCltSections()[0]
+    section1.getEIs()
+    section1.getGAw()
+    section2.sLayers._clearCache()
+    section2.wLayers._clearCache()
+    
+    assert section1.sLayers._props != section2.sLayers._props
+    assert ls.freezeSection(section1) == ls.freezeSection(section2)
+
+def test_freeze_clt_nested():
+    """
+    Changing the original section after freezing should not change the 
+    frozen section, and the layers of the frozen section are read only.
+    """
+    section = o86.loadCltSections()[0]
+    frozen = ls.freezeSection(section)
+    EI = frozen.getEIs()
+    
+    section._convertUnits('m')
+    assert frozen.sLayers is not section.sLayers
+    assert frozen.sLayers.lUnit == 'mm'
+    assert frozen.getEIs() == EI
+    assert frozen == ls.freezeSection(o86.loadCltSections()[0])
+    
+    with pytest.raises(AttributeError):
+        frozen.sLayers.layers[0].t = 10
+    
+    sectionCopy = copy.deepcopy(frozen)
+    sectionCopy._convertUnits('m')
+    assert sectionCopy.getEIs() == pytest.approx(section.getEIs())
+
+
+if __name__ == '__main__':
+    test_freeze()
+    test_read_only()
+    test_memoize()
+    test_memoize_unfrozen()
+    test_freeze_clt()
+    test_freeze_clt_cache()
+    test_freeze_clt_nested()
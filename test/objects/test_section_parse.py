@@ -3,10 +3,13 @@ Tests if materials can initalize correctly and use unit conversions.
 """
 
 import limitstates as ls
+import numpy as np
+import pytest
 
 
 import limitstates.design.csa.o86.c19 as o86
 from limitstates.objects.read import getSteelSections
+from limitstates.objects.parse import filterByAttrVal
 
 mats = o86.loadGlulamMaterialDB()
 sections = o86.loadGlulamSections(mats[0])
@@ -58,6 +61,62 @@ def test_filterAtter_name():
     assert filterVal in filteredList[0].name 
     assert filterVal in filteredList[-1].name
 
+def test_index_range():
+    index = ls.SectionIndex(sections)
+    
+    for lowerLim, upperLim in [(300, 500), (500, None), (None, 500)]:
+        mask = index.getRangeMask('d', lowerLim, upperLim)
+        expected = [item for item in sections 
+                    if (lowerLim is None or lowerLim <= item.d) 
+                    and (upperLim is None or item.d <= upperLim)]
+        assert index.getObjects(mask) == expected
+
+def test_index_sort():
+    index = ls.SectionIndex(sections)
+    assert index.getObjects(sortAttr = 'd') == ls.sortByAttr(sections, 'd')
+    
+    mask = index.getRangeMask('d', 300, 500)
+    newList = index.getObjects(mask, 'Ix', True)
+    assert newList[0].Ix == max(item.Ix for item in newList)
+
+def test_index_name():
+    index = ls.SectionIndex(steelSections)
+    
+    mask = index.getPrefixMask('w460')
+    assert index.getObjects(mask) == ls.filterByName(steelSections, 'W460')
+    assert np.array_equal(mask, index.getNameMask('W460'))
+    
+    section = index.getByName('W460X89 aisc16')
+    assert section.name == 'W460X89 aisc16'
+    assert index.getByName('460x89') == ls.getByName(steelSections, '460x89')
+    
+def test_index_chained():
+    index = ls.SectionIndex(steelSections)
+    mask = index.getPrefixMask('W310') & index.getRangeMask('d', upperLim = 310)
+    
+    expected = ls.filterByAttrRange(ls.filterByName(steelSections, 'W310'), 
+                                    'd', upperLim = 310)
+    assert index.getObjects(mask) == expected
+    assert 0 < len(expected)
+
+def test_index_attrVal():
+    index = ls.SectionIndex(steelSections)
+    
+    for filterVal in ['X89', 'x89', '460', 'aisc', '']:
+        mask = index.getAttrValMask('name', filterVal)
+        assert index.getObjects(mask) == filterByAttrVal(steelSections, 'name', filterVal)
+        
+        mask = index.getNameMask(filterVal)
+        expected = [section for section in steelSections 
+                    if filterVal.lower() in section.name.lower()]
+        assert index.getObjects(mask) == expected
+    
+    assert 0 < np.sum(index.getAttrValMask('name', 'X89'))
+    assert not np.any(index.getAttrValMask('name', 'x89'))
+    
+    with pytest.raises(Exception):
+        index.getAttrValMask('d', '3')
+
 
 if __name__ == '__main__':
     test_sortAtter()
@@ -67,3 +126,8 @@ if __name__ == '__main__':
     test_filterAtter_minmax()
 
     test_filterAtter_name()
+    test_index_range()
+    test_index_sort()
+    test_index_name()
+    test_index_chained()
+    test_index_attrVal()
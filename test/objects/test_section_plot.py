@@ -4,6 +4,9 @@ If the plots are run through command line, a non-gui back-end is used
 and no figures are shown.
 """
 
+import os
+import tempfile
+
 import limitstates as ls
 import matplotlib.pyplot as plt
 import numpy as np
@@ -206,6 +209,57 @@ def test_plot_hss_cisc():
     assert -section.b/2 + section.t == pytest.approx(xMin)    
 
 
+def test_render_sections():
+    """
+    Tests several section types can be rendered with one figure, and that no
+    pyplot figures are opened.
+    """
+    myMat = ls.MaterialElastic(200*1000)
+    sections = [ls.SectionRectangle(myMat, 200, 400), 
+                ls.getSteelSections(myMat, 'csa', 'cisc_12', 'hss')[0],
+                o86.loadCltSections()[1],
+                ls.SectionRectangle(myMat, 100, 300)]
+    Nfig = len(plt.get_fignums())
+    
+    with tempfile.TemporaryDirectory() as outputDir:
+        fileNames = ls.renderSections(sections, outputDir, 'svg')
+        assert len(fileNames) == 4
+        assert all(os.path.isfile(fileName) for fileName in fileNames)
+    
+    assert len(plt.get_fignums()) == Nfig
+def test_render_sections_duplicate_names():
+    """
+    Sections with the same name should not overwrite each other's images.
+    """
+    myMat = ls.MaterialElastic(200*1000)
+    hss = ls.getSteelSections(myMat, 'csa', 'cisc_12', 'hss')
+    sections = [hss[0], hss[0], hss[1]]
+    
+    with tempfile.TemporaryDirectory() as outputDir:
+        fileNames = ls.renderSections(sections, outputDir, 'svg')
+        assert len(set(fileNames)) == 3
+        assert os.path.basename(fileNames[0]) == f'{hss[0].name}_0.svg'
+        assert os.path.basename(fileNames[2]) == f'{hss[1].name}.svg'
+        assert all(os.path.isfile(fileName) for fileName in fileNames)
+        
+        with pytest.raises(Exception):
+            ls.renderSections(sections, fileNames = ['a.svg', 'a.svg', 'b.svg'])
+
+def test_renderer_reuses_figure():
+    myMat = ls.MaterialElastic(200*1000)
+    sections = [o86.loadCltSections()[1], ls.SectionRectangle(myMat, 100, 300)]
+    
+    with tempfile.TemporaryDirectory() as outputDir:
+        with ls.SectionRenderer() as renderer:
+            Nchildren = len(renderer.ax.get_children())
+            for ii, section in enumerate(sections):
+                renderer.render(section, os.path.join(outputDir, f'{ii}.png'))
+                assert len(renderer.ax.get_children()) == Nchildren
+            
+            xy = renderer.patch.get_xy()
+            assert xy[0][1] == -150
+            assert xy[1][1] == 150
+
 
 if __name__ == "__main__":
     
@@ -219,6 +273,9 @@ if __name__ == "__main__":
     test_plot_I_beam_round_objConfig()
     test_plot_CLT()
     test_plot_hss_cisc()
+    test_render_sections()
+    test_render_sections_duplicate_names()
+    test_renderer_reuses_figure()
 
 else:
     plt.close('all')
\ No newline at end of file
@@ -0,0 +1,84 @@
+"""
+Tests the native beam solver against closed form solutions.
+"""
+
+import limitstates as ls
+import numpy as np
+import pytest
+
+pin    = ls.SupportTypes2D.PINNED.value
+roller = ls.SupportTypes2D.ROLLER.value
+fixed  = ls.SupportTypes2D.FIXED.value
+free   = ls.SupportTypes2D.FREE.value
+
+def _getMember(xNodes, supports):
+    nodes = [ls.Node([x, 0.], 'm', support = support) 
+             for x, support in zip(xNodes, supports)]
+    lines = [ls.getLineFromNodes(n1, n2) for n1, n2 in zip(nodes[:-1], nodes[1:])]
+    return ls.Member(nodes, lines)
+
+def test_simply_supported_udl():
+    L = 8
+    w = 10
+    member = ls.initSimplySupportedMember(L, 'm')
+    sfd, bmd = ls.solveMemberDiagrams(member, distLoads=[ls.DistLoad(0, L, -w)])
+    
+    assert bmd.getForceAtx(L/2) == pytest.approx(w*L**2/8)
+    assert sfd.xy[1, 1] == pytest.approx(w*L/2)
+    assert sfd.xy[-1, 1] == pytest.approx(0, abs = 1e-9)
+    assert list(bmd.getIntersectionCoords()) == pytest.approx([0, L])
+
+def test_cantilever_point_load():
+    L = 3
+    P = 5
+    member = _getMember([0, L], [fixed, free])
+    sfd, bmd = ls.solveMemberDiagrams(member, [ls.PointLoad(L, -P)])
+    
+    assert bmd.getForceAtx(0) == pytest.approx(-P*L)
+    assert sfd.getForceAtx(L/2) == pytest.approx(P)
+
+def test_propped_cantilever():
+    """
+    Matches the planesections example with a point load at 2/3 of the span.
+    """
+    L = 3
+    P = -5000
+    member = _getMember([0, L], [fixed, pin])
+    sfd, bmd = ls.solveMemberDiagrams(member, [ls.PointLoad(2, P)])
+    
+    assert bmd.getForceAtx(0) == pytest.approx(4*L*P / 27)
+
+def test_two_span_udl():
+    L = 5
+    w = 2
+    member = _getMember([0, L, 2*L], [pin, roller, roller])
+    sfd, bmd = ls.solveMemberDiagrams(member, distLoads=[ls.DistLoad(0, 2*L, -w)])
+    
+    assert bmd.getForceAtx(L) == pytest.approx(-w*L**2/8)
+    assert list(bmd.getIntersectionCoords()) == pytest.approx([0, 0.75*L, 1.25*L, 2*L], abs = 0.01)
+
+def test_span_stiffness():
+    """
+    A very stiff second span acts as a fixed support for the first span.
+    """
+    L = 5
+    w = 2
+    member = _getMember([0, L, 2*L], [pin, roller, roller])
+    model = ls.BeamModel(member, [1, 1e9])
+    sfd, bmd = model.solve(distLoads=[ls.DistLoad(0, L, -w)])
+
+    assert bmd.getForceAtx(L) == pytest.approx(-w*L**2/8, 0.001)
+
+def test_unstable():
+    member = _getMember([0, 3], [roller, free])
+    with pytest.raises(Exception):
+        ls.BeamModel(member)
+
+
+if __name__ == '__main__':
+    test_simply_supported_udl()
+    test_cantilever_point_load()
+    test_propped_cantilever()
+    test_two_span_udl()
+    test_span_stiffness()
+    test_unstable()
@@ -0,0 +1,138 @@
+"""
+Tests if the design diagrams correctly find points of zero force.
+"""
+
+import limitstates as ls
+import numpy as np
+import pytest
+
+
+def _getSimpleBMD(L = 8, N = 101):
+    x = np.linspace(0, L, N)
+    y = x*(L - x) / 2
+    return ls.DesignDiagram(np.column_stack([x,y]))
+
+def test_zero_crossings_simple():
+    bmd = _getSimpleBMD()
+    xInter = bmd.getIntersectionCoords()
+    
+    assert len(xInter) == 2
+    assert xInter[0] == 0
+    assert xInter[1] == 8
+
+def test_zero_crossings_interpolated():
+    x = np.array([0, 1, 2, 3, 4.])
+    y = np.array([0, 1, 1, -3, -3.])
+    xInter = ls.getZeroCrossings(x, y)
+    
+    assert len(xInter) == 2
+    assert xInter[1] == pytest.approx(2.25)
+
+def test_zero_crossings_zero_region():
+    x = np.array([0, 1, 2, 3, 4, 5.])
+    y = np.array([1, 0, 0, 0, 2, 2.])
+    xInter = ls.getZeroCrossings(x, y)
+    
+    assert list(xInter) == [1, 3]
+
+def test_diagram_not_modified():
+    x = np.array([0, 1, 2.])
+    y = np.array([1e-8, 1, 1e-8])
+    xy = np.column_stack([x,y])
+    bmd = ls.DesignDiagram(xy)
+    
+    assert xy[0,1] == 1e-8
+    assert len(bmd.getIntersectionCoords()) == 2
+
+def test_convert_diagram():
+    bmd = _getSimpleBMD()
+    bmd.convertDiagramTo('mm')
+    
+    assert bmd.lUnit == 'mm'
+    assert bmd.getIntersectionCoords()[-1] == pytest.approx(8000)
+
+def test_max_in_range():
+    x = np.linspace(0, 10, 1001)
+    y = np.sin(x)*x
+    bmd = ls.DesignDiagram(np.column_stack([x,y]))
+    
+    for x1, x2 in [(0, 10), (2.5, 3.1), (4.01, 9.3), (7, 7.02)]:
+        ind1 = np.where(x1 <= x)[0][0]
+        ind2 = np.where(x2 <= x)[0][0]
+        solution = max(abs(y[ind1:ind2]))
+        assert bmd.getMaxForceInRange(x1, x2) == solution
+
+def test_max_in_range_vector():
+    bmd = _getSimpleBMD()
+    yMax = bmd.getMaxForceInRange([0, 0], [4.2, 8])
+    
+    assert len(yMax) == 2
+    assert yMax[0] == pytest.approx(bmd.getMaxForceInRange(0, 4.2))
+    assert yMax[1] == pytest.approx(8)
+
+def test_max_in_range_empty():
+    bmd = _getSimpleBMD()
+    with pytest.raises(ValueError):
+        bmd.getMaxForceInRange(4.01, 4.02)
+
+def _getEnvelope():
+    x = np.linspace(0, 8, 81)
+    y = np.array([x*(8 - x) / 2, -x*(8 - x) / 4, x - 4])
+    return ls.DesignDiagramEnvelope(x, y)
+
+def test_envelope_max_min():
+    env = _getEnvelope()
+    
+    assert len(env) == 3
+    assert env.getMaxEnvelope().getForceAtx(4) == pytest.approx(8)
+    assert env.getMinEnvelope().getForceAtx(4) == pytest.approx(-4)
+    assert env.getMinEnvelope().getForceAtx(0) == pytest.approx(-4)
+
+def test_envelope_governing_case():
+    env = _getEnvelope()
+    governing = env.getGoverningCase()
+    
+    assert governing[0] == 2
+    assert governing[40] == 0
+
+def test_envelope_matches_diagrams():
+    env = _getEnvelope()
+    xTest = [0.33, 2.5, 7.9]
+    yEnv = env.getForceAtx(xTest)
+    yMaxEnv = env.getMaxForceInRange([0, 3], [5, 8])
+    
+    for ii, bmd in enumerate(env):
+        assert yEnv[ii] == pytest.approx(bmd.getForceAtx(xTest))
+        assert yMaxEnv[ii] == pytest.approx(bmd.getMaxForceInRange([0, 3], [5, 8]))
+
+def test_envelope_span_extrema():
+    env = _getEnvelope()
+    yMax, yMin = env.getSpanExtrema([4, 4])
+    
+    assert yMax.shape == (3, 2)
+    assert yMax[0, 0] == pytest.approx(8)
+    assert yMin[2, 0] == pytest.approx(-4)
+    assert yMax[2, 1] == pytest.approx(4)
+
+def test_envelope_from_diagrams():
+    bmd1 = _getSimpleBMD(N = 101)
+    bmd2 = _getSimpleBMD(N = 11)
+    env = ls.getDesignDiagramEnvelope([bmd1, bmd2])
+    
+    assert env.y.shape == (2, len(env.x))
+    assert env.getForceAtx(4.05)[1] == pytest.approx(bmd2.getForceAtx(4.05))
+
+if __name__ == '__main__':
+    test_zero_crossings_simple()
+    test_zero_crossings_interpolated()
+    test_zero_crossings_zero_region()
+    test_diagram_not_modified()
+    test_convert_diagram()
+    test_max_in_range()
+    test_max_in_range_vector()
+    test_max_in_range_empty()
+    test_envelope_max_min()
+    test_envelope_governing_case()
+    test_envelope_matches_diagrams()
+    test_envelope_span_extrema()
+    test_envelope_from_diagrams()
@@ -0,0 +1,99 @@
+"""
+Tests pattern loading with the influence model.
+"""
+
+import limitstates as ls
+import numpy as np
+import pytest
+
+pin    = ls.SupportTypes2D.PINNED.value
+roller = ls.SupportTypes2D.ROLLER.value
+
+def _getMember(xNodes):
+    supports = [pin] + [roller]*(len(xNodes) - 1)
+    nodes = [ls.Node([x, 0.], 'm', support = support) 
+             for x, support in zip(xNodes, supports)]
+    lines = [ls.getLineFromNodes(n1, n2) for n1, n2 in zip(nodes[:-1], nodes[1:])]
+    return ls.Member(nodes, lines)
+
+def test_skip_patterns():
+    patterns = ls.getSkipPatterns(3)
+    assert patterns.shape == (7, 3)
+    assert np.all(patterns[0])
+    assert len(np.unique(patterns, axis = 0)) == 7
+    assert ls.getSkipPatterns(3, True).shape == (8, 3)
+
+def test_patterns_match_solver():
+    """
+    Each pattern should match a direct analysis of the same loading.
+    """
+    xNodes = [0, 4, 10, 14]
+    member = _getMember(xNodes)
+    wLive, wDead = -3., -1.
+    
+    sfdEnv, bmdEnv = ls.InfluenceModel(member).getPatternDiagrams(wLive, wDead)
+    patterns = ls.getSkipPatterns(3)
+    assert len(bmdEnv) == len(patterns)
+    
+    model = ls.BeamModel(member)
+    for ii in [0, 2, 5]:
+        loads = [ls.DistLoad(x1, x2, wDead + wLive*isLoaded) 
+                 for x1, x2, isLoaded in zip(xNodes[:-1], xNodes[1:], patterns[ii])]
+        sfd, bmd = model.solve(distLoads = loads)
+        assert bmdEnv.y[ii] == pytest.approx(bmd.xy[:, 1])
+        assert sfdEnv.y[ii] == pytest.approx(sfd.xy[:, 1])
+
+def test_two_span_envelope():
+    """
+    For two equal spans, the maximum sagging moment occurs with only one 
+    span loaded.
+    """
+    L = 5
+    w = -2
+    member = _getMember([0, L, 2*L])
+    sfdEnv, bmdEnv = ls.InfluenceModel(member).getPatternDiagrams(w)
+    
+    assert bmdEnv.labels == ['11', '10', '01']
+    assert bmdEnv.getForceAtx(L)[0] == pytest.approx(w*L**2/8)
+    
+    governing = bmdEnv.getGoverningCase(useAbs = False)
+    ind = governing[np.argmax(np.max(bmdEnv.y, axis = 0))]
+    assert bmdEnv.labels[ind] in ['10', '01']
+    assert np.max(bmdEnv.y[1]) > np.max(bmdEnv.y[0])
+
+def test_envelope_matches_patterns():
+    """
+    The direct envelope should match the envelope of every pattern,
+    including the pattern with no live load.
+    """
+    xNodes = [0, 4, 10, 14, 17]
+    member = _getMember(xNodes)
+    wLive, wDead = np.array([-3., -2., -4., -1.]), -1.
+    model = ls.InfluenceModel(member)
+    
+    patterns = ls.getSkipPatterns(4, True)
+    for env, diagrams in zip(model.getPatternEnvelope(wLive, wDead), 
+                             model.getPatternDiagrams(wLive, wDead, patterns)):
+        assert env.labels == ['max', 'min']
+        assert env.y[0] == pytest.approx(diagrams.y.max(0))
+        assert env.y[1] == pytest.approx(diagrams.y.min(0))
+    
+    sfdEnv, bmdEnv = ls.getPatternEnvelope(member, wLive, wDead)
+    assert bmdEnv.y == pytest.approx(env.y)
+
+def test_influence_lines():
+    L = 8
+    member = _getMember([0, L])
+    model = ls.InfluenceModel(member, Nstations = 9)
+    V, M = model.getInfluenceLines([2, 4])
+
+    ind = np.flatnonzero(model.x == 4)[0]
+    assert M[ind] == pytest.approx([-1., -2.])
+
+
+if __name__ == '__main__':
+    test_skip_patterns()
+    test_patterns_match_solver()
+    test_two_span_envelope()
+    test_envelope_matches_patterns()
+    test_influence_lines()
@@ -0,0 +1,117 @@
+"""
+Tests closed form deflections and spans of continuous beams.
+"""
+
+import limitstates as ls
+import numpy as np
+import pytest
+
+def _getTimoshenkoDeflection(EI, GA, w, L, Nspan, Nele):
+    """
+    Finds nodal deflections of a continuous beam using Timoshenko beam 
+    elements with the exact stiffness matrix, which gives exact nodal values.
+    """
+    l = L / Nele
+    Phi = 12*EI / (GA*l**2)
+    k = EI / ((1 + Phi)*l**3) * np.array([
+        [12,    6*l,            -12,    6*l],
+        [6*l,   (4 + Phi)*l**2, -6*l,   (2 - Phi)*l**2],
+        [-12,   -6*l,           12,     -6*l],
+        [6*l,   (2 - Phi)*l**2, -6*l,   (4 + Phi)*l**2]])
+    fe = w*np.array([l/2, l**2/12, l/2, -l**2/12])
+    
+    Nnode = Nspan*Nele + 1
+    K = np.zeros((2*Nnode, 2*Nnode))
+    F = np.zeros(2*Nnode)
+    for ii in range(Nspan*Nele):
+        dofs = slice(2*ii, 2*ii + 4)
+        K[dofs, dofs] += k
+        F[dofs] += fe
+    
+    fixed = 2*np.arange(0, Nnode, Nele)
+    free = np.setdiff1d(np.arange(2*Nnode), fixed)
+    u = np.zeros(2*Nnode)
+    u[free] = np.linalg.solve(K[np.ix_(free, free)], F[free])
+    return u[::2]
+
+def test_support_moments():
+    assert ls.getSupportMoments(1) == pytest.approx([0, 0])
+    assert ls.getSupportMoments(2) == pytest.approx([0, -1/8, 0])
+    assert ls.getSupportMoments(3) == pytest.approx([0, -1/10, -1/10, 0])
+
+def test_support_moments_shear():
+    """
+    Shear deformation reduces the moment at interior supports.
+    """
+    phi = np.array([0., 0.5])
+    m = ls.getSupportMoments(2, phi)
+    assert m.shape == (2, 3)
+    assert m[:, 1] == pytest.approx(-1 / (2*(4 + 2*phi)))
+    
+    m = ls.getSupportMoments(3, 0.5)
+    assert m[1:3] == pytest.approx([-1 / (2*5.5), -1 / (2*5.5)])
+
+def test_timoshenko_multi_span():
+    """
+    Deflections of shear flexible continuous beams should match a finite
+    element solution.
+    """
+    EI, GA, w = 3.6e6, 1.6e7, 1000.
+    Nele = 40
+    for Nspan in [2, 3, 4]:
+        for L in [2., 3., 5.]:
+            uFE = _getTimoshenkoDeflection(EI, GA, w, L, Nspan, Nele)
+            delta = ls.getMaxDeflection(EI, GA, w, L, Nspan, Nele + 1)
+            assert delta == pytest.approx(uFE.max(), rel = 1e-8)
+            
+            Lmax = ls.getMaxDeflectionSpan(EI, GA, w, 360, Nspan, Nele + 1)
+            uFE = _getTimoshenkoDeflection(EI, GA, w, Lmax, Nspan, Nele)
+            assert uFE.max() == pytest.approx(Lmax / 360, rel = 1e-8)
+    
+def test_deflection_coefficients():
+    """
+    Bending deflections should match tabulated beam coefficients.
+    """
+    f, g = ls.getDeflectionShapes(1)
+    assert f.max() == pytest.approx(5/384)
+    assert g.max() == pytest.approx(1/8)
+    
+    f, _ = ls.getDeflectionShapes(2, 1001)
+    assert f.max() == pytest.approx(0.005416, rel = 1e-3)
+    
+def test_simple_span_deflection():
+    EI, GA, w, L = 2e6, 5e6, 3000., np.array([3., 5.])
+    delta = ls.getMaxDeflection(EI, GA, w, L)
+    expected = 5*w*L**4 / (384*EI) + w*L**2 / (8*GA)
+    assert delta == pytest.approx(expected)
+
+def test_span_roundtrip():
+    """
+    The deflection at the maximum span should equal the deflection limit.
+    """
+    EI = np.array([1e6, 5e6])[:, None, None]
+    GA = np.array([7e6, np.inf])[:, None, None]
+    w = np.array([1000., 4000.])[:, None]
+    limits = np.array([180, 360])
+    
+    for Nspan in [1, 2, 3]:
+        L = ls.getMaxDeflectionSpan(EI, GA, w, limits, Nspan)
+        assert L.shape == (2, 2, 2)
+        delta = ls.getMaxDeflection(EI, GA, w, L, Nspan)
+        assert delta == pytest.approx(L / limits)
+
+def test_span_shear_governed():
+    """
+    With very flexible shear, the span should approach the shear only value.
+    """
+    L = ls.getMaxDeflectionSpan(1e12, 1e3, 1000, 360)
+    assert L == pytest.approx(8*1e3 / (1000*360), rel = 1e-6)
+
+if __name__ == '__main__':
+    test_support_moments()
+    test_support_moments_shear()
+    test_timoshenko_multi_span()
+    test_deflection_coefficients()
+    test_simple_span_deflection()
+    test_span_roundtrip()
+    test_span_shear_governed()
@@ -0,0 +1,68 @@
+"""
+Tracks the startup time of limitstates, and checks that heavy optional 
+dependencies are not imported until they are used.
+
+Run this file directly to print the slowest imports.
+"""
+
+import subprocess
+import sys
+
+LAZYMODULES = ['matplotlib', 'planesections', 'pandas']
+
+def getImportTimes(statement:str = 'import limitstates') -> dict[str, int]:
+    """
+    Returns the cumulative import time of each module imported by the 
+    statement, in microseconds, using python -X importtime.
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                            capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+def test_lazy_imports():
+    times = getImportTimes()
+    
+    assert 'limitstates' in times
+    for module in LAZYMODULES:
+        assert module not in times
+
+def test_lazy_imports_design():
+    times = getImportTimes('import limitstates.design.csa.o86.c19, limitstates.design.csa.s16.c24')
+    
+    for module in LAZYMODULES:
+        assert module not in times
+
+def test_lazy_attributes():
+    statement = 'import limitstates as ls; ls.plotSection; ls.convertBeamColumnToPlanesections'
+    times = getImportTimes(statement)
+    
+    assert 'matplotlib' in times
+    assert 'planesections' in times
+
+def test_lazy_namespace():
+    """
+    The modules used for lazy imports should not be exported by star imports.
+    """
+    import limitstates as ls
+    import limitstates.objects.output as output
+    
+    assert not hasattr(ls, 'importlib')
+    assert not hasattr(ls.objects, 'importlib')
+    assert not hasattr(output, 'importlib')
+    
+if __name__ == '__main__':
+    test_lazy_imports()
+    test_lazy_imports_design()
+    test_lazy_attributes()
+    test_lazy_namespace()
+    
+    times = getImportTimes()
+    print(f"import limitstates: {times['limitstates']/1e6:.3f} s")
+    for name, time in sorted(times.items(), key = lambda x: -x[1])[:10]:
+        print(f'{time/1e6:8.3f} s  {name}')
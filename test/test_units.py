@@ -4,6 +4,8 @@ Tests if the unit library is working correctly.
 
 
 from limitstates import ConverterLength, ConverterForce, ConverterStress
+import limitstates as ls
+import numpy as np
 import pytest
 
 def test_convert_length_metric():
@@ -40,9 +42,56 @@ def test_convert_stress_metric():
     assert abs(ffactor / 0.1450377377 - 1) <0.0002
 
 
+def test_convert_same_unit():
+    lconvert = ConverterLength()
+    assert lconvert.getConversionFactor('mm','mm') == 1
+    assert lconvert.getConversionFactor('ft','ft') == 1
+
+def test_notIn_same_unit():
+    with pytest.raises(Exception) as e_info:
+        lconvert = ConverterLength()
+        lfactor = lconvert.getConversionFactor('nothing','nothing')   
+
+def test_factor_table_matches_dict():
+    fconvert = ConverterStress()
+    for unit1 in fconvert.unitDict:
+        for unit2 in fconvert.unitDict:
+            solution = fconvert.unitDict[unit1] / fconvert.unitDict[unit2]
+            factor = fconvert.getConversionFactor(unit1, unit2)
+            assert factor == pytest.approx(solution, rel = 1e-12)
+
+def test_shared_converters():
+    section = ls.SectionRectangle(ls.MaterialElastic(9500), 100, 200)
+    member  = ls.initSimplySupportedMember(5, 'm')
+    assert section.lConverter is ls.lengthConverter
+    assert member.lConverter is ls.lengthConverter
+    assert section.mat.sConverter is ls.stressConverter
+
+def test_convert_array_powers():
+    lconvert = ConverterLength()
+    values = np.array([[1000., 1e6, 1e12],
+                       [2000., 4e6, 16e12]])
+    out = lconvert.convertArray('mm','m', values, [1, 2, 4])
+    
+    assert out[0] == pytest.approx([1, 1, 1])
+    assert out[1] == pytest.approx([2, 4, 16])
+
+def test_unit_array():
+    areas = ls.UnitArray([1, 2], 'in', 2)
+    areasmm = areas.convert('mm')
+    
+    assert areasmm.unit == 'mm'
+    assert areasmm.values[1] == pytest.approx(2*25.4**2)
+    assert np.asarray(areasmm)[0] == pytest.approx(25.4**2)
 
 if __name__ == '__main__':
     test_convert_length_metric()
     test_notIn_length()
     test_convert_force_metric()
-    test_convert_stress_metric()
\ No newline at end of file
+    test_convert_stress_metric()
+    test_convert_same_unit()
+    test_notIn_same_unit()
+    test_factor_table_matches_dict()
+    test_shared_converters()
+    test_convert_array_powers()
+    test_unit_array()
\ No newline at end of file